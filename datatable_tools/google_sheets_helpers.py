@@ -8,9 +8,21 @@ will be deprecated after migration is complete.
 """
 import re
 import asyncio
-from typing import Tuple, Optional, Union, Any
+import codecs
+import hashlib
+import json
+import math
+import random
+from datetime import datetime, timedelta
+from contextlib import aclosing
+from itertools import islice
+from typing import Tuple, Optional, Union, Any, Dict, AsyncIterator, Iterator, Callable, Awaitable
 import logging
 
+from googleapiclient.errors import HttpError
+
+from datatable_tools.models import TableRecords
+
 logger = logging.getLogger(__name__)
 
 # Type checking for optional Polars import
@@ -54,6 +66,644 @@ def parse_google_sheets_uri(uri: str) -> Tuple[str, Optional[str]]:
     return spreadsheet_id, gid
 
 
+# Spreadsheet metadata cache: {cache_key: (metadata, title_index, cached_time)}
+# metadata is the raw spreadsheets().get() response, title_index maps sheet title -> properties
+_metadata_cache: Dict[str, tuple[dict, Dict[str, dict], datetime]] = {}
+_metadata_cache_ttl = timedelta(minutes=5)  # Sheets can be edited by humans too, keep it short
+
+# Field mask for metadata fetches - worksheet properties only, no grid data, named ranges, etc.
+METADATA_FIELDS = 'sheets.properties,properties.title'
+
+
+def _get_credential_key(service) -> Optional[str]:
+    """
+    Derive a stable, non-secret identity for the credentials behind a service object.
+
+    googleapiclient services keep their credentials on service._http.credentials.
+    Only per-user identities qualify: the OAuth refresh token, or a service account's
+    email (plus the impersonated user under domain-wide delegation). A client id is
+    shared by every user of the OAuth app and is never used. The identity is hashed so
+    tokens never end up in cache keys or logs. Returns None when no user can be
+    identified, callers must not cache anything in that case.
+    """
+    credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+    refresh_token = getattr(credentials, 'refresh_token', None)
+    if isinstance(refresh_token, str) and refresh_token:
+        identity = refresh_token
+    else:
+        email = getattr(credentials, 'service_account_email', None)
+        if not isinstance(email, str) or not email:
+            return None
+        subject = getattr(credentials, '_subject', None)
+        identity = f"service-account:{email}:{subject if isinstance(subject, str) else ''}"
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+
+
+def _get_metadata_cache_key(service, spreadsheet_id: str) -> Optional[str]:
+    """Generate a cache key for spreadsheet metadata (None if the service is not cacheable)."""
+    credential_key = _get_credential_key(service)
+    if credential_key is None:
+        return None
+    return f"{credential_key}:{spreadsheet_id}"
+
+
+def _is_metadata_cache_valid(cached_time: datetime) -> bool:
+    """Check if cached metadata is still valid."""
+    return datetime.now() - cached_time < _metadata_cache_ttl
+
+
+def _build_title_index(metadata: dict) -> Dict[str, dict]:
+    """Map worksheet titles to their properties dicts."""
+    return {
+        sheet.get('properties', {}).get('title'): sheet.get('properties', {})
+        for sheet in metadata.get('sheets', [])
+    }
+
+
+def _cache_metadata(cache_key: str, metadata: dict) -> None:
+    """Cache spreadsheet metadata together with its title index."""
+    title_index = _build_title_index(metadata)
+    _metadata_cache[cache_key] = (metadata, title_index, datetime.now())
+    logger.debug(f"Cached spreadsheet metadata for key: {cache_key}")
+
+
+def _get_cached_metadata(cache_key: Optional[str]) -> Optional[tuple[dict, Dict[str, dict]]]:
+    """Retrieve cached metadata and title index if still valid."""
+    if cache_key is not None and cache_key in _metadata_cache:
+        metadata, title_index, cached_time = _metadata_cache[cache_key]
+        if _is_metadata_cache_valid(cached_time):
+            logger.debug(f"Using cached spreadsheet metadata for key: {cache_key}")
+            return metadata, title_index
+        else:
+            # Remove expired cache entry
+            del _metadata_cache[cache_key]
+            logger.debug(f"Removed expired metadata cache entry: {cache_key}")
+    return None
+
+
+async def get_spreadsheet_metadata(service, spreadsheet_id: str, force_refresh: bool = False) -> dict:
+    """
+    Get spreadsheet metadata, served from the per-credential metadata cache when fresh
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        force_refresh: Bypass the cache and re-fetch metadata from the API
+
+    Returns:
+        spreadsheets().get() response dict with 'properties.title' and 'sheets[].properties'
+        (fetched with the METADATA_FIELDS mask)
+
+    Note:
+        The returned dict is shared with the cache and must be treated as read-only.
+        Use update_cached_sheet_properties() after structural writes instead.
+    """
+    cache_key = _get_metadata_cache_key(service, spreadsheet_id)
+
+    if not force_refresh:
+        cached = _get_cached_metadata(cache_key)
+        if cached is not None:
+            return cached[0]
+
+    metadata = await asyncio.to_thread(
+        service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields=METADATA_FIELDS).execute
+    )
+    if cache_key is not None:
+        _cache_metadata(cache_key, metadata)
+    return metadata
+
+
+async def get_sheet_by_title(service, spreadsheet_id: str, title: str) -> Optional[dict]:
+    """
+    Get sheet properties by worksheet title using the metadata cache
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        title: Worksheet title
+
+    Returns:
+        Sheet properties dict, or None if no worksheet has that title
+    """
+    cache_key = _get_metadata_cache_key(service, spreadsheet_id)
+
+    cached = _get_cached_metadata(cache_key)
+    if cached is not None and title in cached[1]:
+        return cached[1][title]
+
+    # Cold cache, or the worksheet was added since metadata was cached
+    metadata = await get_spreadsheet_metadata(service, spreadsheet_id, force_refresh=True)
+    return _build_title_index(metadata).get(title)
+
+
+def invalidate_spreadsheet_metadata(service, spreadsheet_id: str) -> bool:
+    """
+    Drop cached metadata for a spreadsheet (e.g. after adding or removing worksheets)
+
+    Returns:
+        True if an entry was removed
+    """
+    cache_key = _get_metadata_cache_key(service, spreadsheet_id)
+    if cache_key is not None and _metadata_cache.pop(cache_key, None) is not None:
+        logger.debug(f"Invalidated spreadsheet metadata cache entry: {cache_key}")
+        return True
+    return False
+
+
+def update_cached_sheet_properties(
+    service,
+    spreadsheet_id: str,
+    sheet_id: int,
+    row_count: Optional[int] = None,
+    column_count: Optional[int] = None
+) -> bool:
+    """
+    Patch cached gridProperties after a resize we issued ourselves
+
+    Keeps the cache warm instead of forcing a re-fetch on the next call.
+
+    Returns:
+        True if a cached sheet was patched, False if nothing was cached for it
+    """
+    cache_key = _get_metadata_cache_key(service, spreadsheet_id)
+    cached = _get_cached_metadata(cache_key)
+    if cached is None:
+        return False
+
+    for sheet in cached[0].get('sheets', []):
+        properties = sheet.get('properties', {})
+        if properties.get('sheetId') == sheet_id:
+            grid_props = properties.setdefault('gridProperties', {})
+            if row_count is not None:
+                grid_props['rowCount'] = row_count
+            if column_count is not None:
+                grid_props['columnCount'] = column_count
+            logger.debug(f"Patched cached grid for sheet {sheet_id}: {grid_props}")
+            return True
+
+    # Unknown sheet - cache is stale, drop it
+    invalidate_spreadsheet_metadata(service, spreadsheet_id)
+    return False
+
+
+def clear_metadata_cache(spreadsheet_id: Optional[str] = None) -> int:
+    """
+    Clear spreadsheet metadata cache entries.
+
+    Args:
+        spreadsheet_id: If provided, only clear entries for this spreadsheet. If None, clear all.
+
+    Returns:
+        Number of cache entries cleared.
+    """
+    if spreadsheet_id is None:
+        count = len(_metadata_cache)
+        _metadata_cache.clear()
+        logger.info(f"Cleared all {count} metadata cache entries")
+        return count
+
+    keys_to_remove = [key for key in _metadata_cache if key.endswith(f":{spreadsheet_id}")]
+    for key in keys_to_remove:
+        del _metadata_cache[key]
+
+    logger.info(f"Cleared {len(keys_to_remove)} metadata cache entries for spreadsheet {spreadsheet_id}")
+    return len(keys_to_remove)
+
+
+def get_metadata_cache_stats() -> Dict[str, Any]:
+    """Get spreadsheet metadata cache statistics."""
+    valid_entries = 0
+    expired_entries = 0
+
+    for _, (_, _, cached_time) in _metadata_cache.items():
+        if _is_metadata_cache_valid(cached_time):
+            valid_entries += 1
+        else:
+            expired_entries += 1
+
+    return {
+        "total_entries": len(_metadata_cache),
+        "valid_entries": valid_entries,
+        "expired_entries": expired_entries,
+        "cache_ttl_minutes": _metadata_cache_ttl.total_seconds() / 60
+    }
+
+
+# In-flight read coalescing: {(credential_key, spreadsheet_id, range, value_render_option): Future}
+_inflight_reads: Dict[tuple, asyncio.Future] = {}
+_inflight_stats = {"requests": 0, "coalesced": 0}
+
+
+def _get_service_key(service) -> str:
+    """Credential identity for in-flight coalescing (object identity is safe while a request is in flight)."""
+    return _get_credential_key(service) or f"service-{id(service)}"
+
+
+def _copy_value_range(result: dict) -> dict:
+    """Give each waiter its own rows - callers pad/truncate rows in place."""
+    if 'values' not in result:
+        return dict(result)
+    return {**result, 'values': [list(row) for row in result['values']]}
+
+
+def _forget_inflight_read(key: tuple, future: asyncio.Future) -> None:
+    """Done callback: drop the in-flight entry and mark any exception as retrieved."""
+    if _inflight_reads.get(key) is future:
+        del _inflight_reads[key]
+    if not future.cancelled():
+        future.exception()
+
+
+async def get_sheet_values(
+    service,
+    spreadsheet_id: str,
+    range_name: str,
+    value_render_option: str = 'FORMATTED_VALUE'
+) -> dict:
+    """
+    Read values with single-flight coalescing of identical concurrent requests
+
+    Concurrent calls for the same (credential, spreadsheet_id, range, value_render_option)
+    share one values().get round trip. Each caller receives its own copy of the rows.
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        range_name: Range in A1 notation including the sheet name (e.g. "'Sheet1'!A1:Z1000")
+        value_render_option: FORMATTED_VALUE, UNFORMATTED_VALUE or FORMULA
+
+    Returns:
+        values().get() response dict ('range', 'majorDimension', 'values')
+    """
+    key = (_get_service_key(service), spreadsheet_id, range_name, value_render_option)
+    loop = asyncio.get_running_loop()
+    _inflight_stats["requests"] += 1
+
+    future = _inflight_reads.get(key)
+    if future is not None and future.get_loop() is loop:
+        _inflight_stats["coalesced"] += 1
+        logger.debug(f"Joining in-flight read for {range_name} ({value_render_option})")
+    else:
+        future = asyncio.ensure_future(asyncio.to_thread(
+            service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueRenderOption=value_render_option
+            ).execute
+        ))
+        _inflight_reads[key] = future
+        future.add_done_callback(lambda f, key=key: _forget_inflight_read(key, f))
+
+    # Shield so one cancelled caller does not cancel the read for everyone else
+    result = await asyncio.shield(future)
+    return _copy_value_range(result)
+
+
+def mark_spreadsheet_modified(service, spreadsheet_id: str) -> None:
+    """
+    Call right before writing to a spreadsheet.
+
+    Reads issued after this point must not join reads that started before the write,
+    so in-flight entries for the spreadsheet are detached (they still complete for
+    their current waiters). Cached sheet profiles, header rows and read-cache entries
+    for the spreadsheet are dropped.
+    """
+    keys_to_remove = [key for key in _inflight_reads if key[1] == spreadsheet_id]
+    for key in keys_to_remove:
+        del _inflight_reads[key]
+    clear_sheet_profile_cache(spreadsheet_id)
+    clear_header_cache(spreadsheet_id)
+    clear_value_cache(spreadsheet_id)
+
+
+def get_inflight_read_stats() -> Dict[str, Any]:
+    """Get single-flight read statistics."""
+    return {
+        "inflight_reads": len(_inflight_reads),
+        "total_requests": _inflight_stats["requests"],
+        "coalesced_requests": _inflight_stats["coalesced"]
+    }
+
+
+# Append coalescing: {(credential_key, spreadsheet_id, sheet_id, insert_data_option): _AppendBatch}
+# Appends to one worksheet arriving within APPEND_COALESCE_WINDOW seconds are sent as one
+# values().append; a batch stops taking rows once it holds about WRITE_REQUEST_BYTES.
+APPEND_COALESCE_WINDOW = 0.05
+_append_batches: Dict[tuple, "_AppendBatch"] = {}
+_append_tails: Dict[tuple, asyncio.Task] = {}  # Last flush per worksheet, batches are sent in order
+_append_stats = {"appends": 0, "batches": 0}
+
+
+class _AppendBatch:
+    """Rows of the appends collected for one worksheet, flushed by a single task."""
+
+    def __init__(self):
+        self.rows: list[list] = []
+        self.bytes = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+async def coalesce_append(
+    service,
+    key: tuple,
+    values: list[list],
+    send: Callable[[list[list]], Awaitable[dict]],
+    window: float = APPEND_COALESCE_WINDOW
+) -> Tuple[dict, int]:
+    """
+    Join an append to the worksheet's open batch, or open one
+
+    The first append for a key starts a flush task that waits window seconds, then calls
+    send() once with the rows of every append that joined, in arrival order. Batches for
+    the same key are sent one after another, so rows never interleave or overtake.
+
+    Args:
+        service: Google Sheets API service object
+        key: (spreadsheet_id, sheet_id, insert_data_option) - rows of one key go in one request
+        values: Rows to append
+        send: Coroutine function writing the merged rows, returning the values().append response
+        window: Seconds to wait for more appends
+
+    Returns:
+        (append response for the merged rows, offset of this call's first row within them)
+
+    Raises:
+        Whatever send() raised, for every append in the batch
+    """
+    key = (_get_service_key(service),) + tuple(key)
+    _append_stats["appends"] += 1
+
+    batch = _append_batches.get(key)
+    if batch is None or batch.task.get_loop() is not asyncio.get_running_loop():
+        batch = _AppendBatch()
+        previous = _append_tails.get(key)
+
+        async def flush() -> dict:
+            await asyncio.sleep(window)
+            if _append_batches.get(key) is batch:
+                del _append_batches[key]
+            if previous is not None and previous.get_loop() is asyncio.get_running_loop():
+                await asyncio.wait([previous])
+            _append_stats["batches"] += 1
+            logger.info(f"Sending {len(batch.rows)} coalesced rows for {key[1]}")
+            return await send(batch.rows)
+
+        batch.task = asyncio.ensure_future(flush())
+        batch.task.add_done_callback(lambda task, key=key: _forget_append_flush(key, task))
+        _append_batches[key] = batch
+        _append_tails[key] = batch.task
+
+    offset = len(batch.rows)
+    batch.rows.extend(values)
+    batch.bytes += sum(map(estimate_row_bytes, values))
+    if batch.bytes >= WRITE_REQUEST_BYTES and _append_batches.get(key) is batch:
+        # Full - later appends open the next batch
+        del _append_batches[key]
+
+    # Shield so one cancelled caller does not cancel the write for everyone else
+    result = await asyncio.shield(batch.task)
+    return result, offset
+
+
+def _forget_append_flush(key: tuple, task: asyncio.Task) -> None:
+    """Done callback: drop the worksheet's tail entry and mark any exception as retrieved."""
+    if _append_tails.get(key) is task:
+        del _append_tails[key]
+    if not task.cancelled():
+        task.exception()
+
+
+def get_append_coalesce_stats() -> Dict[str, Any]:
+    """Get append coalescing statistics."""
+    return {
+        "open_batches": len(_append_batches),
+        "total_appends": _append_stats["appends"],
+        "total_batches": _append_stats["batches"]
+    }
+
+
+# Version-validated read cache: {(credential_key, spreadsheet_id, range, render_option): (result, version, cached_time)}
+# An entry is only served after Drive confirms the file version is unchanged, the TTL just
+# bounds how long unused entries hold memory. Drive versions can trail an edit by a few
+# seconds, so reads that must observe a just-made external edit should bypass the cache.
+# The first read of a range only leaves a (None, None, time) marker, so one-off reads never
+# wait on Drive; a repeat read fetches the version and caches the result.
+_value_cache: Dict[tuple, tuple[Optional[dict], Optional[tuple], datetime]] = {}
+_value_cache_ttl = timedelta(minutes=10)
+VALUE_CACHE_MAX_ENTRIES = 32
+_value_cache_stats = {"hits": 0, "misses": 0, "stale": 0}
+
+# Drive clients built from Sheets credentials (least recently used first), and credentials
+# Drive refused with 403 (e.g. no Drive scope)
+_drive_services: Dict[str, Any] = {}
+DRIVE_SERVICE_MAX_ENTRIES = 8
+_drive_unavailable: set = set()
+
+
+async def _get_drive_service(service, credential_key: str):
+    """Drive v3 client sharing the credentials of a Sheets service (built once per credential)."""
+    drive_service = _drive_services.pop(credential_key, None)
+    if drive_service is None:
+        from googleapiclient.discovery import build
+        # build() parses the discovery document - keep it off the event loop
+        drive_service = await asyncio.to_thread(
+            build, 'drive', 'v3', credentials=service._http.credentials, cache_discovery=False
+        )
+        if len(_drive_services) >= DRIVE_SERVICE_MAX_ENTRIES:
+            del _drive_services[next(iter(_drive_services))]
+    _drive_services[credential_key] = drive_service
+    return drive_service
+
+
+async def _get_file_version(service, credential_key: str, spreadsheet_id: str) -> Optional[tuple]:
+    """(version, modifiedTime) of the spreadsheet file, or None if Drive cannot be asked."""
+    if credential_key in _drive_unavailable:
+        return None
+    try:
+        drive_service = await _get_drive_service(service, credential_key)
+        result = await asyncio.to_thread(
+            drive_service.files().get(
+                fileId=spreadsheet_id,
+                fields='version,modifiedTime',
+                supportsAllDrives=True
+            ).execute
+        )
+    except HttpError as e:
+        if e.resp.status != 403:
+            logger.warning(f"Read cache bypassed, Drive version lookup failed: {e}")
+            return None
+        # Sheets-only token without Drive scope (or Drive API off) - stop asking for this credential
+        logger.info(f"Read cache disabled for this credential, Drive access denied: {e}")
+        _drive_unavailable.add(credential_key)
+        return None
+    except Exception as e:
+        # Timeouts, connection errors: skip the cache for this read only
+        logger.warning(f"Read cache bypassed, Drive version lookup failed: {e}")
+        return None
+    return result.get('version'), result.get('modifiedTime')
+
+
+def _store_cache_entry(key: tuple, result: Optional[dict], version: Optional[tuple]) -> None:
+    if key not in _value_cache and len(_value_cache) >= VALUE_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order - drop the oldest entry
+        del _value_cache[next(iter(_value_cache))]
+    _value_cache[key] = (result, version, datetime.now())
+
+
+async def get_cached_sheet_values(
+    service,
+    spreadsheet_id: str,
+    range_name: str,
+    value_render_option: str = 'FORMATTED_VALUE'
+) -> dict:
+    """
+    Read values through the version-validated read cache
+
+    A cached values().get result is reused only after a Drive files().get(fields='version,modifiedTime')
+    confirms the spreadsheet has not changed since it was read. The version is fetched before
+    the values, so an edit landing in between makes the entry stale rather than wrong.
+    Drive is only asked once a range is read again: the first read just marks the range,
+    the second caches it, later ones can be served from memory.
+    Falls back to a plain get_sheet_values() read when the service has no credentials to
+    key on or Drive is not accessible.
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        range_name: Range in A1 notation including the sheet name
+        value_render_option: FORMATTED_VALUE, UNFORMATTED_VALUE or FORMULA
+
+    Returns:
+        values().get() response dict ('range', 'majorDimension', 'values')
+    """
+    credential_key = _get_credential_key(service)
+    if credential_key is None or credential_key in _drive_unavailable:
+        return await get_sheet_values(service, spreadsheet_id, range_name, value_render_option)
+
+    key = (credential_key, spreadsheet_id, range_name, value_render_option)
+    cached = _value_cache.get(key)
+    if cached is None:
+        _value_cache_stats["misses"] += 1
+        _store_cache_entry(key, None, None)
+        return await get_sheet_values(service, spreadsheet_id, range_name, value_render_option)
+
+    version = await _get_file_version(service, credential_key, spreadsheet_id)
+    if version is None:
+        return await get_sheet_values(service, spreadsheet_id, range_name, value_render_option)
+
+    result, cached_version, cached_time = cached
+    if result is not None:
+        if cached_version == version and datetime.now() - cached_time < _value_cache_ttl:
+            _value_cache_stats["hits"] += 1
+            logger.debug(f"Read cache hit for {range_name} ({value_render_option})")
+            return _copy_value_range(result)
+        _value_cache_stats["stale"] += 1
+
+    _value_cache_stats["misses"] += 1
+    result = await get_sheet_values(service, spreadsheet_id, range_name, value_render_option)
+    _store_cache_entry(key, _copy_value_range(result), version)
+    return result
+
+
+def clear_value_cache(spreadsheet_id: Optional[str] = None) -> int:
+    """
+    Clear version-validated read cache entries.
+
+    Args:
+        spreadsheet_id: If provided, only clear entries for this spreadsheet. If None, clear all.
+
+    Returns:
+        Number of cache entries cleared.
+    """
+    if spreadsheet_id is None:
+        count = len(_value_cache)
+        _value_cache.clear()
+        _drive_unavailable.clear()
+        return count
+
+    keys_to_remove = [key for key in _value_cache if key[1] == spreadsheet_id]
+    for key in keys_to_remove:
+        del _value_cache[key]
+    return len(keys_to_remove)
+
+
+def get_value_cache_stats() -> Dict[str, Any]:
+    """Get version-validated read cache statistics."""
+    return {
+        "entries": len(_value_cache),
+        "hits": _value_cache_stats["hits"],
+        "misses": _value_cache_stats["misses"],
+        "stale": _value_cache_stats["stale"]
+    }
+
+
+# Field mask for reading formulas and formatted values together - cell values only, no formats/notes
+DUAL_RENDER_FIELDS = 'sheets(properties.sheetId,data(startRow,startColumn,rowData.values(userEnteredValue,formattedValue)))'
+
+
+def _user_entered_value(cell: dict) -> Any:
+    """What values().get(valueRenderOption='FORMULA') reports for a CellData: the formula or the raw value."""
+    entered = cell.get('userEnteredValue')
+    if not entered:
+        return ""
+    for kind in ('formulaValue', 'stringValue', 'numberValue', 'boolValue'):
+        if kind in entered:
+            return entered[kind]
+    return ""
+
+
+async def get_formula_and_formatted_values(
+    service,
+    spreadsheet_id: str,
+    range_name: str
+) -> Tuple[list, list]:
+    """
+    Read a range rendered both as FORMULA and as FORMATTED_VALUE in one round trip
+
+    Uses spreadsheets().get(includeGridData=True) with a field mask on userEnteredValue and
+    formattedValue instead of two values().get calls. The two grids are aligned cell by cell:
+    trailing cells and rows are trimmed only where both renderings are empty.
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        range_name: Range in A1 notation including the sheet name, starting at A1
+
+    Returns:
+        (formula_rows, formatted_rows)
+    """
+    result = await asyncio.to_thread(
+        service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            ranges=[range_name],
+            includeGridData=True,
+            fields=DUAL_RENDER_FIELDS
+        ).execute
+    )
+
+    grid_data = next(
+        (data for sheet in result.get('sheets', []) for data in sheet.get('data', [])), {}
+    )
+    formula_rows = []
+    formatted_rows = []
+    for row_data in grid_data.get('rowData', []):
+        formulas = []
+        formatted = []
+        for cell in row_data.get('values', []):
+            formulas.append(_user_entered_value(cell))
+            formatted.append(cell.get('formattedValue', ""))
+        while formatted and formatted[-1] == "" and formulas[-1] == "":
+            formulas.pop()
+            formatted.pop()
+        formula_rows.append(formulas)
+        formatted_rows.append(formatted)
+
+    while formatted_rows and not formatted_rows[-1]:
+        formula_rows.pop()
+        formatted_rows.pop()
+    return formula_rows, formatted_rows
+
+
 async def get_sheet_by_gid(service, spreadsheet_id: str, gid: Optional[str]) -> dict:
     """
     Get sheet properties by gid or return first sheet if gid not provided
@@ -73,9 +723,20 @@ async def get_sheet_by_gid(service, spreadsheet_id: str, gid: Optional[str]) ->
         properties = await get_sheet_by_gid(service, "ABC123", "456")
         print(properties['title'])  # "Sheet1"
     """
-    metadata = await asyncio.to_thread(
-        service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-    )
+    _, properties = await _select_sheet(service, spreadsheet_id, gid)
+    return properties
+
+
+async def _select_sheet(service, spreadsheet_id: str, gid: Optional[str]) -> Tuple[dict, dict]:
+    """
+    Fetch (cached) metadata and pick the worksheet for gid, falling back to the first sheet
+
+    Returns:
+        (metadata, sheet_properties)
+    """
+    cache_key = _get_metadata_cache_key(service, spreadsheet_id)
+    from_cache = _get_cached_metadata(cache_key) is not None
+    metadata = await get_spreadsheet_metadata(service, spreadsheet_id)
 
     sheets = metadata.get('sheets', [])
     if not sheets:
@@ -83,16 +744,122 @@ async def get_sheet_by_gid(service, spreadsheet_id: str, gid: Optional[str]) ->
 
     # If gid provided, find matching sheet
     if gid:
-        for sheet in sheets:
-            properties = sheet.get('properties', {})
-            if properties.get('sheetId') == int(gid):
-                return properties
+        properties = _find_sheet_properties_by_id(sheets, int(gid))
+        if properties is None and from_cache:
+            # Cached metadata may predate the worksheet, re-fetch once before falling back
+            metadata = await get_spreadsheet_metadata(service, spreadsheet_id, force_refresh=True)
+            sheets = metadata.get('sheets', []) or sheets
+            properties = _find_sheet_properties_by_id(sheets, int(gid))
+        if properties is not None:
+            return metadata, properties
         # If gid not found, fall back to first sheet
         logger.warning(f"Sheet gid {gid} not found, falling back to first sheet")
-        return sheets[0]['properties']
+        return metadata, sheets[0]['properties']
 
     # No gid provided, return first sheet
-    return sheets[0]['properties']
+    return metadata, sheets[0]['properties']
+
+
+def _find_sheet_properties_by_id(sheets: list, sheet_id: int) -> Optional[dict]:
+    """Find sheet properties by sheetId in a spreadsheets().get() 'sheets' list."""
+    for sheet in sheets:
+        properties = sheet.get('properties', {})
+        if properties.get('sheetId') == sheet_id:
+            return properties
+    return None
+
+
+class SheetContext:
+    """
+    Resolved spreadsheet and worksheet metadata for one tool invocation
+
+    Built once by resolve_sheet_context() and passed down to nested operations
+    (load_data_table, update_range, append_rows, parse_range_address, ...) so
+    they never have to call spreadsheets().get() again.
+
+    Example:
+        ctx = await resolve_sheet_context(service, uri)
+        print(ctx.title, ctx.sheet_id, ctx.grid_row_count)
+    """
+
+    def __init__(self, spreadsheet_id: str, gid: Optional[str], metadata: dict, properties: dict):
+        self.spreadsheet_id = spreadsheet_id
+        self.gid = gid
+        self.metadata = metadata
+        self.properties = properties
+
+    @property
+    def title(self) -> str:
+        return self.properties['title']
+
+    @property
+    def sheet_id(self) -> int:
+        return self.properties['sheetId']
+
+    @property
+    def spreadsheet_title(self) -> str:
+        return self.metadata.get('properties', {}).get('title', 'Untitled')
+
+    @property
+    def grid_row_count(self) -> int:
+        return self.properties.get('gridProperties', {}).get('rowCount', 1000)
+
+    @property
+    def grid_column_count(self) -> int:
+        return self.properties.get('gridProperties', {}).get('columnCount', 26)
+
+    @property
+    def worksheet_url(self) -> str:
+        return f"https://docs.google.com/spreadsheets/d/{self.spreadsheet_id}/edit#gid={self.sheet_id}"
+
+    def matches(self, uri: str) -> bool:
+        """Check whether this context was resolved for the same spreadsheet and worksheet as uri."""
+        try:
+            spreadsheet_id, gid = parse_google_sheets_uri(uri)
+        except ValueError:
+            return False
+        return spreadsheet_id == self.spreadsheet_id and gid == self.gid
+
+    def get_sheet_by_title(self, title: str) -> Optional[dict]:
+        """Find properties of another worksheet in the same spreadsheet by title."""
+        for sheet in self.metadata.get('sheets', []):
+            properties = sheet.get('properties', {})
+            if properties.get('title') == title:
+                return properties
+        return None
+
+    def update_grid(
+        self,
+        service,
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None
+    ) -> None:
+        """Record a resize we issued ourselves, in this context and in the metadata cache."""
+        grid_props = self.properties.setdefault('gridProperties', {})
+        if row_count is not None:
+            grid_props['rowCount'] = row_count
+        if column_count is not None:
+            grid_props['columnCount'] = column_count
+        update_cached_sheet_properties(
+            service, self.spreadsheet_id, self.sheet_id,
+            row_count=row_count, column_count=column_count
+        )
+
+
+async def resolve_sheet_context(service, uri: str) -> SheetContext:
+    """
+    Resolve a Google Sheets URI into a SheetContext with at most one metadata fetch
+
+    Args:
+        service: Google Sheets API service object
+        uri: Google Sheets URL
+
+    Returns:
+        SheetContext for the worksheet identified by the URI's gid (or the first sheet)
+    """
+    spreadsheet_id, gid = parse_google_sheets_uri(uri)
+    metadata, properties = await _select_sheet(service, spreadsheet_id, gid)
+    return SheetContext(spreadsheet_id, gid, metadata, properties)
 
 
 def serialize_cell_value(value: Any) -> Any:
@@ -659,6 +1426,11 @@ def process_data_input(data: Union[list, str, Any]) -> Tuple[Optional[list[str]]
         >>> rows
         [['Alice', 30, 'New York']]
     """
+    # Records read by load_data_table (in-process callers passing a response back in)
+    if isinstance(data, TableRecords):
+        width = len(data.headers)
+        return list(data.headers), [row[:width] + [""] * (width - len(row)) for row in data.rows]
+
     # NEW: Handle Polars DataFrame string representation (from MCP serialization)
     if isinstance(data, str):
         # Check if it looks like a Polars DataFrame string
@@ -719,29 +1491,116 @@ def process_data_input(data: Union[list, str, Any]) -> Tuple[Optional[list[str]]
     return None, data
 
 
-async def parse_range_address(
-    service,
-    spreadsheet_id: str,
-    range_address: Optional[str],
+# Upper bound used for open-ended row ranges when the grid size is unknown (Sheets max is 10M cells)
+MAX_GRID_ROWS = 10_000_000
+
+
+def quote_sheet_title(sheet_title: str) -> str:
+    """
+    Quote a worksheet title for A1 notation, escaping single quotes
+
+    Example:
+        >>> quote_sheet_title("Bob's Sheet")
+        "'Bob''s Sheet'"
+    """
+    escaped_title = sheet_title.replace("'", "''")
+    return f"'{escaped_title}'"
+
+
+def plan_sheet_range(
     sheet_title: str,
-    sheet_id: int
-) -> Tuple[str, str, int]:
+    grid_properties: Optional[dict] = None,
+    start_row: int = 1,
+    end_row: Optional[int] = None,
+    start_col: int = 0,
+    end_col: Optional[int] = None
+) -> str:
     """
-    Parse range_address to handle worksheet!range format.
+    Build a read range bounded by the worksheet's real grid instead of a fixed A:ZZ
 
-    This function handles cases where range_address includes a worksheet name
-    (e.g., "Sheet1!A1:D10") by parsing it and validating the worksheet exists.
+    Full-width reads never use gridProperties: the whole sheet is just the sheet name and
+    a row window is row-only notation ('Sheet1'!1:6), both resolved by the API against
+    the grid as it is at read time. Cached gridProperties can be minutes old, and a sheet
+    that grew outside this server would otherwise lose its new rows or columns. Column
+    windows are clipped to gridProperties (rowCount/columnCount, e.g. from SheetContext
+    or the metadata cache) when given.
 
     Args:
-        service: Authenticated Google Sheets API service object
-        spreadsheet_id: The spreadsheet ID
-        range_address: Optional range in A1 notation, may include worksheet name
-                      (e.g., "A2:M1000", "Sheet1!A1:D10", "'My Sheet'!B:Z")
-        sheet_title: Default sheet title from URI (used as fallback)
-        sheet_id: Default sheet ID from URI (used as fallback)
+        sheet_title: Worksheet title
+        grid_properties: Sheet 'gridProperties' dict (optional)
+        start_row: 1-based first row (default: 1)
+        end_row: 1-based last row, clipped to the grid (default: last grid row)
+        start_col: 0-based first column (default: 0 = A)
+        end_col: 0-based last column, clipped to the grid (default: last grid column)
 
     Returns:
-        Tuple of (range_name, final_sheet_title, final_sheet_id):
+        Range in A1 notation including the quoted sheet title
+
+    Examples:
+        >>> plan_sheet_range("Sheet1", {"rowCount": 1000, "columnCount": 26})
+        "'Sheet1'"
+
+        >>> plan_sheet_range("Sheet1", {"rowCount": 1000, "columnCount": 26}, end_row=6)
+        "'Sheet1'!1:6"
+
+        >>> plan_sheet_range("Wide", {"rowCount": 50, "columnCount": 1000}, end_row=6, start_col=2, end_col=999)
+        "'Wide'!C1:ALL6"
+
+        >>> plan_sheet_range("Sheet1")
+        "'Sheet1'"
+    """
+    quoted_title = quote_sheet_title(sheet_title)
+    if start_col == 0 and end_col is None:
+        if start_row == 1 and end_row is None:
+            return quoted_title
+        return f"{quoted_title}!{start_row}:{end_row or MAX_GRID_ROWS}"
+
+    row_count = (grid_properties or {}).get('rowCount')
+    column_count = (grid_properties or {}).get('columnCount')
+
+    if row_count and column_count:
+        last_row = min(end_row, row_count) if end_row else row_count
+        last_col = min(end_col, column_count - 1) if end_col is not None else column_count - 1
+        return (
+            f"{quoted_title}!{column_index_to_letter(start_col)}{start_row}:"
+            f"{column_index_to_letter(last_col)}{last_row}"
+        )
+
+    # Grid size unknown - let the API bound the range
+    if end_col is not None:
+        last_row = end_row or MAX_GRID_ROWS
+        return (
+            f"{quoted_title}!{column_index_to_letter(start_col)}{start_row}:"
+            f"{column_index_to_letter(end_col)}{last_row}"
+        )
+    return f"{quoted_title}!{start_row}:{end_row or MAX_GRID_ROWS}"
+
+
+async def parse_range_address(
+    service,
+    spreadsheet_id: str,
+    range_address: Optional[str],
+    sheet_title: str,
+    sheet_id: int,
+    sheet_context: Optional[SheetContext] = None
+) -> Tuple[str, str, int]:
+    """
+    Parse range_address to handle worksheet!range format.
+
+    This function handles cases where range_address includes a worksheet name
+    (e.g., "Sheet1!A1:D10") by parsing it and validating the worksheet exists.
+
+    Args:
+        service: Authenticated Google Sheets API service object
+        spreadsheet_id: The spreadsheet ID
+        range_address: Optional range in A1 notation, may include worksheet name
+                      (e.g., "A2:M1000", "Sheet1!A1:D10", "'My Sheet'!B:Z")
+        sheet_title: Default sheet title from URI (used as fallback)
+        sheet_id: Default sheet ID from URI (used as fallback)
+        sheet_context: Already resolved SheetContext, used instead of fetching metadata
+
+    Returns:
+        Tuple of (range_name, final_sheet_title, final_sheet_id):
             - range_name: Full range notation for API call (e.g., "'Sheet1'!A1:D10")
             - final_sheet_title: The sheet title to use (either parsed or default)
             - final_sheet_id: The sheet ID to use (either parsed or default)
@@ -756,8 +1615,11 @@ async def parse_range_address(
         ("'DefaultSheet'!A:D", "DefaultSheet", 0)
     """
     if not range_address:
-        # No range specified, use default full sheet
-        return f"'{sheet_title}'!A:ZZ", sheet_title, sheet_id
+        # No range specified, read the sheet's actual grid
+        grid_properties = None
+        if sheet_context is not None and sheet_context.sheet_id == sheet_id:
+            grid_properties = sheet_context.properties.get('gridProperties')
+        return plan_sheet_range(sheet_title, grid_properties), sheet_title, sheet_id
 
     # Parse worksheet name from range_address if present (e.g., "Sheet1!A1:J6")
     final_range = range_address
@@ -771,19 +1633,14 @@ async def parse_range_address(
 
         # Validate if worksheet exists and use it if found
         try:
-            metadata = await asyncio.to_thread(
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-            )
-            sheets = metadata.get('sheets', [])
-            found = False
-            for sheet in sheets:
-                if sheet.get('properties', {}).get('title') == worksheet_from_range:
-                    final_sheet_title = worksheet_from_range
-                    final_sheet_id = sheet.get('properties', {}).get('sheetId')
-                    found = True
-                    break
-
-            if not found:
+            if sheet_context is not None and sheet_context.spreadsheet_id == spreadsheet_id:
+                properties = sheet_context.get_sheet_by_title(worksheet_from_range)
+            else:
+                properties = await get_sheet_by_title(service, spreadsheet_id, worksheet_from_range)
+            if properties is not None:
+                final_sheet_title = worksheet_from_range
+                final_sheet_id = properties.get('sheetId')
+            else:
                 logger.warning(
                     f"Worksheet '{worksheet_from_range}' from range_address not found. "
                     f"Falling back to worksheet from URI: '{sheet_title}'."
@@ -801,16 +1658,797 @@ async def parse_range_address(
     return range_name, final_sheet_title, final_sheet_id
 
 
+# Chunked reads: row windows sized so each response stays around READ_CHUNK_BYTES
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+ESTIMATED_CELL_BYTES = 32  # JSON-encoded cell incl. quotes and separators, typical text
+READ_CHUNK_CONCURRENCY = 4
+
+
+def plan_row_chunks(
+    start_row: int,
+    end_row: int,
+    column_count: int,
+    byte_budget: int = READ_CHUNK_BYTES
+) -> list[Tuple[int, int]]:
+    """
+    Split rows start_row..end_row (1-based, inclusive) into windows of about byte_budget each
+
+    Returns:
+        List of (first_row, last_row) tuples covering the rows in order
+
+    Example:
+        >>> plan_row_chunks(1, 10, 4, byte_budget=4 * 4 * ESTIMATED_CELL_BYTES)
+        [(1, 4), (5, 8), (9, 10)]
+    """
+    rows_per_chunk = max(1, byte_budget // (max(column_count, 1) * ESTIMATED_CELL_BYTES))
+    return [
+        (first, min(first + rows_per_chunk - 1, end_row))
+        for first in range(start_row, end_row + 1, rows_per_chunk)
+    ]
+
+
+def needs_chunked_read(grid_properties: Optional[dict], byte_budget: int = READ_CHUNK_BYTES) -> bool:
+    """Whether a whole-grid read is expected to exceed one chunk's byte budget."""
+    row_count = (grid_properties or {}).get('rowCount') or 0
+    column_count = (grid_properties or {}).get('columnCount') or 0
+    return row_count * column_count * ESTIMATED_CELL_BYTES > byte_budget
+
+
+# Sampled previews: rows per contiguous window and the supported sampling modes
+SAMPLE_WINDOW_ROWS = 5
+SAMPLE_MODES = ('random', 'stratified')
+
+
+def plan_sample_windows(
+    first_row: int,
+    last_row: int,
+    sample_rows: int,
+    mode: str = 'stratified',
+    window_rows: int = SAMPLE_WINDOW_ROWS,
+    seed: Optional[int] = None
+) -> list[Tuple[int, int]]:
+    """
+    Pick row windows (1-based, inclusive) holding about sample_rows rows of first_row..last_row
+
+    Contiguous windows keep neighbouring rows together (useful for spotting formula
+    patterns) while spreading the sample over the whole range.
+
+    Args:
+        first_row: First row that may be sampled
+        last_row: Last row that may be sampled
+        sample_rows: Number of rows wanted
+        mode: 'stratified' - one window at a random offset inside each of equal-sized strata,
+              'random' - windows at random, non-overlapping positions
+        window_rows: Rows per window
+        seed: Seed for reproducible samples (optional)
+
+    Returns:
+        Sorted, non-overlapping (first_row, last_row) windows; the whole range when it is
+        no larger than sample_rows
+
+    Example:
+        >>> plan_sample_windows(2, 200001, 10, seed=1)
+        [(17613, 17617), (174608, 174612)]
+    """
+    if mode not in SAMPLE_MODES:
+        raise ValueError(f"Unknown sample mode '{mode}'. Supported: {', '.join(SAMPLE_MODES)}")
+    total = last_row - first_row + 1
+    if total <= 0 or sample_rows <= 0:
+        return []
+    if total <= sample_rows:
+        return [(first_row, last_row)]
+
+    rng = random.Random(seed)
+    window_rows = max(1, min(window_rows, sample_rows))
+    count = -(-sample_rows // window_rows)
+    sizes = [window_rows] * (count - 1) + [sample_rows - window_rows * (count - 1)]
+
+    if mode == 'random':
+        slots = range(first_row, last_row - window_rows + 2, window_rows)
+        starts = sorted(rng.sample(slots, min(count, len(slots))))
+        return [(start, min(start + size - 1, last_row)) for start, size in zip(starts, sizes)]
+
+    windows = []
+    for i, size in enumerate(sizes):
+        low = first_row + (i * total) // count
+        high = first_row + ((i + 1) * total) // count - 1
+        start = rng.randint(low, max(low, high - size + 1))
+        windows.append((start, min(start + size - 1, high)))
+    return windows
+
+
+# Streamed reads: rows are decoded from the raw response body this many at a time,
+# converting the body to text STREAM_DECODE_BYTES at a time
+STREAM_BATCH_ROWS = 1000
+STREAM_DECODE_BYTES = 64 * 1024
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_VALUES_ARRAY = re.compile(r'(?<!\\)"values"[ \t\n\r]*:[ \t\n\r]*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _raw_body(resp, content) -> bytes:
+    """HttpRequest postproc that returns the response body without decoding it."""
+    return content
+
+
+def raw_request(request):
+    """
+    Make request.execute() return the raw JSON body (bytes) instead of a parsed dict
+
+    Used with iter_json_value_rows() so large values responses are never materialized
+    as one object tree.
+    """
+    request.postproc = _raw_body
+    return request
+
+
+def _decoded_pieces(body: Union[bytes, str], piece_bytes: int) -> Iterator[str]:
+    """UTF-8 text of body, piece_bytes of it at a time (str bodies are passed through)."""
+    if isinstance(body, str):
+        yield body
+        return
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    view = memoryview(body)
+    for start in range(0, len(view), piece_bytes):
+        yield decoder.decode(view[start:start + piece_bytes])
+    yield decoder.decode(b'', final=True)
+
+
+def iter_json_value_rows(body: Union[bytes, str], piece_bytes: int = STREAM_DECODE_BYTES) -> Iterator[list]:
+    """
+    Decode the rows of a values response body one at a time
+
+    Finds the first "values" array (ValueRange.values, or valueRanges[0].values for a
+    batchGet) and decodes it row by row. A bytes body is converted to text piece_bytes
+    at a time, and text already decoded into rows is dropped, so besides the body only
+    about one piece of text and the current row's objects are alive. A response without
+    values yields nothing.
+
+    Example:
+        >>> list(iter_json_value_rows(b'{"range": "A1:B2", "values": [["a", "b"], ["1"]]}'))
+        [['a', 'b'], ['1']]
+    """
+    pieces = _decoded_pieces(body, piece_bytes)
+    text = next(pieces, '')
+    while True:
+        match = _VALUES_ARRAY.search(text)
+        if match is not None:
+            break
+        piece = next(pieces, None)
+        if piece is None:
+            return
+        text = text[-64:] + piece  # Keep enough to match a key split across pieces
+    pos = match.end()
+    while True:
+        pos = _JSON_WHITESPACE.match(text, pos).end()
+        if pos == len(text):
+            piece = next(pieces, None)
+            if piece is None:
+                return
+            text, pos = piece, 0
+            continue
+        if text[pos] == ']':
+            return
+        if text[pos] == ',':
+            pos += 1
+            continue
+        try:
+            row, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            # The row continues in the next piece (or the body is malformed)
+            piece = next(pieces, None)
+            if piece is None:
+                raise
+            text, pos = text[pos:] + piece, 0
+            continue
+        pos = end
+        yield row
+
+
+async def iter_streamed_rows(body: Union[bytes, str], batch_rows: int = STREAM_BATCH_ROWS) -> AsyncIterator[list]:
+    """
+    Yield the rows of a raw values response body in batches of up to batch_rows
+
+    Decoding runs in a worker thread, one batch at a time, so the caller can filter or
+    convert each batch before the next one is built.
+    """
+    rows = iter_json_value_rows(body)
+    while True:
+        batch = await asyncio.to_thread(list, islice(rows, batch_rows))
+        if not batch:
+            return
+        yield batch
+
+
+async def iter_sheet_value_chunks(
+    service,
+    spreadsheet_id: str,
+    sheet_title: str,
+    grid_properties: dict,
+    value_render_option: str = 'FORMATTED_VALUE',
+    byte_budget: int = READ_CHUNK_BYTES,
+    max_concurrency: int = READ_CHUNK_CONCURRENCY,
+    stream: bool = False
+) -> AsyncIterator[list[list]]:
+    """
+    Read a whole worksheet as byte-budgeted row windows, yielding rows in sheet order
+
+    Up to max_concurrency values().batchGet requests are in flight at once; results are
+    yielded strictly in order, and the next window is only requested once an earlier one
+    has been handed to the caller, so memory stays bounded by the in-flight windows.
+
+    Windows are planned from the data bounds found by probe_data_bounds(), not from the
+    grid size, so a mostly empty grid costs a few probes instead of one request per window.
+    When the data reaches the last row of grid_properties (which may be stale), windows
+    past it keep being read until one comes back empty.
+
+    Concatenating the yielded chunks gives exactly what a single values().get over the
+    grid returns: empty rows between data are kept as [], trailing empty rows are dropped.
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        sheet_title: Worksheet title
+        grid_properties: Sheet gridProperties (rowCount/columnCount)
+        value_render_option: FORMATTED_VALUE, UNFORMATTED_VALUE or FORMULA
+        byte_budget: Approximate response size per window
+        max_concurrency: Maximum concurrent requests
+        stream: Keep each window as its raw response body and decode it in batches of
+            STREAM_BATCH_ROWS rows (see iter_json_value_rows), instead of parsing the
+            whole window into one object tree up front
+
+    Yields:
+        Non-empty lists of rows
+    """
+    row_count = grid_properties['rowCount']
+    data_rows, data_columns = await probe_data_bounds(service, spreadsheet_id, sheet_title, grid_properties)
+    if not data_rows:
+        return
+    windows = plan_row_chunks(1, data_rows, data_columns, byte_budget)
+    rows_per_window = windows[0][1] - windows[0][0] + 1
+    planned = len(windows)
+    logger.info(f"Reading '{sheet_title}' in {planned} chunks ({max_concurrency} concurrent)")
+
+    def fetch(first_row: int, last_row: int) -> asyncio.Future:
+        range_name = plan_sheet_range(sheet_title, grid_properties, start_row=first_row, end_row=last_row)
+        request = service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=[range_name],
+            valueRenderOption=value_render_option
+        )
+        if stream:
+            raw_request(request)
+        return asyncio.ensure_future(asyncio.to_thread(request.execute))
+
+    pending = [fetch(*window) for window in windows[:max_concurrency]]
+    blank_rows = 0  # Empty rows seen since the last yielded row
+    try:
+        index = 0
+        while index < len(windows):
+            first_row, last_row = windows[index]
+            result = await pending[index]
+            pending[index] = None  # Release the response as soon as it is consumed
+            if index + max_concurrency < len(windows):
+                pending.append(fetch(*windows[index + max_concurrency]))
+
+            window_rows = 0
+            if stream:
+                async with aclosing(iter_streamed_rows(result)) as batches:
+                    async for rows in batches:
+                        yield [[] for _ in range(blank_rows)] + rows if blank_rows else rows
+                        blank_rows = 0
+                        window_rows += len(rows)
+            else:
+                value_ranges = result.get('valueRanges', [])
+                rows = value_ranges[0].get('values', []) if value_ranges else []
+                if rows:
+                    yield [[] for _ in range(blank_rows)] + rows
+                    blank_rows = 0
+                window_rows = len(rows)
+            blank_rows += (last_row - first_row + 1) - window_rows
+
+            # Data up to the cached grid end may continue in rows added since it was cached
+            is_last = index == len(windows) - 1
+            if is_last and data_rows >= row_count and (index == planned - 1 or window_rows):
+                windows.append((last_row + 1, last_row + rows_per_window))
+                pending.append(fetch(*windows[-1]))
+            index += 1
+    finally:
+        for future in pending:
+            if future is not None and not future.done():
+                future.cancel()
+
+
+# Chunked writes: values().batchUpdate requests of about WRITE_REQUEST_BYTES (the API's
+# recommended maximum payload), each carrying several ValueRanges of up to WRITE_RANGE_BYTES
+WRITE_REQUEST_BYTES = 2 * 1024 * 1024
+WRITE_RANGE_BYTES = 512 * 1024
+WRITE_CONCURRENCY = 4
+
+
+def estimate_row_bytes(row: list) -> int:
+    """Approximate JSON size of one row of cell values: text plus quotes and separators."""
+    return sum(len(str(cell)) for cell in row) + 3 * len(row) + 2
+
+
+def plan_write_requests(
+    sheet_title: str,
+    blocks: list[Tuple[int, int, list]],
+    request_bytes: int = WRITE_REQUEST_BYTES,
+    range_bytes: int = WRITE_RANGE_BYTES
+) -> list[list[dict]]:
+    """
+    Pack blocks of rows into values().batchUpdate payloads of about request_bytes each
+
+    Each block is (start_row, start_col, rows) with a 1-based row and 0-based column.
+    Blocks are cut into row slices of at most range_bytes (a single larger row stays
+    whole), and slices are packed in order into requests of at most request_bytes.
+
+    Returns:
+        One list of ValueRange dicts ({'range', 'values'}) per request
+
+    Example:
+        >>> requests = plan_write_requests("S", [(1, 0, [["a", "b"]] * 4)], request_bytes=20, range_bytes=15)
+        >>> [[value_range['range'] for value_range in data] for data in requests]
+        [["'S'!A1:B1", "'S'!A2:B2"], ["'S'!A3:B3", "'S'!A4:B4"]]
+    """
+    quoted_title = quote_sheet_title(sheet_title)
+    slices = []  # (value_range, estimated_bytes)
+    for start_row, start_col, rows in blocks:
+        if not rows:
+            continue
+        width = max(max(len(row) for row in rows), 1)
+        first_col = column_index_to_letter(start_col)
+        last_col = column_index_to_letter(start_col + width - 1)
+
+        def add_slice(first: int, end: int, size: int) -> None:
+            range_name = f"{quoted_title}!{first_col}{start_row + first}:{last_col}{start_row + end - 1}"
+            slices.append(({'range': range_name, 'values': rows[first:end]}, size))
+
+        first, size = 0, 0
+        for index, row in enumerate(rows):
+            row_bytes = estimate_row_bytes(row)
+            if index > first and size + row_bytes > range_bytes:
+                add_slice(first, index, size)
+                first, size = index, 0
+            size += row_bytes
+        add_slice(first, len(rows), size)
+
+    requests = []
+    used = 0
+    for value_range, size in slices:
+        if requests and used + size <= request_bytes:
+            requests[-1].append(value_range)
+            used += size
+        else:
+            requests.append([value_range])
+            used = size
+    return requests
+
+
+# Display text of a number: sign, optional "$", digits with optional thousands commas, decimals, "%"
+_DISPLAY_NUMBER_RE = re.compile(r'([-+]?)\$?((?:\d{1,3}(?:,\d{3})+|\d+)?(?:\.\d+)?)(%?)')
+
+
+def _display_round_trips(text: str, current: Any) -> bool:
+    """
+    Whether display text parses back to exactly the cell's entered number/boolean
+
+    Display text is rounded or abbreviated by the cell format ("0.12" for 0.123456), and
+    a formula's display is only its result, so matching it alone would skip real writes.
+
+    Example:
+        >>> [_display_round_trips(t, v) for t, v in (("50%", 0.5), ("1,000", 1000), ("0.12", 0.123456), ("10", "=SUM(C:C)"))]
+        [True, True, False, False]
+    """
+    if isinstance(current, bool):
+        return text.upper() == str(current).upper()
+    if not isinstance(current, (int, float)):
+        return False
+    match = _DISPLAY_NUMBER_RE.fullmatch(text)
+    if not match or not any(ch.isdigit() for ch in match.group(2)):
+        return False
+    sign, digits, percent = match.groups()
+    return float(f"{sign}{digits.replace(',', '')}{'e-2' if percent else ''}") == current
+
+
+def plan_changed_blocks(
+    values: list[list],
+    current_values: list[list],
+    current_formatted: Optional[list[list]] = None
+) -> Tuple[list[Tuple[int, int, list]], int]:
+    """
+    Find the cells of values that differ from the current contents, as contiguous rectangles
+
+    A number/boolean cell is unchanged when the current cell holds the same typed value.
+    A text cell is unchanged when it equals the current cell's entered value (formula
+    text, or str() of a number/boolean), or - when current_formatted is given, i.e. for
+    USER_ENTERED writes - its display text, so "50%" or "1,000" match what they parse to.
+    Display text only counts when it parses back to exactly the entered number/boolean:
+    never over a formula, and not when the format rounds ("0.12" over 0.123456).
+    Runs of changed cells in a row that span the same columns as a run in the row above
+    are merged into one rectangle.
+
+    Args:
+        values: New rows (text, numbers or booleans), positioned at the window origin
+        current_values: Current entered values of the window (FORMULA rendering)
+        current_formatted: Current display text of the window (optional)
+
+    Returns:
+        (blocks, skipped_cells) where blocks are (row_offset, col_offset, rows), 0-based
+        relative to the window origin
+
+    Example:
+        >>> plan_changed_blocks([["a", "b", "c"], ["d", "x", "y"]], [["a", "B", "C"], ["d", 1, 2]])
+        ([(0, 1, [['b', 'c'], ['x', 'y']])], 2)
+    """
+    blocks = []
+    skipped_cells = 0
+    open_runs = {}  # (first_col, end_col) -> index of the block that ended in the row above
+
+    for r, row in enumerate(values):
+        current_row = current_values[r] if r < len(current_values) else []
+        formatted_row = (current_formatted[r] if r < len(current_formatted) else []) if current_formatted is not None else None
+        changed = []
+        for c, value in enumerate(row):
+            current = current_row[c] if c < len(current_row) else ""
+            if isinstance(value, str):
+                unchanged = value == ("" if current is None else str(current)) or (
+                    formatted_row is not None and not value.startswith('=')
+                    and value == (formatted_row[c] if c < len(formatted_row) else "")
+                    and _display_round_trips(value, current)
+                )
+            else:
+                # Typed number/boolean: equal stored value of the same kind (True is not 1)
+                unchanged = isinstance(current, bool) == isinstance(value, bool) and value == current
+            changed.append(not unchanged)
+            skipped_cells += unchanged
+
+        next_runs = {}
+        c = 0
+        while c < len(row):
+            if not changed[c]:
+                c += 1
+                continue
+            first = c
+            while c < len(row) and changed[c]:
+                c += 1
+            index = open_runs.get((first, c))
+            if index is None:
+                blocks.append((r, first, [row[first:c]]))
+                index = len(blocks) - 1
+            else:
+                blocks[index][2].append(row[first:c])
+            next_runs[(first, c)] = index
+        open_runs = next_runs
+
+    return blocks, skipped_cells
+
+
+async def write_value_ranges(
+    service,
+    spreadsheet_id: str,
+    requests: list[list[dict]],
+    value_input_option: str = 'USER_ENTERED',
+    max_concurrency: int = WRITE_CONCURRENCY
+) -> int:
+    """
+    Send planned values().batchUpdate payloads with at most max_concurrency in flight
+
+    The payloads write disjoint ranges, so they may complete in any order. On the first
+    failure the remaining requests are cancelled and the error is raised; requests that
+    already completed stay written.
+
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Spreadsheet ID
+        requests: Payloads from plan_write_requests()
+        value_input_option: RAW or USER_ENTERED
+        max_concurrency: Maximum concurrent requests
+
+    Returns:
+        Total number of updated cells reported by the API
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(data: list[dict]) -> int:
+        async with semaphore:
+            result = await asyncio.to_thread(
+                service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={'valueInputOption': value_input_option, 'data': data}
+                ).execute
+            )
+            return result.get('totalUpdatedCells', 0)
+
+    logger.info(f"Writing {sum(len(data) for data in requests)} ranges in {len(requests)} requests ({max_concurrency} concurrent)")
+    mark_spreadsheet_modified(service, spreadsheet_id)
+    tasks = [asyncio.ensure_future(send(data)) for data in requests]
+    try:
+        return sum(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def encode_cell_data(value: Any) -> dict:
+    """
+    CellData for one value written through updateCells/appendCells
+
+    Values keep their type instead of being re-parsed by the API: numbers become
+    numberValue, booleans boolValue, text starting with "=" formulaValue and other text
+    stringValue. None and "" give an empty CellData, which clears the cell.
+
+    Example:
+        >>> [encode_cell_data(v) for v in (1.5, True, "=A1*2", "x", None)]
+        [{'userEnteredValue': {'numberValue': 1.5}}, {'userEnteredValue': {'boolValue': True}}, \
+{'userEnteredValue': {'formulaValue': '=A1*2'}}, {'userEnteredValue': {'stringValue': 'x'}}, {}]
+    """
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return {'userEnteredValue': {'numberValue': value}}
+    text = str(value)
+    if text.startswith('='):
+        return {'userEnteredValue': {'formulaValue': text}}
+    return {'userEnteredValue': {'stringValue': text}}
+
+
+def encode_row_data(rows: list[list]) -> list[dict]:
+    """RowData list for updateCells/appendCells requests (see encode_cell_data)."""
+    return [{'values': [encode_cell_data(value) for value in row]} for row in rows]
+
+
+def encode_write_value(value: Any) -> Any:
+    """
+    JSON value for one cell of a values().update/append/batchUpdate body
+
+    Booleans and finite numbers are sent as JSON booleans/numbers, so the API stores them
+    as typed without parsing their text: no locale-dependent decimal separators, no
+    precision lost to str(), and shorter payloads. None becomes "" and everything else is
+    sent as text, which USER_ENTERED still parses like typed input (formulas, dates, "50%").
+
+    Example:
+        >>> [encode_write_value(v) for v in (3, 0.1, True, float("nan"), None, "=A1")]
+        [3, 0.1, True, 'nan', '', '=A1']
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool) or (isinstance(value, (int, float)) and math.isfinite(value)):
+        return value
+    return str(value)
+
+
+def encode_write_row(row: list) -> list:
+    """Row of values().* cells (see encode_write_value)."""
+    return [encode_write_value(value) for value in row]
+
+
+# Boundary probing: rows per probe window and windows per narrowing round
+PROBE_BLOCK_ROWS = 16
+PROBE_FANOUT = 8
+
+
+def _is_blank(cell: Any) -> bool:
+    """A cell counts as empty when it is missing or whitespace-only."""
+    return not str(cell).strip()
+
+
+def _last_non_blank(cells: list) -> int:
+    """1-based position of the last non-blank entry (0 if all blank)."""
+    for idx in range(len(cells) - 1, -1, -1):
+        if not _is_blank(cells[idx]):
+            return idx + 1
+    return 0
+
+
+def _values_extent(values: list, major_dimension: str = 'ROWS') -> Tuple[int, int]:
+    """
+    Number of rows and columns up to the last non-blank cell of a values() payload.
+
+    Returns:
+        (rows, columns), both 0 for an empty payload
+    """
+    outer = 0
+    inner = 0
+    for idx, line in enumerate(values):
+        last = _last_non_blank(line)
+        if last:
+            outer = idx + 1
+            inner = max(inner, last)
+    return (outer, inner) if major_dimension == 'ROWS' else (inner, outer)
+
+
+def _range_start(echoed_range: str) -> Tuple[int, int]:
+    """
+    Top-left cell of a range echoed by the API, as (1-based row, 0-based column).
+
+    Example:
+        >>> _range_start("'Sheet1'!C5:F20")
+        (5, 2)
+    """
+    a1 = echoed_range.rsplit('!', 1)[-1].split(':', 1)[0]
+    match = re.match(r'^([A-Za-z]*)(\d*)$', a1)
+    if not match:
+        return 1, 0
+    letters, digits = match.groups()
+    return (int(digits) if digits else 1), (column_letter_to_index(letters) if letters else 0)
+
+
+def leading_rows_range(range_name: str, row_count: int) -> Optional[str]:
+    """
+    The first row_count rows of an A1 range, same columns, or None if it cannot be parsed.
+
+    Example:
+        >>> leading_rows_range("'Sheet1'!B3:F100", 5)
+        "'Sheet1'!B3:F7"
+        >>> leading_rows_range("'Sheet1'!A:C", 5)
+        "'Sheet1'!A1:C5"
+    """
+    sheet, separator, a1 = range_name.rpartition('!')
+    if not separator:
+        return f"{range_name}!1:{row_count}"
+    start, _, end = a1.partition(':')
+    start_match = re.fullmatch(r'([A-Za-z]*)(\d*)', start)
+    end_match = re.fullmatch(r'([A-Za-z]*)(\d*)', end or start)
+    if not start_match or not end_match or not (start or end):
+        return None
+    start_col, start_row = start_match.groups()
+    end_col, end_row = end_match.groups()
+    first_row = int(start_row) if start_row else 1
+    last_row = first_row + row_count - 1
+    if end_row:
+        last_row = min(last_row, int(end_row))
+    return f"{sheet}!{start_col}{first_row}:{end_col}{last_row}"
+
+
+async def _batch_get_extents(
+    service,
+    spreadsheet_id: str,
+    ranges: list[str],
+    major_dimension: str = 'ROWS'
+) -> list[Tuple[int, int, int, int]]:
+    """
+    Read several small ranges in one values().batchGet call.
+
+    Returns:
+        One (start_row, start_col, rows, columns) tuple per range, where start comes from
+        the range echoed by the API and rows/columns are the extent of non-blank data.
+    """
+    result = await asyncio.to_thread(
+        service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            valueRenderOption="FORMATTED_VALUE",
+            majorDimension=major_dimension
+        ).execute
+    )
+    extents = []
+    for requested, value_range in zip(ranges, result.get('valueRanges', [])):
+        start_row, start_col = _range_start(value_range.get('range', requested))
+        rows, columns = _values_extent(value_range.get('values', []), major_dimension)
+        extents.append((start_row, start_col, rows, columns))
+    return extents
+
+
+async def probe_data_bounds(
+    service,
+    spreadsheet_id: str,
+    sheet_title: str,
+    grid_properties: Optional[dict] = None,
+    start_col: int = 0,
+    end_col: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Find the last row and last column containing data by probing small windows
+
+    Instead of downloading the whole grid, reads a handful of PROBE_BLOCK_ROWS-row windows:
+    1. Exponential probes (rows 1, 17, 49, 113, ...) in one batchGet locate the data end roughly
+    2. k-ary narrowing rounds (PROBE_FANOUT windows per batchGet) shrink the gap
+    3. One final batchGet reads everything below the last known data row and right of the
+       last known data column. Those regions are empty (or nearly so) and cost almost no
+       transfer, which also makes the result exact even for sheets with gaps.
+
+    Args:
+        service: Authenticated Google Sheets API service object
+        spreadsheet_id: The spreadsheet ID
+        sheet_title: The worksheet title/name
+        grid_properties: Sheet gridProperties (looked up from the metadata cache if omitted)
+        start_col: 0-based first column to consider (default: 0)
+        end_col: 0-based last column to consider (default: last grid column)
+
+    Returns:
+        (last_row, last_column): 1-based row and column numbers of the data boundary,
+        (0, 0) when the area is empty
+    """
+    if grid_properties is None:
+        properties = await get_sheet_by_title(service, spreadsheet_id, sheet_title)
+        grid_properties = (properties or {}).get('gridProperties')
+
+    row_count = (grid_properties or {}).get('rowCount')
+    column_count = (grid_properties or {}).get('columnCount')
+    if not row_count or not column_count:
+        # Unknown grid - single bounded read of the whole sheet
+        range_name = plan_sheet_range(sheet_title, start_col=start_col, end_col=end_col)
+        result = await get_sheet_values(service, spreadsheet_id, range_name, "FORMATTED_VALUE")
+        rows, columns = _values_extent(result.get('values', []))
+        start_row, first_col = _range_start(result.get('range', range_name))
+        return (start_row - 1 + rows if rows else 0), (first_col + columns if columns else 0)
+
+    end_col = column_count - 1 if end_col is None else min(end_col, column_count - 1)
+
+    def window(first_row: int, last_row: int, first_col: int = start_col) -> str:
+        return plan_sheet_range(
+            sheet_title, grid_properties,
+            start_row=first_row, end_row=last_row, start_col=first_col, end_col=end_col
+        )
+
+    # Phase 1: exponential probes (one round trip)
+    starts = []
+    offset = 0
+    while 1 + offset <= row_count:
+        starts.append(1 + offset)
+        offset = offset * 2 + PROBE_BLOCK_ROWS
+    extents = await _batch_get_extents(
+        service, spreadsheet_id, [window(s, s + PROBE_BLOCK_ROWS - 1) for s in starts]
+    )
+
+    last_row = 0           # Last row known to contain data
+    last_col = 0           # Last column (1-based) known to contain data
+    upper = row_count + 1  # First row of an empty window after last_row
+    for idx, (start_row, first_col, rows, columns) in enumerate(extents):
+        if rows:
+            last_row = start_row - 1 + rows
+            last_col = max(last_col, first_col + columns)
+            upper = starts[idx + 1] if idx + 1 < len(starts) else row_count + 1
+
+    # Phase 2: k-ary narrowing between last_row and upper (assumes mostly contiguous data)
+    while last_row and upper - last_row > PROBE_BLOCK_ROWS * PROBE_FANOUT:
+        step = (upper - last_row) // (PROBE_FANOUT + 1)
+        round_starts = [last_row + 1 + step * i for i in range(1, PROBE_FANOUT + 1)]
+        extents = await _batch_get_extents(
+            service, spreadsheet_id, [window(s, s + PROBE_BLOCK_ROWS - 1) for s in round_starts]
+        )
+        new_upper = round_starts[0]
+        for idx, (start_row, first_col, rows, columns) in enumerate(extents):
+            if rows:
+                last_row = start_row - 1 + rows
+                last_col = max(last_col, first_col + columns)
+                new_upper = round_starts[idx + 1] if idx + 1 < len(round_starts) else upper
+        upper = new_upper
+
+    # Phase 3: exact answer from the (nearly) empty remainder, read column-major so
+    # empty rows and columns are trimmed away by the API
+    final_ranges = []
+    if last_row < row_count:
+        final_ranges.append(window(last_row + 1, row_count))
+    if last_col <= end_col:
+        final_ranges.append(window(1, row_count, first_col=max(last_col, start_col)))
+    if final_ranges:
+        extents = await _batch_get_extents(service, spreadsheet_id, final_ranges, major_dimension='COLUMNS')
+        for start_row, first_col, rows, columns in extents:
+            if rows:
+                last_row = max(last_row, start_row - 1 + rows)
+                last_col = max(last_col, first_col + columns)
+
+    return last_row, last_col
+
+
 async def get_last_row_with_data(
     service,
     spreadsheet_id: str,
     sheet_title: str,
-    column: Optional[str] = None
+    column: Optional[str] = None,
+    grid_properties: Optional[dict] = None
 ) -> int:
     """
     Find the last row containing any non-empty data in a worksheet.
 
-    Scans the entire worksheet from top to bottom to find the last row
+    Probes the worksheet in small windows (see probe_data_bounds) to find the last row
     with at least one non-empty cell. Optionally can search in a specific column only.
 
     Args:
@@ -818,6 +2456,7 @@ async def get_last_row_with_data(
         spreadsheet_id: The spreadsheet ID
         sheet_title: The worksheet title/name
         column: Optional column letter (e.g., "B", "AA") to search in specific column only
+        grid_properties: Sheet gridProperties used to plan the probes (optional)
 
     Returns:
         int: 1-based row number of last row with data (returns 0 for empty sheet/column)
@@ -834,59 +2473,47 @@ async def get_last_row_with_data(
         Last row in column B: 4
     """
     try:
-        # Escape sheet title for range notation
-        if ' ' in sheet_title or '!' in sheet_title or "'" in sheet_title:
-            escaped_title = sheet_title.replace("'", "''")
-            if column:
-                range_name = f"'{escaped_title}'!{column}:{column}"
-            else:
-                range_name = f"'{escaped_title}'!A:ZZ"
-        else:
-            if column:
-                range_name = f"{sheet_title}!{column}:{column}"
-            else:
-                range_name = f"{sheet_title}!A:ZZ"
-
-        # Get all values from the worksheet (or specific column)
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption="FORMATTED_VALUE"
-            ).execute
-        )
-
-        values = result.get('values', [])
-
-        if not values:
-            return 0
-
         if column:
-            # For single column, scan from bottom to top to find last non-empty cell
-            for row_idx in range(len(values) - 1, -1, -1):
-                row = values[row_idx]
-                # Check if this cell is non-empty
-                if row and str(row[0]).strip():
-                    return row_idx + 1  # Convert to 1-based
+            column_index = column_letter_to_index(column)
+            last_row, _ = await probe_data_bounds(
+                service, spreadsheet_id, sheet_title, grid_properties,
+                start_col=column_index, end_col=column_index
+            )
         else:
-            # For all columns, scan from bottom to top to find last non-empty row
-            for row_idx in range(len(values) - 1, -1, -1):
-                row = values[row_idx]
-                # Check if row has any non-empty cell
-                if any(str(cell).strip() for cell in row):
-                    return row_idx + 1  # Convert to 1-based
+            last_row, _ = await probe_data_bounds(service, spreadsheet_id, sheet_title, grid_properties)
 
-        return 0  # All rows are empty
+        return last_row
 
     except Exception as e:
         logger.error(f"Error getting last row: {e}")
         raise
 
 
+def used_range_from_bounds(last_row: int, last_column: int) -> tuple[str, int, int, str, str]:
+    """
+    Used range tuple (as returned by get_used_range_info) for data ending at last_row/last_column
+
+    The range always starts at A1, so row_count/column_count equal the 1-based bounds.
+    Callers holding bounds from elsewhere (e.g. a cached sheet profile) go through this
+    too, so every source reports the same start cell.
+
+    Example:
+        >>> used_range_from_bounds(10, 3)
+        ('A1:C10', 10, 3, 'A1', 'C10')
+        >>> used_range_from_bounds(0, 0)
+        ('A1:A1', 0, 0, 'A1', 'A1')
+    """
+    if last_row == 0 or last_column == 0:
+        return "A1:A1", 0, 0, "A1", "A1"
+    end_cell = f"{column_index_to_letter(last_column - 1)}{last_row}"
+    return f"A1:{end_cell}", last_row, last_column, "A1", end_cell
+
+
 async def get_used_range_info(
     service,
     spreadsheet_id: str,
-    sheet_title: str
+    sheet_title: str,
+    grid_properties: Optional[dict] = None
 ) -> tuple[str, int, int, str, str]:
     """
     Auto-detect the minimal rectangular range containing all non-empty cells.
@@ -897,6 +2524,7 @@ async def get_used_range_info(
         service: Authenticated Google Sheets API service object
         spreadsheet_id: The spreadsheet ID
         sheet_title: The worksheet title/name
+        grid_properties: Sheet gridProperties used to plan the probes (optional)
 
     Returns:
         Tuple of (used_range, row_count, column_count, start_cell, end_cell):
@@ -912,48 +2540,8 @@ async def get_used_range_info(
         Used range: A1:C10, 10x3
     """
     try:
-        # Escape sheet title for range notation
-        if ' ' in sheet_title or '!' in sheet_title or "'" in sheet_title:
-            escaped_title = sheet_title.replace("'", "''")
-            range_name = f"'{escaped_title}'!A:ZZ"
-        else:
-            range_name = f"{sheet_title}!A:ZZ"
-
-        # Get all values from the worksheet
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption="FORMATTED_VALUE"
-            ).execute
-        )
-
-        values = result.get('values', [])
-
-        if not values:
-            return "A1:A1", 0, 0, "A1", "A1"
-
-        # Find last row and column with data
-        last_row = 0
-        last_col = 0
-
-        for row_idx, row in enumerate(values):
-            for col_idx, cell in enumerate(row):
-                if str(cell).strip():
-                    last_row = max(last_row, row_idx + 1)
-                    last_col = max(last_col, col_idx + 1)
-
-        if last_row == 0 or last_col == 0:
-            return "A1:A1", 0, 0, "A1", "A1"
-
-        # Convert column index to letter
-        end_col_letter = column_index_to_letter(last_col - 1)
-
-        used_range = f"A1:{end_col_letter}{last_row}"
-        start_cell = "A1"
-        end_cell = f"{end_col_letter}{last_row}"
-
-        return used_range, last_row, last_col, start_cell, end_cell
+        last_row, last_col = await probe_data_bounds(service, spreadsheet_id, sheet_title, grid_properties)
+        return used_range_from_bounds(last_row, last_col)
 
     except Exception as e:
         logger.error(f"Error getting used range: {e}")
@@ -963,18 +2551,20 @@ async def get_used_range_info(
 async def get_last_column_with_data(
     service,
     spreadsheet_id: str,
-    sheet_title: str
+    sheet_title: str,
+    grid_properties: Optional[dict] = None
 ) -> tuple[str, int]:
     """
     Find the rightmost column containing any non-empty data in a worksheet.
 
-    Scans the entire worksheet to find the last column with at least one
-    non-empty cell.
+    Probes the worksheet in small windows (see probe_data_bounds) to find the last
+    column with at least one non-empty cell.
 
     Args:
         service: Authenticated Google Sheets API service object
         spreadsheet_id: The spreadsheet ID
         sheet_title: The worksheet title/name
+        grid_properties: Sheet gridProperties used to plan the probes (optional)
 
     Returns:
         Tuple of (column_letter, column_index):
@@ -987,35 +2577,12 @@ async def get_last_column_with_data(
         Last column: Z (index 25)
     """
     try:
-        # Escape sheet title for range notation
-        if ' ' in sheet_title or '!' in sheet_title or "'" in sheet_title:
-            escaped_title = sheet_title.replace("'", "''")
-            range_name = f"'{escaped_title}'!A:ZZ"
-        else:
-            range_name = f"{sheet_title}!A:ZZ"
+        _, last_col = await probe_data_bounds(service, spreadsheet_id, sheet_title, grid_properties)
 
-        # Get all values from the worksheet
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption="FORMATTED_VALUE"
-            ).execute
-        )
-
-        values = result.get('values', [])
-
-        if not values:
+        if last_col == 0:
             return "A", 0
 
-        # Find last column with data
-        last_col_index = 0
-
-        for row in values:
-            for col_idx, cell in enumerate(row):
-                if str(cell).strip():
-                    last_col_index = max(last_col_index, col_idx)
-
+        last_col_index = last_col - 1
         last_col_letter = column_index_to_letter(last_col_index)
 
         return last_col_letter, last_col_index
@@ -1023,3 +2590,495 @@ async def get_last_column_with_data(
     except Exception as e:
         logger.error(f"Error getting last column: {e}")
         raise
+
+
+# Sheet profile cache: {cache_key: (profile, cached_time)}, cache_key = "credential:spreadsheet_id:sheet_id"
+_profile_cache: Dict[str, tuple[dict, datetime]] = {}
+_profile_cache_ttl = timedelta(seconds=60)  # Content changes more often than metadata
+
+
+def build_sheet_profile(values: list[list], formula_values: Optional[list[list]] = None) -> dict:
+    """
+    Summarize worksheet contents read with valueRenderOption=FORMATTED_VALUE.
+
+    Cells are empty when missing or whitespace-only, judged on the display text exactly
+    like the boundary helpers (probe_data_bounds), so a formula that renders "" is not
+    data. Formula counts come from the FORMULA rendering of the same range.
+
+    Args:
+        values: 2D array of display values starting at A1
+        formula_values: The same range rendered as FORMULA (defaults to values)
+
+    Returns:
+        Dict with last_row, last_column (1-based, 0 when empty), header_row (1-based,
+        0 if none detected), headers and columns - one entry per column up to last_column
+        with column letter, header, non_empty_count, formula_count and last_row
+    """
+    last_row = 0
+    columns: list[dict] = []
+    for row_idx, row in enumerate(values):
+        for col_idx, cell in enumerate(row):
+            if _is_blank(cell):
+                continue
+            while len(columns) <= col_idx:
+                columns.append({'non_empty_count': 0, 'formula_count': 0, 'last_row': 0})
+            column = columns[col_idx]
+            column['non_empty_count'] += 1
+            column['last_row'] = row_idx + 1
+            last_row = row_idx + 1
+
+    # Formulas are counted in the profiled columns, including ones that render ""
+    for row in (values if formula_values is None else formula_values):
+        for col_idx, cell in enumerate(row[:len(columns)]):
+            if isinstance(cell, str) and cell.startswith('='):
+                columns[col_idx]['formula_count'] += 1
+
+    # Trailing all-empty rows never reach here, leading ones are handled by detect_header_row
+    header_idx, headers, _ = detect_header_row(values[:last_row]) if last_row else (0, [], [])
+    headers = headers[:len(columns)] + [""] * (len(columns) - len(headers))
+
+    for col_idx, column in enumerate(columns):
+        column['column'] = column_index_to_letter(col_idx)
+        column['header'] = headers[col_idx] if headers else ""
+
+    return {
+        'last_row': last_row,
+        'last_column': len(columns),
+        'header_row': header_idx + 1 if any(headers) else 0,
+        'headers': headers if any(headers) else [],
+        'columns': columns
+    }
+
+
+def _get_profile_cache_key(service, spreadsheet_id: str, sheet_id: int) -> Optional[str]:
+    """Generate a cache key for a sheet profile (None if the service is not cacheable)."""
+    metadata_key = _get_metadata_cache_key(service, spreadsheet_id)
+    if metadata_key is None:
+        return None
+    return f"{metadata_key}:{sheet_id}"
+
+
+def cache_sheet_profile(service, spreadsheet_id: str, sheet_id: int, profile: dict) -> None:
+    """Remember a freshly computed sheet profile."""
+    cache_key = _get_profile_cache_key(service, spreadsheet_id, sheet_id)
+    if cache_key is not None:
+        _profile_cache[cache_key] = (profile, datetime.now())
+        logger.debug(f"Cached sheet profile for key: {cache_key}")
+
+
+def get_cached_sheet_profile(service, spreadsheet_id: str, sheet_id: int) -> Optional[dict]:
+    """Return the cached profile for a worksheet if it is still fresh."""
+    cache_key = _get_profile_cache_key(service, spreadsheet_id, sheet_id)
+    if cache_key is None or cache_key not in _profile_cache:
+        return None
+    profile, cached_time = _profile_cache[cache_key]
+    if datetime.now() - cached_time < _profile_cache_ttl:
+        logger.debug(f"Using cached sheet profile for key: {cache_key}")
+        return profile
+    del _profile_cache[cache_key]
+    return None
+
+
+def clear_sheet_profile_cache(spreadsheet_id: Optional[str] = None) -> int:
+    """
+    Clear cached sheet profiles.
+
+    Args:
+        spreadsheet_id: If provided, only clear entries for this spreadsheet. If None, clear all.
+
+    Returns:
+        Number of cache entries cleared.
+    """
+    if spreadsheet_id is None:
+        count = len(_profile_cache)
+        _profile_cache.clear()
+        return count
+
+    keys_to_remove = [key for key in _profile_cache if key.split(':')[1] == spreadsheet_id]
+    for key in keys_to_remove:
+        del _profile_cache[key]
+    return len(keys_to_remove)
+
+
+def profile_last_row(profile: dict, column: Optional[str] = None) -> int:
+    """Last row with data from a sheet profile, optionally for one column letter."""
+    if not column:
+        return profile['last_row']
+    col_idx = column_letter_to_index(column)
+    columns = profile['columns']
+    return columns[col_idx]['last_row'] if col_idx < len(columns) else 0
+
+
+# Header sample cache: {cache_key: (rows, cached_time)}, cache_key = "credential:spreadsheet_id:sheet_id"
+# Holds the first HEADER_SAMPLE_ROWS rows - all detect_header_row() looks at
+HEADER_SAMPLE_ROWS = 5
+_header_cache: Dict[str, tuple[list, datetime]] = {}
+_header_cache_ttl = timedelta(minutes=5)
+
+
+def cache_header_sample(service, spreadsheet_id: str, sheet_id: int, rows: list) -> None:
+    """Remember the leading rows of a worksheet (e.g. from a full read)."""
+    cache_key = _get_profile_cache_key(service, spreadsheet_id, sheet_id)
+    if cache_key is not None:
+        _header_cache[cache_key] = ([list(row) for row in rows[:HEADER_SAMPLE_ROWS]], datetime.now())
+
+
+async def get_header_sample(
+    service,
+    spreadsheet_id: str,
+    sheet_title: str,
+    sheet_id: int,
+    grid_properties: Optional[dict] = None
+) -> list:
+    """
+    Leading rows of a worksheet for header detection, cached per worksheet
+
+    Reads only the first HEADER_SAMPLE_ROWS rows when nothing is cached. Writes through
+    this server drop the cache (mark_spreadsheet_modified).
+
+    Returns:
+        Up to HEADER_SAMPLE_ROWS rows (a copy, safe to modify)
+    """
+    cache_key = _get_profile_cache_key(service, spreadsheet_id, sheet_id)
+    if cache_key is not None and cache_key in _header_cache:
+        rows, cached_time = _header_cache[cache_key]
+        if datetime.now() - cached_time < _header_cache_ttl:
+            logger.debug(f"Using cached header rows for key: {cache_key}")
+            return [list(row) for row in rows]
+        del _header_cache[cache_key]
+
+    range_name = plan_sheet_range(sheet_title, grid_properties, end_row=HEADER_SAMPLE_ROWS)
+    result = await get_sheet_values(service, spreadsheet_id, range_name, "FORMATTED_VALUE")
+    rows = result.get('values', [])
+    cache_header_sample(service, spreadsheet_id, sheet_id, rows)
+    return rows
+
+
+def clear_header_cache(spreadsheet_id: Optional[str] = None) -> int:
+    """
+    Clear cached header rows.
+
+    Args:
+        spreadsheet_id: If provided, only clear entries for this spreadsheet. If None, clear all.
+
+    Returns:
+        Number of cache entries cleared.
+    """
+    if spreadsheet_id is None:
+        count = len(_header_cache)
+        _header_cache.clear()
+        return count
+
+    keys_to_remove = [key for key in _header_cache if key.split(':')[1] == spreadsheet_id]
+    for key in keys_to_remove:
+        del _header_cache[key]
+    return len(keys_to_remove)
+
+
+def resolve_header_columns(headers: list[str], columns: list[str]) -> list[int]:
+    """
+    Map header names to 0-based column indices (first match wins for duplicate headers)
+
+    Raises:
+        ValueError: If a name is not among the headers
+    """
+    positions: Dict[str, int] = {}
+    for index, header in enumerate(headers):
+        positions.setdefault(header, index)
+
+    missing = [name for name in columns if name not in positions]
+    if missing:
+        raise ValueError(f"Columns not found in header row: {missing}. Available columns: {headers}")
+    return [positions[name] for name in columns]
+
+
+def group_column_runs(indices: list[int]) -> list[Tuple[int, int]]:
+    """
+    Group column indices into contiguous (first, last) runs
+
+    Example:
+        >>> group_column_runs([4, 0, 1, 2, 7])
+        [(0, 2), (4, 4), (7, 7)]
+    """
+    runs: list[list[int]] = []
+    for index in sorted(set(indices)):
+        if runs and index == runs[-1][1] + 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return [(first, last) for first, last in runs]
+
+
+# Row filtering on raw 2D rows (before conversion to dicts)
+ROW_FILTER_OPS = ('equals', 'in', 'contains', 'range')
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Parse a cell as a number ("1,234.5", 3, "12%" -> 0.12); None if it is not numeric."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace(',', '')
+    if not text:
+        return None
+    scale = 1.0
+    if text.endswith('%'):
+        text, scale = text[:-1], 0.01
+    try:
+        return float(text) * scale
+    except ValueError:
+        return None
+
+
+def _compile_row_filter(spec: dict, index: int):
+    """Build a predicate over a raw row for one filter spec."""
+    op = spec.get('op', 'equals')
+    cell = lambda row: row[index] if index < len(row) else ""
+
+    if op == 'equals':
+        expected = str(spec.get('value', ''))
+        return lambda row: str(cell(row)) == expected
+    if op == 'in':
+        values = spec.get('value')
+        if not isinstance(values, list):
+            raise ValueError(f"Filter on '{spec['column']}': 'in' needs a list value")
+        expected = {str(v) for v in values}
+        return lambda row: str(cell(row)) in expected
+    if op == 'contains':
+        needle = str(spec.get('value', '')).lower()
+        return lambda row: needle in str(cell(row)).lower()
+    if op == 'range':
+        low, high = spec.get('min'), spec.get('max')
+        if low is None and high is None:
+            raise ValueError(f"Filter on '{spec['column']}': 'range' needs min and/or max")
+        if all(bound is None or _to_number(bound) is not None for bound in (low, high)):
+            low_num = _to_number(low) if low is not None else None
+            high_num = _to_number(high) if high is not None else None
+
+            def in_range(row):
+                number = _to_number(cell(row))
+                return (
+                    number is not None
+                    and (low_num is None or number >= low_num)
+                    and (high_num is None or number <= high_num)
+                )
+            return in_range
+
+        # Non-numeric bounds (e.g. ISO dates) compare as strings
+        def in_text_range(row):
+            text = str(cell(row))
+            return bool(text) and (low is None or text >= str(low)) and (high is None or text <= str(high))
+        return in_text_range
+
+    raise ValueError(f"Unknown filter op '{op}'. Supported: {', '.join(ROW_FILTER_OPS)}")
+
+
+def _sort_key(value: Any) -> tuple:
+    """Numbers first (numerically), then text, blanks last."""
+    number = _to_number(value)
+    if number is not None:
+        return (0, number, "")
+    text = str(value)
+    return (1, 0.0, text) if text.strip() else (2, 0.0, "")
+
+
+class RowQuery:
+    """
+    Server-side filter / order_by / offset / limit over raw sheet rows
+
+    Filters are evaluated on the 2D rows as they are read, so only matching rows are kept
+    and converted to dicts. Without order_by the query is complete as soon as
+    offset + limit rows matched, and callers can stop reading.
+
+    Filter specs (all must match):
+        {"column": "status", "op": "equals", "value": "active"}
+        {"column": "country", "op": "in", "value": ["US", "CA"]}
+        {"column": "name", "op": "contains", "value": "smith"}  # case-insensitive
+        {"column": "total", "op": "range", "min": 10, "max": 100}  # inclusive, numeric if bounds are
+
+    order_by is a column name, prefixed with "-" for descending order.
+    """
+
+    def __init__(
+        self,
+        filters: Optional[list[dict]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ):
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be >= 0")
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        for spec in filters or []:
+            if not isinstance(spec, dict) or 'column' not in spec:
+                raise ValueError(f"Invalid filter {spec!r}: expected a dict with 'column', 'op' and 'value'")
+        self.filters = filters or []
+        self.order_by = order_by.lstrip('-') if order_by else None
+        self.descending = bool(order_by) and order_by.startswith('-')
+        self.limit = limit
+        self.offset = offset
+        self._predicates: list = []
+        self._order_index: Optional[int] = None
+        self._rows: list = []
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names the query reads."""
+        names = [spec['column'] for spec in self.filters]
+        if self.order_by:
+            names.append(self.order_by)
+        return list(dict.fromkeys(names))
+
+    def bind(self, headers: list[str]) -> None:
+        """Resolve column names against the header row."""
+        indices = resolve_header_columns(headers, self.columns)
+        positions = dict(zip(self.columns, indices))
+        self._predicates = [_compile_row_filter(spec, positions[spec['column']]) for spec in self.filters]
+        self._order_index = positions[self.order_by] if self.order_by else None
+
+    @property
+    def done(self) -> bool:
+        """True once further rows cannot change the result."""
+        return (
+            self.limit is not None
+            and self._order_index is None
+            and len(self._rows) > self.offset + self.limit
+        )
+
+    def feed(self, rows: list) -> None:
+        """Keep the rows that match every filter."""
+        for row in rows:
+            if self.done:
+                return
+            if all(predicate(row) for predicate in self._predicates):
+                self._rows.append(row)
+
+    def result(self) -> Tuple[list, bool]:
+        """
+        Returns:
+            (rows, has_more): the selected rows and whether more matches exist past limit
+        """
+        rows = self._rows
+        if self._order_index is not None:
+            index = self._order_index
+            keyed = [(_sort_key(row[index] if index < len(row) else ""), row) for row in rows]
+            filled = sorted(
+                (item for item in keyed if item[0][0] != 2),
+                key=lambda item: item[0],
+                reverse=self.descending
+            )
+            # Blanks go last in both directions
+            rows = [row for _, row in filled] + [row for key, row in keyed if key[0] == 2]
+        end = None if self.limit is None else self.offset + self.limit
+        return rows[self.offset:end], end is not None and len(rows) > end
+
+
+# Typed reads: dtypes inferred per column from UNFORMATTED_VALUE cells
+TYPED_DTYPES = ('boolean', 'integer', 'number', 'date', 'datetime', 'time', 'string', 'null')
+
+# Day 0 of Sheets date serial numbers (dateTimeRenderOption=SERIAL_NUMBER)
+SHEETS_EPOCH = datetime(1899, 12, 30)
+
+_DATE_TEXT_PATTERN = re.compile(
+    r'\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|\d{1,2}:\d{2}'
+    r'|\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b',
+    re.IGNORECASE
+)
+
+
+def _looks_like_date(text: Any) -> bool:
+    """Whether a FORMATTED_VALUE cell reads as a date or time ("2024-01-31", "1/31/2024", "Jan 31", "10:30")."""
+    return isinstance(text, str) and _DATE_TEXT_PATTERN.search(text) is not None
+
+
+def infer_column_dtype(values: list, formatted_sample: list = ()) -> str:
+    """
+    Infer the dtype of one column of UNFORMATTED_VALUE cells
+
+    Numbers only tell dates apart from plain numbers through their display format, so
+    numeric columns whose formatted sample cells read as dates become date/datetime/time.
+
+    Args:
+        values: Cells of the column ("" for empty)
+        formatted_sample: A few FORMATTED_VALUE cells of the same column (optional)
+
+    Returns:
+        One of TYPED_DTYPES
+
+    Example:
+        >>> infer_column_dtype([45322, 45323], ["1/31/2024"])
+        'date'
+    """
+    filled = [value for value in values if value != "" and value is not None]
+    if not filled:
+        return 'null'
+    kinds = set(map(type, filled))
+    if kinds == {bool}:
+        return 'boolean'
+    if not kinds <= {int, float}:
+        return 'string'
+    if any(map(_looks_like_date, formatted_sample)):
+        if all(0 <= value < 1 for value in filled):
+            return 'time'
+        return 'date' if all(float(value).is_integer() for value in filled) else 'datetime'
+    return 'integer' if all(float(value).is_integer() for value in filled) else 'number'
+
+
+def convert_typed_column(values: list, dtype: str) -> list:
+    """Convert UNFORMATTED_VALUE cells to Python values of dtype; empty cells become None (except strings)."""
+    if dtype == 'string':
+        return [value if isinstance(value, str) else "" if value is None else str(value) for value in values]
+    if dtype == 'null':
+        return [None] * len(values)
+    if dtype == 'boolean':
+        return [None if value == "" else value for value in values]
+    if dtype == 'integer':
+        return [None if value == "" else int(value) for value in values]
+    if dtype == 'number':
+        return [None if value == "" else value for value in values]
+    if dtype == 'date':
+        epoch = SHEETS_EPOCH.date()
+        return [None if value == "" else epoch + timedelta(days=int(value)) for value in values]
+    # Serial fractions are days - round to whole seconds to drop float noise
+    moments = [None if value == "" else SHEETS_EPOCH + timedelta(seconds=round(value * 86400)) for value in values]
+    if dtype == 'time':
+        return [None if moment is None else moment.time() for moment in moments]
+    return moments
+
+
+def apply_column_types(
+    headers: list[str],
+    rows: list[list],
+    formatted_sample: list[list] = ()
+) -> Tuple[list[list], Dict[str, str]]:
+    """
+    Type a table of UNFORMATTED_VALUE rows column by column
+
+    Rows are padded/truncated to the header width and transposed once, each column's dtype
+    is inferred and converted in one pass, then the columns are zipped back into rows.
+
+    Args:
+        headers: Column names
+        rows: Data rows as read with UNFORMATTED_VALUE
+        formatted_sample: A few FORMATTED_VALUE data rows used to recognize date columns
+
+    Returns:
+        (typed_rows, schema) where schema maps each header to one of TYPED_DTYPES
+    """
+    width = len(headers)
+    if not width:
+        return [], {}
+    fill = [""] * width
+    normalized = [row[:width] if len(row) >= width else row + fill[len(row):] for row in rows]
+    columns = list(zip(*normalized)) if normalized else [()] * width
+    sample_columns = list(zip(*[row[:width] + fill[len(row):] for row in formatted_sample])) or [()] * width
+
+    schema = {}
+    typed_columns = []
+    for header, values, sample in zip(headers, columns, sample_columns):
+        dtype = infer_column_dtype(values, sample)
+        schema[header] = dtype
+        typed_columns.append(convert_typed_column(values, dtype))
+    return [list(row) for row in zip(*typed_columns)], schema
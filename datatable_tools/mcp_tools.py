@@ -13,6 +13,8 @@ Contains all core MCP tools:
 - append_columns: Append columns to existing sheet
 - update_range: Update specific cell range
 - update_range_by_lookup: Update rows by lookup key
+- batch_operations: Several writes applied in one atomic request
+- sheet_profile: Boundaries, header row and column stats in one read
 - copy_sheet: Create complete copy of spreadsheet (preserves all formatting)
 """
 
@@ -25,11 +27,13 @@ from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataT
 from datatable_tools.auth.service_decorator import require_google_service
 from datatable_tools.models import (
     TableResponse, SpreadsheetResponse, UpdateResponse, TableData, WorksheetsListResponse,
-    GetLastRowResponse, GetUsedRangeResponse, GetLastColumnResponse, CopySheetResponse
+    GetLastRowResponse, GetUsedRangeResponse, GetLastColumnResponse, CopySheetResponse,
+    SheetProfileResponse, BatchResponse
 )
 from datatable_tools.google_sheets_helpers import (
     process_data_input, parse_google_sheets_uri, get_sheet_by_gid,
-    get_last_row_with_data, get_used_range_info, get_last_column_with_data
+    get_last_row_with_data, get_used_range_info, get_last_column_with_data,
+    get_cached_sheet_profile, profile_last_row, column_index_to_letter, used_range_from_bounds
 )
 
 # Optional Polars import for type hints
@@ -55,6 +59,34 @@ async def read_sheet(
     range_address: Optional[str] = Field(
         default=None,
         description="Optional range in A1 notation (e.g., 'A2:M1000' for specific range, '2:1000' for rows 2-1000, 'B:Z' for columns B-Z). If not provided, reads entire sheet."
+    ),
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Optional list of header names to return (e.g., ['name', 'email']). Only these columns are downloaded. Cannot be combined with range_address."
+    ),
+    filters: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Optional row filters, all must match. Each is {'column': <header>, 'op': 'equals'|'in'|'contains'|'range', 'value': ...}; 'range' uses inclusive 'min'/'max' instead of 'value'. Example: [{'column': 'status', 'op': 'equals', 'value': 'active'}]"
+    ),
+    order_by: Optional[str] = Field(
+        default=None,
+        description="Optional header name to sort by; prefix with '-' for descending (e.g., '-total')"
+    ),
+    limit: Optional[int] = Field(
+        default=None,
+        description="Optional maximum number of rows to return"
+    ),
+    offset: int = Field(
+        default=0,
+        description="Number of matching rows to skip (use with limit for paging)"
+    ),
+    format: str = Field(
+        default="records",
+        description="Layout of the returned data: 'records' (list of dicts, default), 'rows' (headers once + 2D array, smallest for wide sheets) or 'columns' (dict of column arrays)"
+    ),
+    typed: bool = Field(
+        default=False,
+        description="Return typed values instead of display strings: numbers as numbers, booleans as booleans, dates as ISO dates, empty cells as null. The inferred type of each column is in source_info.schema"
     )
 ) -> TableResponse:
     """
@@ -68,6 +100,23 @@ async def read_sheet(
              - "2:1000" - Read rows 2 to 1000 (all columns)
              - "B:Z" - Read columns B to Z (all rows)
              - None (default) - Read entire sheet with smart header detection
+        columns: Optional header names to return, in this order. Only those columns are
+             fetched from the API; rows after the last value in the selected columns are omitted.
+        filters: Optional row filters evaluated server-side before rows are returned:
+             - {"column": "status", "op": "equals", "value": "active"}
+             - {"column": "country", "op": "in", "value": ["US", "CA"]}
+             - {"column": "name", "op": "contains", "value": "smith"} (case-insensitive)
+             - {"column": "total", "op": "range", "min": 10, "max": 100} (inclusive)
+        order_by: Optional header name to sort by, "-name" for descending
+        limit: Optional maximum number of rows; source_info.has_more tells if more matched
+        offset: Number of matching rows to skip
+        format: Layout of result.data:
+             - "records" (default): [{"name": "Alice", "age": "30"}, ...]
+             - "rows": result.headers = ["name", "age"], result.data = [["Alice", "30"], ...]
+             - "columns": {"name": ["Alice", ...], "age": ["30", ...]}
+        typed: Read unformatted values and type each column (integer, number, boolean, date,
+             datetime, time, string, null); source_info.schema maps headers to these types.
+             Filters then compare against unformatted values.
 
     Returns:
         Dict containing table_id and loaded Google Sheets table information
@@ -83,12 +132,26 @@ async def read_sheet(
 
         # Read specific range only (first row treated as header)
         result = read_sheet(ctx, uri, range_address="A2:M1000")
+
+        # Only download the columns you need
+        result = read_sheet(ctx, uri, columns=["Order ID", "Status", "Total"])
+
+        # Top 10 open orders by total
+        result = read_sheet(ctx, uri, filters=[{"column": "Status", "op": "equals", "value": "open"}],
+                            order_by="-Total", limit=10)
+
+        # Numbers and dates as typed values: {"Total": 1234.5, "Date": "2024-01-31"}
+        result = read_sheet(ctx, uri, typed=True)
     """
     google_sheet = GoogleSheetDataTable()
     # When range_address is specified, user knows the exact range, so disable auto-detection
     # When no range_address, use smart detection to find the real header row
     auto_detect_header_row = range_address is None
-    return await google_sheet.load_data_table(service, uri, range_address, auto_detect_header_row)
+    return await google_sheet.load_data_table(
+        service, uri, range_address, auto_detect_header_row, columns=columns,
+        filters=filters, order_by=order_by, limit=limit, offset=offset, response_format=format,
+        typed=typed
+    )
 
 
 @mcp.tool
@@ -102,6 +165,26 @@ async def load_data_table(
     range_address: Optional[str] = Field(
         default=None,
         description="Optional range in A1 notation (e.g., 'A2:M1000' for specific range, '2:1000' for rows 2-1000, 'B:Z' for columns B-Z). If not provided, reads entire sheet."
+    ),
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Optional list of header names to return (e.g., ['name', 'email']). Only these columns are downloaded. Cannot be combined with range_address."
+    ),
+    filters: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Optional row filters, all must match. Each is {'column': <header>, 'op': 'equals'|'in'|'contains'|'range', 'value': ...}; 'range' uses inclusive 'min'/'max' instead of 'value'. Example: [{'column': 'status', 'op': 'equals', 'value': 'active'}]"
+    ),
+    order_by: Optional[str] = Field(
+        default=None,
+        description="Optional header name to sort by; prefix with '-' for descending (e.g., '-total')"
+    ),
+    limit: Optional[int] = Field(
+        default=None,
+        description="Optional maximum number of rows to return"
+    ),
+    offset: int = Field(
+        default=0,
+        description="Number of matching rows to skip (use with limit for paging)"
     )
 ) -> TableResponse:
     """
@@ -117,6 +200,16 @@ async def load_data_table(
              - "2:1000" - Read rows 2 to 1000 (all columns)
              - "B:Z" - Read columns B to Z (all rows)
              - None (default) - Read entire sheet with smart header detection
+        columns: Optional header names to return, in this order. Only those columns are
+             fetched from the API; rows after the last value in the selected columns are omitted.
+        filters: Optional row filters evaluated server-side before rows are returned:
+             - {"column": "status", "op": "equals", "value": "active"}
+             - {"column": "country", "op": "in", "value": ["US", "CA"]}
+             - {"column": "name", "op": "contains", "value": "smith"} (case-insensitive)
+             - {"column": "total", "op": "range", "min": 10, "max": 100} (inclusive)
+        order_by: Optional header name to sort by, "-name" for descending
+        limit: Optional maximum number of rows; source_info.has_more tells if more matched
+        offset: Number of matching rows to skip
 
     Returns:
         Dict containing table_id and loaded Google Sheets table information
@@ -137,7 +230,10 @@ async def load_data_table(
     # This ensures both read_sheet and load_data_table use the same underlying logic
     google_sheet = GoogleSheetDataTable()
     auto_detect_header_row = range_address is None
-    return await google_sheet.load_data_table(service, uri, range_address, auto_detect_header_row)
+    return await google_sheet.load_data_table(
+        service, uri, range_address, auto_detect_header_row, columns=columns,
+        filters=filters, order_by=order_by, limit=limit, offset=offset
+    )
 
 
 @mcp.tool
@@ -147,6 +243,10 @@ async def read_worksheet_with_formulas(
     ctx: Context,
     uri: str = Field(
         description="Google Sheets URI. Supports full URL pattern (https://docs.google.com/spreadsheets/d/{spreadsheetID}/edit?gid={gid})"
+    ),
+    format: str = Field(
+        default="records",
+        description="Layout of the returned data: 'records' (list of dicts, default), 'rows' (headers once + 2D array, smallest for wide sheets) or 'columns' (dict of column arrays)"
     )
 ) -> TableResponse:
     """
@@ -172,6 +272,10 @@ async def read_worksheet_with_formulas(
     Args:
         uri: Google Sheets URI. Supports:
              - Google Sheets: https://docs.google.com/spreadsheets/d/{spreadsheetID}/edit?gid={gid}
+        format: Layout of result.data:
+             - "records" (default): [{"name": "Alice", "age": "30"}, ...]
+             - "rows": result.headers = ["name", "age"], result.data = [["Alice", "30"], ...]
+             - "columns": {"name": ["Alice", ...], "age": ["30", ...]}
 
     Returns:
         TableResponse containing:
@@ -201,7 +305,7 @@ async def read_worksheet_with_formulas(
         formulas = read_worksheet_with_formulas(ctx, uri)     # Returns {"Total": "=SUM(A2:A10)", "Average": "=AVERAGE(B2:B10)"}
     """
     google_sheet = GoogleSheetDataTable()
-    return await google_sheet.read_worksheet_with_formulas(service, uri)
+    return await google_sheet.read_worksheet_with_formulas(service, uri, response_format=format)
 
 
 @mcp.tool
@@ -215,6 +319,14 @@ async def preview_worksheet_with_formulas(
     limit: int = Field(
         default=5,
         description="Number of data rows to preview (default: 5, max: 100). Does not include header row."
+    ),
+    format: str = Field(
+        default="records",
+        description="Layout of the returned data: 'records' (list of dicts, default), 'rows' (headers once + 2D array, smallest for wide sheets) or 'columns' (dict of column arrays)"
+    ),
+    sample: Optional[str] = Field(
+        default=None,
+        description="Instead of the first rows, return a representative sample: 'stratified' (short row windows evenly spread across the sheet) or 'random' (windows at random positions). source_info.sample_row_numbers lists the sheet rows returned"
     )
 ) -> TableResponse:
     """
@@ -227,18 +339,25 @@ async def preview_worksheet_with_formulas(
 
     <use_case>Use when you need to:
     - Quickly check what formulas are at the top of a large sheet
+    - See representative rows from across a huge sheet (sample="stratified") without reading it
     - Inspect formula patterns without loading thousands of rows
     - Get a sample of the data structure and formulas
     - Reduce loading time for large worksheets
     </use_case>
 
-    <limitation>Only returns the first N rows (max 100). For full data with formulas, use read_worksheet_with_formulas instead.</limitation>
+    <limitation>Returns at most 100 rows, the first N or a sample of N. For full data with formulas, use read_worksheet_with_formulas instead.</limitation>
 
     <failure_cases>Fails if URI is invalid, spreadsheet doesn't exist, or user lacks read permissions.</failure_cases>
 
     Args:
         uri: Google Sheets URI. Supports full URL with gid parameter
         limit: Number of data rows to preview (default: 5, max: 100)
+        format: Layout of result.data:
+             - "records" (default): [{"name": "Alice", "age": "30"}, ...]
+             - "rows": result.headers = ["name", "age"], result.data = [["Alice", "30"], ...]
+             - "columns": {"name": ["Alice", ...], "age": ["30", ...]}
+        sample: None (first rows, default), "stratified" or "random" row windows across the sheet,
+             fetched with the header row in a single request
 
     Returns:
         TableResponse containing:
@@ -248,6 +367,7 @@ async def preview_worksheet_with_formulas(
             - shape: String of "(rows,columns)"
             - data: List of dicts with column names as keys and formula strings as values (limited rows)
             - source_info: Metadata including "preview_limit", "is_preview": true, "value_render_option": "FORMULA"
+              (plus "sample" and "sample_row_numbers" when sampling)
             - error: Error message if failed, None otherwise
             - message: Human-readable result with preview info
 
@@ -265,6 +385,14 @@ async def preview_worksheet_with_formulas(
             limit=10
         )
 
+        # 20 rows sampled across a 200k-row sheet
+        result = preview_worksheet_with_formulas(
+            ctx,
+            uri="https://docs.google.com/spreadsheets/d/16cLx4H72h8RqCklk2pfKLEixt6D0UIrt62MMOufrU60/edit?gid=0",
+            limit=20,
+            sample="stratified"
+        )
+
         # Access preview data
         if result.success:
             print(f"Preview: {result.source_info['preview_limit']} rows")
@@ -272,7 +400,7 @@ async def preview_worksheet_with_formulas(
                 print(row)  # {"Total": "=SUM(A2:A10)", "Average": "=AVERAGE(B2:B10)"}
     """
     google_sheet = GoogleSheetDataTable()
-    return await google_sheet.preview_worksheet_with_formulas(service, uri, limit)
+    return await google_sheet.preview_worksheet_with_formulas(service, uri, limit, response_format=format, sample=sample)
 
 
 @mcp.tool
@@ -356,11 +484,19 @@ async def append_rows(
             "- List[int|str|float|bool|None]: 1D array (single row)\n"
             "- polars.DataFrame: Polars DataFrame (when called via MCPPlus bridge with direct_call=True)"
         )
+    ),
+    insert_data_option: str = Field(
+        default="OVERWRITE",
+        description="How to insert the rows: 'OVERWRITE' (default) writes into the empty rows below the last row with data, 'INSERT_ROWS' inserts new rows there instead (useful when the empty rows below carry formatting or validation)."
+    ),
+    coalesce: bool = Field(
+        default=False,
+        description="Merge this append with other appends to the same worksheet arriving within a few milliseconds into one ordered write. Use when sending many small appends concurrently; the response still reports this call's own range."
     )
 ) -> UpdateResponse:
     """
     Append data as new rows below existing data in Google Sheets.
-    Automatically detects the last row and appends below it starting from column A.
+    The last row is detected server-side (single API call, the sheet is not downloaded) and rows are appended below the table.
 
     Args:
         uri: Google Sheets URI. Supports full URL pattern (https://docs.google.com/spreadsheets/d/{spreadsheetID}/edit?gid={gid})
@@ -368,9 +504,11 @@ async def append_rows(
               - List[List[int|str|float|bool|None]]: 2D array of table data (rows x columns)
               - List[Dict[str, int|str|float|bool|None]]: List of dicts (DataFrame-like), each dict represents a row
               - polars.DataFrame: Polars DataFrame (when called via MCPPlus bridge with direct_call=True)
+        insert_data_option: 'OVERWRITE' (default) or 'INSERT_ROWS'
+        coalesce: If True, concurrent appends to the same worksheet are sent as one write
 
     Returns:
-        UpdateResponse containing success status, range, updated cells, shape, etc.
+        UpdateResponse containing success status, range (the appended range reported by Google Sheets), updated cells, shape, etc.
 
     Examples:
         # Append new records to Google Sheets (2D array)
@@ -392,7 +530,7 @@ async def append_rows(
         )
     """
     google_sheet = GoogleSheetDataTable()
-    return await google_sheet.append_rows(service, uri, data)
+    return await google_sheet.append_rows(service, uri, data, insert_data_option=insert_data_option, coalesce=coalesce)
 
 
 @mcp.tool
@@ -486,6 +624,10 @@ async def update_range(
     include_header: bool = Field(
         default=False,
         description="Whether to include header row in the update. If False (default), uses auto-detection logic to skip headers when both original and new data have headers."
+    ),
+    diff: bool = Field(
+        default=False,
+        description="Only write cells whose value changes. The target range is read once and unchanged cells are skipped, which saves write quota and avoids recalculating formulas that depend on unchanged cells. The response reports updated_cells (written) and skipped_cells."
     )
 ) -> UpdateResponse:
     """
@@ -515,6 +657,7 @@ async def update_range(
               Values: int, str, float, bool, or None.
         range_address: A1 notation (e.g., "B5", "A1:E1", "B:B", "A1:C3"). Auto-expands to fit data.
         include_header: If False (default), uses auto-detection to skip headers. If True, always includes headers.
+        diff: If True, only cells whose value changes are written (as contiguous rectangles).
 
     Returns:
         UpdateResponse containing:
@@ -524,6 +667,7 @@ async def update_range(
             - worksheet: The worksheet name
             - range: The range that was updated
             - updated_cells: Number of cells updated
+            - skipped_cells: Number of unchanged cells skipped (diff=True only)
             - shape: String of "(rows,columns)"
             - error: Error message if failed, None otherwise
             - message: Human-readable result message
@@ -547,9 +691,12 @@ async def update_range(
         # Insert image formula (formulas are automatically interpreted)
         update_range(ctx, uri, data=[['=IMAGE("https://example.com/image.jpg", 1)']],
                     range_address="A1")
+
+        # Re-sync a table, writing only the cells that changed
+        update_range(ctx, uri, data=[["Col1", "Col2"], [1, 2], [3, 5]], range_address="A1", diff=True)
     """
     google_sheet = GoogleSheetDataTable()
-    return await google_sheet.update_range(service, uri, data, range_address, include_header=include_header)
+    return await google_sheet.update_range(service, uri, data, range_address, include_header=include_header, diff=diff)
 
 
 @mcp.tool
@@ -644,6 +791,59 @@ async def insert_image_in_cell(
     )
 
 
+@mcp.tool
+@require_google_service("sheets", "sheets_write")
+async def batch_operations(
+    service,  # Injected by @require_google_service
+    ctx: Context,
+    uri: str = Field(
+        description="Google Sheets URI. Supports full URL pattern (https://docs.google.com/spreadsheets/d/{spreadsheetID}/edit?gid={gid})"
+    ),
+    operations: List[Dict[str, Any]] = Field(
+        description=(
+            "Operations to apply in order. Each is a dict with 'op' and an optional 'worksheet' title (default: the worksheet in uri):\n"
+            "- {'op': 'update_range', 'data': [[...]] or [{...}], 'range_address': 'A1', 'include_header': true}\n"
+            "- {'op': 'append_rows', 'data': [[...]] or [{...}]}\n"
+            "- {'op': 'insert_image', 'cell_address': 'B5', 'image_url': 'https://...', 'width_pixels': 400, 'height_pixels': 300}\n"
+            "- {'op': 'resize_dimension', 'dimension': 'ROWS' or 'COLUMNS', 'start_index': 0, 'end_index': 1, 'pixel_size': 120} (0-based, end exclusive)\n"
+            "- {'op': 'resize_sheet', 'row_count': 2000, 'column_count': 30}"
+        )
+    )
+) -> BatchResponse:
+    """
+    Applies several write operations to one spreadsheet in a single atomic request.
+
+    <description>Compiles update_range, append_rows, insert_image, resize_dimension and resize_sheet operations into one Google Sheets batchUpdate. Either every operation is applied or none is. Returns one result per operation.</description>
+
+    <use_case>Use instead of several separate update_range / append_rows / insert_image_in_cell calls on the same spreadsheet, e.g. writing a report table, appending a log row and inserting a chart image in one step.</use_case>
+
+    <limitation>Values are written with their JSON type: numbers as numbers, booleans as booleans, text starting with '=' as formulas. Text is not parsed, so "2024-01-31" or "42" written as strings stay text. update_range does not auto-skip headers; use include_header=false to drop the header row of list-of-dict data. Appended ranges are placed by Google Sheets and are not reported.</limitation>
+
+    <failure_cases>Fails without applying anything if any operation is invalid (unknown op, missing field, bad cell address, unknown worksheet) or if the API rejects the request.</failure_cases>
+
+    Args:
+        uri: Google Sheets URI
+        operations: List of operation dicts (see the operations field description)
+
+    Returns:
+        BatchResponse containing:
+            - success: Whether the batch was applied
+            - spreadsheet_url, spreadsheet_id
+            - results: Per operation: index, op, worksheet, range (written A1 range, if known), updated_cells, message
+            - error, message
+
+    Examples:
+        batch_operations(ctx, uri, operations=[
+            {"op": "update_range", "range_address": "A1", "data": [["Name", "Score"], ["Alice", 91]]},
+            {"op": "append_rows", "worksheet": "Log", "data": [["2024-01-31", "report updated"]]},
+            {"op": "insert_image", "cell_address": "D2", "image_url": "https://example.com/chart.png"},
+            {"op": "resize_dimension", "dimension": "COLUMNS", "start_index": 0, "end_index": 1, "pixel_size": 200}
+        ])
+    """
+    google_sheet = GoogleSheetDataTable()
+    return await google_sheet.batch(service, uri, operations)
+
+
 @mcp.tool
 @require_google_service("sheets", "sheets_write")
 async def write_new_worksheet(
@@ -1062,6 +1262,66 @@ async def copy_range_with_formulas(
     )
 
 
+@mcp.tool
+@require_google_service("sheets", "sheets_read")
+async def sheet_profile(
+    service,  # Injected by @require_google_service
+    ctx: Context,
+    uri: str = Field(
+        description="Google Sheets URI. Supports full URL pattern (https://docs.google.com/spreadsheets/d/{spreadsheetID}/edit?gid={gid}#gid={gid})"
+    ),
+    force_refresh: bool = Field(
+        default=False,
+        description="Re-read the worksheet even if a profile from the last minute is cached"
+    )
+) -> SheetProfileResponse:
+    """
+    Profiles a worksheet in one read: data boundaries, header row and per-column statistics.
+
+    Replaces calling get_last_row, get_last_column and get_used_range one after another.
+    While the profile is fresh (about a minute, and until the next write through this server)
+    those tools answer from it without reading the sheet again.
+
+    <description>Returns last row, last column, used range, the detected header row and headers, and for every column its non-empty cell count, formula count and last row - all from a single read of the worksheet.</description>
+
+    <use_case>Use when exploring an unknown worksheet before reading or writing, or whenever you would otherwise call get_last_row, get_last_column and get_used_range back to back.</use_case>
+
+    <limitation>Reads the whole worksheet once (display values and formulas). Like get_last_row, a formula cell that displays an empty string does not count as data (it still shows up in formula_count). Edits made outside this server within the cache window are not seen unless force_refresh=True.</limitation>
+
+    <failure_cases>Header detection is heuristic (first 5 rows) and may pick the wrong row for sheets with merged title rows. Returns last_row 0 for completely empty sheets.</failure_cases>
+
+    Args:
+        uri: Google Sheets URI (full URL with gid parameter)
+        force_refresh: Ignore a cached profile
+
+    Returns:
+        SheetProfileResponse containing:
+            - success: Whether the operation succeeded
+            - used_range: A1 notation like "A1:C10"
+            - last_row: 1-based row number of last row with data (0 for empty sheet)
+            - last_column: Column letter like "C"
+            - last_column_index: 0-based column index
+            - header_row: 1-based header row number (0 if none detected)
+            - headers: Header names
+            - columns: Per-column column, header, non_empty_count, formula_count, last_row
+            - cached: Whether the profile came from the cache
+            - spreadsheet_id, spreadsheet_url, worksheet, message, error
+
+    Examples:
+        result = sheet_profile(
+            ctx,
+            uri="https://docs.google.com/spreadsheets/d/18iaWb8OUFdNldk03ESY6indsfrURlMsyBwqwMIRkYJY/edit?gid=1435041919#gid=1435041919"
+        )
+
+        if result.success:
+            print(f"Data in {result.used_range}, header at row {result.header_row}")
+            for col in result.columns:
+                print(f"  {col.column} '{col.header}': {col.non_empty_count} values, {col.formula_count} formulas")
+    """
+    google_sheet = GoogleSheetDataTable()
+    return await google_sheet.sheet_profile(service, uri, force_refresh)
+
+
 @mcp.tool
 @require_google_service("sheets", "sheets_read")
 async def get_last_row(
@@ -1138,8 +1398,15 @@ async def get_last_row(
         # Construct spreadsheet URL with gid
         spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
 
-        # Get last row (with optional column parameter)
-        last_row = await get_last_row_with_data(service, spreadsheet_id, sheet_title, column)
+        # Get last row (with optional column parameter), from a fresh sheet_profile if there is one
+        profile = get_cached_sheet_profile(service, spreadsheet_id, sheet_id)
+        if profile is not None:
+            last_row = profile_last_row(profile, column)
+        else:
+            last_row = await get_last_row_with_data(
+                service, spreadsheet_id, sheet_title, column,
+                grid_properties=sheet_properties.get('gridProperties')
+            )
 
         # Customize message based on whether column was specified
         if column:
@@ -1241,10 +1508,17 @@ async def get_used_range(
         # Construct spreadsheet URL with gid
         spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
 
-        # Get used range info
-        used_range, row_count, column_count, start_cell, end_cell = await get_used_range_info(
-            service, spreadsheet_id, sheet_title
-        )
+        # Get used range info, from a fresh sheet_profile if there is one
+        profile = get_cached_sheet_profile(service, spreadsheet_id, sheet_id)
+        if profile is not None:
+            used_range, row_count, column_count, start_cell, end_cell = used_range_from_bounds(
+                profile['last_row'], profile['last_column']
+            )
+        else:
+            used_range, row_count, column_count, start_cell, end_cell = await get_used_range_info(
+                service, spreadsheet_id, sheet_title,
+                grid_properties=sheet_properties.get('gridProperties')
+            )
 
         return GetUsedRangeResponse(
             success=True,
@@ -1335,8 +1609,16 @@ async def get_last_column(
         # Construct spreadsheet URL with gid
         spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
 
-        # Get last column
-        last_column, column_index = await get_last_column_with_data(service, spreadsheet_id, sheet_title)
+        # Get last column, from a fresh sheet_profile if there is one
+        profile = get_cached_sheet_profile(service, spreadsheet_id, sheet_id)
+        if profile is not None:
+            column_index = max(profile['last_column'] - 1, 0)
+            last_column = column_index_to_letter(column_index)
+        else:
+            last_column, column_index = await get_last_column_with_data(
+                service, spreadsheet_id, sheet_title,
+                grid_properties=sheet_properties.get('gridProperties')
+            )
 
         return GetLastColumnResponse(
             success=True,
@@ -5,8 +5,10 @@ Pydantic models for structured API responses across all operations.
 Also defines shared type aliases for data input formats.
 """
 
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel
+from collections.abc import Sequence
+from typing import Annotated, Dict, List, Optional, Any, Union
+from pydantic import BaseModel, SkipValidation, TypeAdapter, WithJsonSchema, field_serializer
+from pydantic_core import core_schema
 from enum import Enum
 
 
@@ -58,6 +60,120 @@ class ValueInputOption(str, Enum):
     USER_ENTERED = "USER_ENTERED"
 
 
+class InsertDataOption(str, Enum):
+    """
+    Determines how existing data is changed when appending rows with values.append.
+
+    Enum values:
+    - OVERWRITE: New data overwrites the empty rows below the last row with data
+      (rows are only added to the grid when it runs out of space).
+
+    - INSERT_ROWS: Rows are inserted for the new data below the last row with data,
+      the empty rows there are shifted down.
+    """
+    OVERWRITE = "OVERWRITE"
+    INSERT_ROWS = "INSERT_ROWS"
+
+
+class ResponseFormat(str, Enum):
+    """
+    Determines how table data is laid out in TableResponse.data.
+
+    Enum values:
+    - RECORDS: List of dicts, one per row (default). Every header is repeated on every row.
+      Example: [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": "25"}]
+
+    - ROWS: Headers once in TableResponse.headers, data as a 2D array.
+      Example: headers=["name", "age"], data=[["Alice", "30"], ["Bob", "25"]]
+
+    - COLUMNS: Dict of column arrays keyed by header.
+      Example: {"name": ["Alice", "Bob"], "age": ["30", "25"]}
+
+    Note: ROWS and COLUMNS are much smaller on wide sheets because header strings are
+    not repeated per row.
+    """
+    RECORDS = "records"
+    ROWS = "rows"
+    COLUMNS = "columns"
+
+
+class TableRecords(Sequence):
+    """
+    Records view over one header list and raw row lists.
+
+    Holds the rows as read (short rows are padded, long rows truncated on access) and
+    builds a dict only when a record is accessed or the response is serialized, so a
+    large read keeps one list per row instead of one dict per row. Behaves like a
+    read-only List[Dict[str, Any]]: indexing, slicing, iteration, len() and == work.
+
+    Example:
+        >>> records = TableRecords(["name", "age"], [["Alice", "30"], ["Bob"]])
+        >>> records[1]
+        {'name': 'Bob', 'age': ''}
+        >>> records == [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": ""}]
+        True
+    """
+    __slots__ = ('headers', 'rows', '_template')
+
+    def __init__(self, headers: List[str], rows: List[List[Any]]):
+        self.headers = list(headers)
+        self.rows = list(rows)
+        self._template = dict.fromkeys(self.headers, "")
+
+    def _record(self, row: List[Any]) -> Dict[str, Any]:
+        # Copying a presized all-"" dict pads short rows and skips the resizes dict(zip())
+        # goes through; zip() stops at the shorter side, which truncates long rows for free
+        record = self._template.copy()
+        record.update(zip(self.headers, row))
+        return record
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(row) for row in self.rows[index]]
+        return self._record(self.rows[index])
+
+    def __iter__(self):
+        return map(self._record, self.rows)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TableRecords):
+            return self.headers == other.headers and self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TableRecords(headers={self.headers!r}, rows={len(self.rows)})"
+
+    def extend(self, other: "TableRecords") -> None:
+        """Append the rows of another view with the same headers."""
+        self.rows.extend(other.rows)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialize as a list of dicts."""
+        return list(self)
+
+    def _serialize(self, info):
+        # JSON output consumes records one at a time, so all dicts never exist at once
+        return iter(self) if info.mode == 'json' else self.to_list()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        # Accepted as-is (no copy) and serialized as a list of dicts
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(cls._serialize, info_arg=True)
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return handler(core_schema.list_schema(core_schema.dict_schema(core_schema.str_schema(), core_schema.any_schema())))
+
+
 # ============================================================================
 # Type Aliases for Data Input Formats
 # ============================================================================
@@ -110,17 +226,34 @@ Examples:
 # ============================================================================
 
 
+# Serialized JSON schema of TableResponse.data (the serializer below returns Any)
+_TABLE_DATA_SCHEMA = WithJsonSchema(
+    TypeAdapter(Union[List[Dict[str, Any]], List[List[Any]], Dict[str, List[Any]]]).json_schema()
+)
+
+
 class TableResponse(BaseModel):
     """Response type for Google Sheets table operations"""
     success: bool
     table_id: Optional[str] = None
     name: Optional[str] = None
     shape: Optional[str] = None
-    data: List[Dict[str, Any]] = []
+    # Not re-validated: table data is built by the reader and can be large (see TableRecords)
+    data: SkipValidation[Union[TableRecords, List[Dict[str, Any]], List[List[Any]], Dict[str, List[Any]]]] = []
+    headers: Optional[List[str]] = None  # Set for format="rows"
+    format: str = ResponseFormat.RECORDS.value
     source_info: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     message: str
 
+    @field_serializer('data')
+    def _serialize_data(self, data: Any, info) -> Annotated[Any, _TABLE_DATA_SCHEMA]:
+        # SkipValidation leaves the Union serializer guessing (a columns dict came out as
+        # its keys), so dispatch on the runtime type instead
+        if isinstance(data, TableRecords):
+            return data._serialize(info)
+        return data
+
 
 class SpreadsheetResponse(BaseModel):
     """Response type for creating new Google Sheets spreadsheet"""
@@ -141,11 +274,33 @@ class UpdateResponse(BaseModel):
     worksheet: str
     range: str
     updated_cells: int
+    # Cells left untouched because they already held the value (diff writes only)
+    skipped_cells: Optional[int] = None
     shape: str
     error: Optional[str] = None
     message: str
 
 
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation of a batch_operations call"""
+    index: int
+    op: str
+    worksheet: str
+    range: Optional[str] = None  # A1 range written; None when the API places the rows (append_rows) or for resizes
+    updated_cells: int = 0
+    message: str
+
+
+class BatchResponse(BaseModel):
+    """Response type for batch_operations (all operations applied in one atomic request)"""
+    success: bool
+    spreadsheet_url: str
+    spreadsheet_id: str
+    results: List[BatchOperationResult] = []
+    error: Optional[str] = None
+    message: str
+
+
 class WorksheetInfo(BaseModel):
     """Information about a single worksheet"""
     sheet_id: int
@@ -206,6 +361,33 @@ class GetLastColumnResponse(BaseModel):
     error: Optional[str] = None
 
 
+class ColumnProfile(BaseModel):
+    """Per-column statistics of a worksheet profile"""
+    column: str  # e.g., "C"
+    header: str
+    non_empty_count: int
+    formula_count: int
+    last_row: int  # 1-based, 0 if the column is empty
+
+
+class SheetProfileResponse(BaseModel):
+    """Response model for sheet_profile (boundaries, header and column stats in one read)"""
+    success: bool
+    spreadsheet_id: str
+    spreadsheet_url: str
+    worksheet: str
+    used_range: str  # e.g., "A1:C10"
+    last_row: int
+    last_column: str  # e.g., "C"
+    last_column_index: int  # 0-based
+    header_row: int  # 1-based, 0 if no header detected
+    headers: List[str] = []
+    columns: List[ColumnProfile] = []
+    cached: bool = False
+    message: str
+    error: Optional[str] = None
+
+
 class CopySheetResponse(BaseModel):
     """Response type for copy_sheet operation"""
     success: bool
@@ -8,26 +8,128 @@ Stage 4.2: Framework-agnostic implementation with NO FastMCP dependency.
 Decorators moved to MCP layer (mcp_tools.py).
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, AsyncIterator
 import logging
 import asyncio
+import gc
+import io
 import re
+from contextlib import aclosing, contextmanager
 
 from datatable_tools.interfaces.datatable import DataTableInterface
-from datatable_tools.models import TableResponse, SpreadsheetResponse, UpdateResponse, ValueRenderOption, ValueInputOption
+from datatable_tools.models import TableResponse, TableRecords, SpreadsheetResponse, UpdateResponse, BatchResponse, BatchOperationResult, ValueRenderOption, ValueInputOption, InsertDataOption, ResponseFormat
 from datatable_tools.google_sheets_helpers import (
     parse_google_sheets_uri,
-    get_sheet_by_gid,
     auto_detect_headers,
     detect_header_row,
     column_index_to_letter,
     column_letter_to_index,
     process_data_input,
-    parse_range_address
+    parse_range_address,
+    get_spreadsheet_metadata,
+    invalidate_spreadsheet_metadata,
+    resolve_sheet_context,
+    SheetContext,
+    get_sheet_values,
+    get_cached_sheet_values,
+    get_formula_and_formatted_values,
+    mark_spreadsheet_modified,
+    plan_sheet_range,
+    quote_sheet_title,
+    leading_rows_range,
+    needs_chunked_read,
+    iter_sheet_value_chunks,
+    iter_streamed_rows,
+    raw_request,
+    estimate_row_bytes,
+    plan_write_requests,
+    plan_changed_blocks,
+    write_value_ranges,
+    coalesce_append,
+    encode_row_data,
+    encode_write_row,
+    encode_write_value,
+    update_cached_sheet_properties,
+    WRITE_REQUEST_BYTES,
+    build_sheet_profile,
+    cache_sheet_profile,
+    get_cached_sheet_profile,
+    profile_last_row,
+    probe_data_bounds,
+    get_last_row_with_data,
+    plan_sample_windows,
+    SAMPLE_MODES,
+    HEADER_SAMPLE_ROWS,
+    cache_header_sample,
+    get_header_sample,
+    resolve_header_columns,
+    group_column_runs,
+    RowQuery,
+    apply_column_types
 )
 
 logger = logging.getLogger(__name__)
 
+# Optional Polars import for DataFrame results (direct_call / in-process use)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+    pl = None
+
+# Output types of load_data_frame()
+DATA_FRAME_OUTPUTS = ('polars', 'arrow', 'arrow_ipc')
+
+# Operation kinds accepted by batch() and the fields each one requires
+BATCH_OPERATIONS = ('update_range', 'append_rows', 'insert_image', 'resize_dimension', 'resize_sheet')
+BATCH_REQUIRED_FIELDS = {
+    'update_range': ('data',),
+    'append_rows': ('data',),
+    'insert_image': ('cell_address', 'image_url'),
+    'resize_dimension': ('pixel_size',),
+}
+
+# Polars dtype of each typed-read dtype (see apply_column_types)
+POLARS_DTYPES = {
+    'boolean': pl.Boolean,
+    'integer': pl.Int64,
+    'number': pl.Float64,
+    'date': pl.Date,
+    'datetime': pl.Datetime,
+    'time': pl.Time,
+    'string': pl.Utf8,
+    'null': pl.Null,
+} if POLARS_AVAILABLE else {}
+
+# Tables with more rows than this are shaped with the cyclic GC paused
+GC_PAUSE_MIN_ROWS = 10_000
+
+# Rows transposed per zip(*block) for the columns layout - small enough to stay in CPU cache
+TRANSPOSE_BLOCK_ROWS = 256
+
+
+@contextmanager
+def _gc_paused(row_count: int):
+    """
+    Pause the cyclic garbage collector while building a large table.
+
+    Hundreds of thousands of fresh lists/dicts trigger repeated collections that rescan
+    everything built so far (none of it is garbage). Runs only around synchronous code,
+    so no other asyncio task runs during the pause. gc.disable() is process-wide though:
+    worker threads running meanwhile (asyncio.to_thread, e.g. a streaming decode) skip
+    cyclic collection too until the table is built. Reference counting still frees
+    their acyclic garbage, so this only delays reclaiming cycles.
+    """
+    if row_count <= GC_PAUSE_MIN_ROWS or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
 
 def extract_starting_column(range_string: str) -> str:
     """
@@ -172,19 +274,244 @@ class GoogleSheetDataTable(DataTableInterface):
     Uses stacked decorators and direct Google Sheets API calls for clean architecture.
     """
 
+    async def _resolve_sheet_context(
+        self,
+        service,
+        uri: str,
+        sheet_context: Optional[SheetContext] = None
+    ) -> SheetContext:
+        """
+        Reuse the caller's SheetContext when it targets the same worksheet, otherwise resolve one.
+
+        Nested operations (e.g. update_by_lookup -> load_data_table -> update_range -> append_rows)
+        pass the context down so metadata is fetched at most once per tool call.
+        """
+        if sheet_context is not None and sheet_context.matches(uri):
+            return sheet_context
+        return await resolve_sheet_context(service, uri)
+
+    async def _single_read(
+        self,
+        service,
+        spreadsheet_id: str,
+        range_name: str,
+        value_render_option: str,
+        stream: bool = False
+    ) -> AsyncIterator[list]:
+        """Read a range with one values().get call, shaped like iter_sheet_value_chunks()."""
+        if stream:
+            # Raw body decoded in row batches; bypasses the shared read paths, which hold parsed results
+            request = service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=range_name,
+                valueRenderOption=value_render_option
+            )
+            body = await asyncio.to_thread(raw_request(request).execute)
+            async with aclosing(iter_streamed_rows(body)) as batches:
+                async for rows in batches:
+                    yield rows
+            return
+        result = await get_cached_sheet_values(service, spreadsheet_id, range_name, value_render_option)
+        rows = result.get('values', [])
+        if rows:
+            yield rows
+
+    def _split_header_row(self, rows: list, auto_detect_header_row: bool) -> tuple:
+        """Split leading rows into (header_row_index, headers, data_rows)."""
+        if not rows:
+            return 0, [], []
+        if auto_detect_header_row:
+            # Use smart header detection (analyzes first 5 rows)
+            header_row_idx, headers, data_rows = detect_header_row(rows)
+            logger.info(f"Smart detection: header at row {header_row_idx}, {len(headers)} columns")
+        else:
+            # Old behavior: assume row 0 is header
+            header_row_idx = 0
+            headers = [str(h) if h is not None else "" for h in rows[0]]
+            data_rows = rows[1:]
+            logger.info(f"Manual mode: using row 0 as header")
+        return header_row_idx, headers, data_rows
+
+    async def _load_projected_columns(
+        self,
+        service,
+        sheet_context: SheetContext,
+        columns: List[str],
+        auto_detect_header_row: bool,
+        value_render_option: str
+    ) -> tuple:
+        """
+        Read only the named columns: one batchGet range per contiguous column run.
+
+        Header names are resolved against the cached header rows of the worksheet.
+
+        Returns:
+            (rows, row_count, formatted_sample) where rows hold the requested columns in the
+            requested order, row_count is the 1-based last row read and formatted_sample holds
+            the same columns of the first few data rows as FORMATTED_VALUE
+        """
+        spreadsheet_id = sheet_context.spreadsheet_id
+        grid_properties = sheet_context.properties.get('gridProperties')
+
+        sample = await get_header_sample(
+            service, spreadsheet_id, sheet_context.title, sheet_context.sheet_id, grid_properties
+        )
+        header_row_idx, headers, _ = self._split_header_row(sample, auto_detect_header_row)
+        indices = resolve_header_columns(headers, columns)
+
+        runs = group_column_runs(indices)
+        ranges = [
+            plan_sheet_range(
+                sheet_context.title, grid_properties,
+                start_row=header_row_idx + 2, start_col=first, end_col=last
+            )
+            for first, last in runs
+        ]
+        logger.info(f"Projecting {len(columns)} of {len(headers)} columns with {len(ranges)} range(s)")
+
+        result = await asyncio.to_thread(
+            service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                valueRenderOption=value_render_option
+            ).execute
+        )
+        run_rows = [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+        run_of = {}
+        for run_idx, (first, last) in enumerate(runs):
+            for index in range(first, last + 1):
+                run_of[index] = (run_idx, index - first)
+        locations = [run_of[index] for index in indices]
+
+        height = max((len(rows) for rows in run_rows), default=0)
+        rows = []
+        for row_idx in range(height):
+            row = []
+            for run_idx, offset in locations:
+                run = run_rows[run_idx]
+                cells = run[row_idx] if row_idx < len(run) else []
+                row.append(cells[offset] if offset < len(cells) else "")
+            rows.append(row)
+
+        formatted_sample = [
+            [row[index] if index < len(row) else "" for index in indices]
+            for row in sample[header_row_idx + 1:]
+        ]
+        return rows, (header_row_idx + 1 + height if height else header_row_idx + 1), formatted_sample
+
+    async def _formatted_data_sample(
+        self,
+        service,
+        sheet_context: SheetContext,
+        header_row_idx: int,
+        range_name: Optional[str] = None
+    ) -> list:
+        """
+        FORMATTED_VALUE cells of the first data rows, used by typed reads to recognize date columns.
+
+        Whole-sheet reads use the (cached) header sample of the worksheet; reads of an explicit
+        range fetch the same number of leading rows of that range, so a column gets the same
+        dtype however the read was addressed.
+        """
+        if range_name is not None:
+            sample_range = leading_rows_range(range_name, HEADER_SAMPLE_ROWS)
+            if sample_range is None:
+                return []
+            result = await get_sheet_values(service, sheet_context.spreadsheet_id, sample_range, "FORMATTED_VALUE")
+            return result.get('values', [])[header_row_idx + 1:]
+        sample = await get_header_sample(
+            service, sheet_context.spreadsheet_id, sheet_context.title, sheet_context.sheet_id,
+            sheet_context.properties.get('gridProperties')
+        )
+        return sample[header_row_idx + 1:]
+
+    def _rows_to_table(
+        self,
+        headers: list,
+        rows: list,
+        response_format: ResponseFormat = ResponseFormat.RECORDS
+    ) -> Union[List[Dict[str, Any]], List[List[Any]], Dict[str, List[Any]]]:
+        """
+        Shape data rows for TableResponse.data, padding short rows and truncating long ones.
+
+        records -> TableRecords (list-of-dicts view), rows -> 2D array, columns -> dict of column arrays
+
+        Works row-at-a-time with C-level list/zip operations instead of per-cell Python
+        loops: only short rows are copied and padded, columns are transposed with
+        zip(*block) over TRANSPOSE_BLOCK_ROWS rows at a time (see tests/benchmark_normalize.py).
+        """
+        if not headers:
+            return {} if response_format == ResponseFormat.COLUMNS else []
+        width = len(headers)
+        fill = [""] * width
+
+        if response_format == ResponseFormat.RECORDS:
+            # Dicts are only built when the response is serialized or a record is accessed
+            return TableRecords(headers, rows)
+
+        with _gc_paused(len(rows)):
+            if response_format == ResponseFormat.ROWS:
+                return [
+                    row[:width] if len(row) >= width else row + fill[len(row):]
+                    for row in rows
+                ]
+
+            # One zip(*rows) walks every row once per column, far apart in memory; small
+            # blocks keep the rows being transposed in cache. Rows are only read here, so
+            # full-width ones are used as they are.
+            columns = [[] for _ in headers]
+            for start in range(0, len(rows), TRANSPOSE_BLOCK_ROWS):
+                block = [
+                    row if len(row) == width else row[:width] if len(row) > width else row + fill[len(row):]
+                    for row in rows[start:start + TRANSPOSE_BLOCK_ROWS]
+                ]
+                for column, values in zip(columns, zip(*block)):
+                    column.extend(values)
+            return dict(zip(headers, columns))
+
+    def _extend_table(self, data, part):
+        """Append a chunk shaped by _rows_to_table() to the table built so far (None to start one)."""
+        if data is None:
+            return part
+        if isinstance(data, dict):
+            for header, values in part.items():
+                data.setdefault(header, []).extend(values)
+        else:
+            data.extend(part)
+        return data
+
+    def _table_fields(self, headers: list, data, response_format: ResponseFormat) -> Dict[str, Any]:
+        """TableResponse fields that depend on the response format."""
+        fields = {"data": data, "format": response_format.value}
+        if response_format == ResponseFormat.ROWS:
+            fields["headers"] = list(headers)
+        return fields
+
     async def load_data_table(
         self,
         service,  # Authenticated Google Sheets service
         uri: str,
         range_address: Optional[str] = None,
         auto_detect_header_row: bool = True,
-        value_render_option: str = 'FORMATTED_VALUE'
+        value_render_option: str = 'FORMATTED_VALUE',
+        sheet_context: Optional[SheetContext] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        response_format: str = ResponseFormat.RECORDS.value,
+        typed: bool = False,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """
         Load a table from Google Sheets.
 
         Implementation of DataTableInterface.load_data_table() for Google Sheets.
 
+        Whole-sheet reads of large grids are fetched as byte-budgeted row chunks with
+        bounded concurrency (see iter_sheet_value_chunks) and converted chunk by chunk.
+
         Args:
             service: Authenticated Google Sheets API service object
             uri: Google Sheets URI
@@ -194,79 +521,181 @@ class GoogleSheetDataTable(DataTableInterface):
                 - 'FORMATTED_VALUE': Values formatted as they appear in the UI (default)
                 - 'UNFORMATTED_VALUE': Values with no formatting applied
                 - 'FORMULA': Returns formulas for cells with formulas, values for others
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+            columns: Header names to return (optional). Only these columns are fetched, with
+                one batchGet range per contiguous column run. Cannot be combined with range_address.
+            filters: Row predicates on header names, all must match (optional), e.g.
+                {"column": "status", "op": "equals", "value": "active"}; ops: equals, in,
+                contains (case-insensitive), range (inclusive "min"/"max"). See RowQuery.
+            order_by: Header name to sort by, "-name" for descending (optional)
+            limit: Maximum number of rows to return (optional)
+            offset: Number of matching rows to skip (default: 0)
+            response_format: Layout of TableResponse.data (see ResponseFormat):
+                - 'records': list of dicts (default)
+                - 'rows': headers once in TableResponse.headers plus a 2D array
+                - 'columns': dict of column arrays
+            typed: Read UNFORMATTED_VALUE cells (dates as serial numbers) and return typed
+                columns: each column's dtype is inferred once (see apply_column_types) and
+                reported in source_info["schema"]. Numbers stay numbers, empty cells are None,
+                date columns (recognized from the display format of the first rows) become
+                date/datetime/time values. Overrides value_render_option.
+            stream: Decode values responses incrementally from the raw body (see
+                iter_json_value_rows) and feed rows to filtering and conversion in batches,
+                so rows the query drops are never built as one JSON object tree. Only used
+                with filters, limit or offset: without them every row ends up in the result
+                anyway and the plain parse is cheaper. Streamed reads skip the shared value cache.
+
+        Filters, ordering and slicing run on the raw rows; only the selected rows are
+        converted to dicts. Without order_by, reading stops once limit rows matched.
+        With typed=True filters therefore see unformatted values (numbers, date serials).
         """
+        response_format = ResponseFormat(response_format)
+        if typed:
+            # SERIAL_NUMBER is the API's dateTimeRenderOption default for unformatted reads
+            value_render_option = ValueRenderOption.UNFORMATTED_VALUE.value
+
         # Parse URI to extract spreadsheet_id and gid
         spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
         logger.info(f"Loading table from Google Sheets: {spreadsheet_id}, gid={gid}, render_option={value_render_option}")
 
+        if columns and range_address is not None:
+            raise ValueError("columns cannot be combined with range_address")
+
         # Get sheet properties by gid (or first sheet if no gid)
-        sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+        sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+        sheet_props = sheet_context.properties
         sheet_title = sheet_props['title']
         sheet_id = sheet_props['sheetId']
 
         # Parse range address to handle worksheet!range format
         range_name, sheet_title, sheet_id = await parse_range_address(
-            service, spreadsheet_id, range_address, sheet_title, sheet_id
+            service, spreadsheet_id, range_address, sheet_title, sheet_id,
+            sheet_context=sheet_context
         )
 
-        # Read data from sheet using Google API directly
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption=value_render_option
-            ).execute
-        )
-
-        all_data = result.get('values', [])
+        query = None
+        if filters or order_by or limit is not None or offset:
+            query = RowQuery(filters, order_by, limit, offset)
+        stream = stream and bool(filters or limit is not None or offset)
+
+        if columns:
+            # Columns the query needs are fetched too, but not returned
+            extra_columns = [name for name in (query.columns if query else []) if name not in columns]
+            fetch_columns = list(columns) + extra_columns
+            rows, row_count, formatted_sample = await self._load_projected_columns(
+                service, sheet_context, fetch_columns, auto_detect_header_row, value_render_option
+            )
+            has_more = False
+            if query:
+                query.bind(fetch_columns)
+                query.feed(rows)
+                rows, has_more = query.result()
+            schema = None
+            if typed:
+                rows, schema = apply_column_types(list(columns), rows, formatted_sample)
+            data = self._rows_to_table(list(columns), rows, response_format)
+
+            source_info = {
+                "type": "google_sheets",
+                "spreadsheet_id": spreadsheet_id,
+                "original_uri": uri,
+                "worksheet": sheet_title,
+                "worksheet_url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}",
+                "row_count": row_count,
+                "column_count": len(columns),
+                "columns": list(columns)
+            }
+            if query and query.limit is not None:
+                source_info["has_more"] = has_more
+            if typed:
+                source_info["schema"] = schema
+            return TableResponse(
+                success=True,
+                table_id=f"gs_{spreadsheet_id}_{gid or '0'}",
+                name=f"Sheet: {sheet_title}",
+                shape=f"({len(rows)},{len(columns)})",
+                **self._table_fields(columns, data, response_format),
+                source_info=source_info,
+                error=None,
+                message=f"Loaded table from Google Sheets with {len(rows)} rows and {len(columns)} columns"
+            )
 
-        # Calculate sheet dimensions
-        if all_data:
-            row_count = len(all_data)
-            col_count = max(len(row) for row in all_data) if all_data else 0
+        # Read data from sheet: one request, or byte-budgeted chunks for large whole-sheet reads
+        grid_properties = sheet_context.properties.get('gridProperties')
+        if range_address is None and needs_chunked_read(grid_properties):
+            chunks = iter_sheet_value_chunks(
+                service, spreadsheet_id, sheet_title, grid_properties, value_render_option, stream=stream
+            )
         else:
-            row_count = 0
-            col_count = 0
-
-        # Process headers and data with smart detection
-        headers = []
-        data_rows = []
+            chunks = self._single_read(service, spreadsheet_id, range_name, value_render_option, stream)
+
+        # Process headers and data with smart detection, chunk by chunk
+        row_count = 0
+        col_count = 0
+        headers = None
+        header_row_idx = 0
+        header_sample = []  # Rows held back until header detection has enough of them
+        data = None
+        data_row_count = 0
+        typed_rows = []  # Typed reads infer dtypes over all rows, so they are kept raw until the end
+
+        def take(rows: list) -> None:
+            nonlocal data, data_row_count
+            # Filtered reads keep raw rows and only materialize the selection at the end
+            if query:
+                query.feed(rows)
+            elif typed:
+                if headers:
+                    typed_rows.extend(rows)
+            elif headers:
+                data = self._extend_table(data, self._rows_to_table(headers, rows, response_format))
+                data_row_count += len(rows)
+
+        async with aclosing(chunks):
+            async for rows in chunks:
+                row_count += len(rows)
+                col_count = max(col_count, max(len(row) for row in rows))
+
+                if headers is None:
+                    header_sample.extend(rows)
+                    if len(header_sample) < HEADER_SAMPLE_ROWS:
+                        continue
+                    if range_address is None and value_render_option == ValueRenderOption.FORMATTED_VALUE.value:
+                        cache_header_sample(service, spreadsheet_id, sheet_id, header_sample)
+                    header_row_idx, headers, rows = self._split_header_row(header_sample, auto_detect_header_row)
+                    header_sample = []
+                    if query and headers:
+                        query.bind(headers)
+
+                take(rows)
+                if query and query.done:
+                    # Enough matches - stop reading further chunks
+                    break
 
-        if all_data:
-            if auto_detect_header_row:
-                # Use smart header detection (analyzes first 5 rows)
-                header_row_idx, headers, data_rows = detect_header_row(all_data)
-                logger.info(f"Smart detection: header at row {header_row_idx}, {len(headers)} columns, {len(data_rows)} data rows")
-            else:
-                # Old behavior: assume row 0 is header
-                headers = [str(h) if h is not None else "" for h in all_data[0]] if all_data else []
-                data_rows = all_data[1:] if len(all_data) > 1 else []
-                logger.info(f"Manual mode: using row 0 as header")
-
-            # Ensure consistent column count
-            if headers:
-                max_cols = len(headers)
-                for row in data_rows:
-                    # Pad short rows
-                    while len(row) < max_cols:
-                        row.append("")
-                    # Truncate long rows
-                    if len(row) > max_cols:
-                        row[:] = row[:max_cols]
-
-        # Convert data from list of lists to list of dicts
-        data = []
-        if headers and data_rows:
-            for row_idx, row in enumerate(data_rows):
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    # Use the header as key, and the corresponding cell value
-                    row_dict[header] = row[i] if i < len(row) else ""
-                data.append(row_dict)
-                # Debug: Log types of first row
-                if row_idx == 0:
-                    logger.debug(f"First row data types: {[(k, type(v).__name__, repr(v)) for k, v in row_dict.items()]}")
+        if headers is None:
+            if range_address is None and value_render_option == ValueRenderOption.FORMATTED_VALUE.value:
+                cache_header_sample(service, spreadsheet_id, sheet_id, header_sample)
+            header_row_idx, headers, rows = self._split_header_row(header_sample, auto_detect_header_row)
+            if query and headers:
+                query.bind(headers)
+            take(rows)
+
+        has_more = False
+        schema = None
+        if query or typed:
+            selected, has_more = query.result() if query else (typed_rows, False)
+            if typed:
+                selected, schema = apply_column_types(
+                    headers, selected,
+                    await self._formatted_data_sample(
+                        service, sheet_context, header_row_idx, range_name if range_address is not None else None
+                    )
+                )
+            data = self._rows_to_table(headers, selected, response_format)
+            data_row_count = len(selected)
+        elif data is None:
+            data = self._rows_to_table(headers, [], response_format)
 
         # Build metadata
         metadata = {
@@ -274,27 +703,106 @@ class GoogleSheetDataTable(DataTableInterface):
             "spreadsheet_id": spreadsheet_id,
             "original_uri": uri,
             "worksheet": sheet_title,
-            "used_range": f"A1:{chr(65 + col_count - 1)}{row_count}" if row_count > 0 and col_count > 0 else "A1:A1",
+            "used_range": f"A1:{column_index_to_letter(col_count - 1)}{row_count}" if row_count > 0 and col_count > 0 else "A1:A1",
             "worksheet_url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}",
             "row_count": row_count,
             "column_count": col_count
         }
+        if query and query.limit is not None:
+            metadata["has_more"] = has_more
+        if typed:
+            metadata["schema"] = schema
 
         return TableResponse(
             success=True,
             table_id=f"gs_{spreadsheet_id}_{gid or '0'}",
             name=f"Sheet: {sheet_title}",
-            shape=f"({len(data)},{len(headers)})",
-            data=data,
+            shape=f"({data_row_count},{len(headers)})",
+            **self._table_fields(headers, data, response_format),
             source_info=metadata,
             error=None,
-            message=f"Loaded table from Google Sheets with {len(data)} rows and {len(headers)} columns"
+            message=f"Loaded table from Google Sheets with {data_row_count} rows and {len(headers)} columns"
         )
 
+    async def load_data_frame(
+        self,
+        service,  # Authenticated Google Sheets service
+        uri: str,
+        range_address: Optional[str] = None,
+        auto_detect_header_row: bool = True,
+        value_render_option: str = 'FORMATTED_VALUE',
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        output: str = 'polars',
+        typed: bool = False,
+        stream: bool = False
+    ) -> Any:
+        """
+        Load a table as a Polars DataFrame or Arrow table for in-process callers.
+
+        Same reading options as load_data_table(), but the frame is built straight from the
+        column arrays of the API values - no per-row dicts and no JSON round trip. Meant for
+        direct_call use; the MCP tools keep returning TableResponse.
+
+        Args:
+            service: Authenticated Google Sheets API service object
+            uri: Google Sheets URI
+            range_address, auto_detect_header_row, value_render_option, columns, filters,
+            order_by, limit, offset, stream: As in load_data_table()
+            output: Result type:
+                - 'polars': pl.DataFrame (default)
+                - 'arrow': pyarrow.Table
+                - 'arrow_ipc': bytes in Arrow IPC stream format, for another process
+            typed: Typed read as in load_data_table(); the frame then follows the inferred
+                schema (Int64, Float64, Boolean, Date, Datetime, Time, String - see POLARS_DTYPES)
+
+        Returns:
+            pl.DataFrame, pyarrow.Table or bytes. Columns holding non-text values (e.g. with
+            UNFORMATTED_VALUE) keep their type and empty cells become null; text columns keep "".
+
+        Example:
+            >>> df = await GoogleSheetDataTable().load_data_frame(service, uri, value_render_option="UNFORMATTED_VALUE")
+            >>> df.filter(pl.col("qty") > 10)
+        """
+        if not POLARS_AVAILABLE:
+            raise Exception("Failed to load data frame: polars is not installed")
+        if output not in DATA_FRAME_OUTPUTS:
+            raise ValueError(f"Unknown output '{output}'. Supported: {', '.join(DATA_FRAME_OUTPUTS)}")
+
+        response = await self.load_data_table(
+            service, uri, range_address, auto_detect_header_row, value_render_option,
+            columns=columns, filters=filters, order_by=order_by, limit=limit, offset=offset,
+            response_format=ResponseFormat.COLUMNS.value, typed=typed, stream=stream
+        )
+
+        schema = response.source_info.get("schema") or {}
+        series = []
+        for name, values in response.data.items():
+            if name in schema:
+                series.append(pl.Series(name, values, dtype=POLARS_DTYPES[schema[name]]))
+                continue
+            if any(not isinstance(value, str) for value in values):
+                values = [None if value == "" else value for value in values]
+            series.append(pl.Series(name, values, strict=False))
+        frame = pl.DataFrame(series)
+
+        if output == 'polars':
+            return frame
+        if output == 'arrow':
+            return frame.to_arrow()
+        buffer = io.BytesIO()
+        frame.write_ipc_stream(buffer)
+        return buffer.getvalue()
+
     async def read_worksheet_with_formulas(
         self,
         service,  # Authenticated Google Sheets service
-        uri: str
+        uri: str,
+        sheet_context: Optional[SheetContext] = None,
+        response_format: str = ResponseFormat.RECORDS.value
     ) -> Dict[str, Any]:
         """
         Read a worksheet from Google Sheets with formulas instead of calculated values.
@@ -305,29 +813,28 @@ class GoogleSheetDataTable(DataTableInterface):
         Args:
             service: Authenticated Google Sheets API service object
             uri: Google Sheets URI
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+            response_format: 'records' (default), 'rows' or 'columns' (see ResponseFormat)
 
         Returns:
             TableResponse with cell formulas (e.g., "=SUM(A1:A10)" instead of "100")
         """
+        response_format = ResponseFormat(response_format)
+
         # Parse URI to extract spreadsheet_id and gid
         spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
         logger.info(f"Loading table with formulas from Google Sheets: {spreadsheet_id}, gid={gid}")
 
         # Get sheet properties by gid (or first sheet if no gid)
-        sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+        sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+        sheet_props = sheet_context.properties
         sheet_title = sheet_props['title']
         sheet_id = sheet_props['sheetId']
 
         # Read data from sheet using FORMULA mode to get raw formulas
-        range_name = f"'{sheet_title}'!A:ZZ"
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption=ValueRenderOption.FORMULA.value
-            ).execute
-        )
+        range_name = plan_sheet_range(sheet_title, sheet_props.get('gridProperties'))
+        result = await get_cached_sheet_values(service, spreadsheet_id, range_name, ValueRenderOption.FORMULA.value)
 
         all_data = result.get('values', [])
 
@@ -348,26 +855,9 @@ class GoogleSheetDataTable(DataTableInterface):
             headers = [str(h) if h is not None else "" for h in all_data[0]] if all_data else []
             data_rows = all_data[1:] if len(all_data) > 1 else []
 
-            # Ensure consistent column count
-            if headers:
-                max_cols = len(headers)
-                for row in data_rows:
-                    # Pad short rows
-                    while len(row) < max_cols:
-                        row.append("")
-                    # Truncate long rows
-                    if len(row) > max_cols:
-                        row[:] = row[:max_cols]
-
-        # Convert data from list of lists to list of dicts
-        data = []
-        if headers and data_rows:
-            for row in data_rows:
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    # Use the header as key, and the corresponding cell value (which is now a formula if present)
-                    row_dict[header] = row[i] if i < len(row) else ""
-                data.append(row_dict)
+        # Shape rows for the response (records by default), padded/truncated to the header width
+        data = self._rows_to_table(headers, data_rows, response_format)
+        data_row_count = len(data_rows) if headers else 0
 
         # Build metadata
         metadata = {
@@ -375,7 +865,7 @@ class GoogleSheetDataTable(DataTableInterface):
             "spreadsheet_id": spreadsheet_id,
             "original_uri": uri,
             "worksheet": sheet_title,
-            "used_range": f"A1:{chr(65 + col_count - 1)}{row_count}" if row_count > 0 and col_count > 0 else "A1:A1",
+            "used_range": f"A1:{column_index_to_letter(col_count - 1)}{row_count}" if row_count > 0 and col_count > 0 else "A1:A1",
             "worksheet_url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}",
             "row_count": row_count,
             "column_count": col_count,
@@ -386,18 +876,22 @@ class GoogleSheetDataTable(DataTableInterface):
             success=True,
             table_id=f"gs_{spreadsheet_id}_{gid or '0'}_formulas",
             name=f"Sheet (Formulas): {sheet_title}",
-            shape=f"({len(data)},{len(headers)})",
-            data=data,
+            shape=f"({data_row_count},{len(headers)})",
+            **self._table_fields(headers, data, response_format),
             source_info=metadata,
             error=None,
-            message=f"Loaded table with formulas from Google Sheets with {len(data)} rows and {len(headers)} columns"
+            message=f"Loaded table with formulas from Google Sheets with {data_row_count} rows and {len(headers)} columns"
         )
 
     async def preview_worksheet_with_formulas(
         self,
         service,  # Authenticated Google Sheets service
         uri: str,
-        limit: int = 5
+        limit: int = 5,
+        sheet_context: Optional[SheetContext] = None,
+        response_format: str = ResponseFormat.RECORDS.value,
+        sample: Optional[str] = None,
+        seed: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Preview the first N rows of a worksheet with formulas (quick preview).
@@ -405,14 +899,27 @@ class GoogleSheetDataTable(DataTableInterface):
         Specifically returns formula strings instead of calculated values.
         Useful for quickly inspecting the beginning of a large sheet without loading all data.
 
+        With sample set, the N rows are instead taken as short row windows spread across the
+        used range (see plan_sample_windows) and fetched together with the header row in one
+        values().batchGet, so a representative preview of a huge sheet costs a few KB.
+
         Args:
             service: Authenticated Google Sheets API service object
             uri: Google Sheets URI
             limit: Number of data rows to preview (default: 5, max: 100)
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+            response_format: 'records' (default), 'rows' or 'columns' (see ResponseFormat)
+            sample: None for the first rows (default), 'stratified' or 'random' for windows
+                across the sheet; source_info["sample_row_numbers"] lists the rows returned
+            seed: Seed for a reproducible sample (optional)
 
         Returns:
             TableResponse with limited rows containing formulas
         """
+        response_format = ResponseFormat(response_format)
+        if sample is not None and sample not in SAMPLE_MODES:
+            raise ValueError(f"Unknown sample mode '{sample}'. Supported: {', '.join(SAMPLE_MODES)}")
+
         # Validate and cap limit
         limit = max(1, min(limit, 100))  # Between 1 and 100
 
@@ -422,23 +929,24 @@ class GoogleSheetDataTable(DataTableInterface):
         logger.info(f"Previewing worksheet formulas: {spreadsheet_id}, gid={gid}, limit={limit}")
 
         # Get sheet properties by gid (or first sheet if no gid)
-        sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+        sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+        sheet_props = sheet_context.properties
         sheet_title = sheet_props['title']
         sheet_id = sheet_props['sheetId']
 
-        # Read only the first N+1 rows (N data rows + 1 header row)
-        # Use A1 notation to limit the range: A1:ZZ{limit+1}
-        range_name = f"'{sheet_title}'!A1:ZZ{limit + 1}"
+        sample_row_numbers = None
+        if sample:
+            all_data, sample_row_numbers = await self._read_sample_windows(
+                service, sheet_context, limit, sample, seed
+            )
+        else:
+            # Read only the first N+1 rows (N data rows + 1 header row)
+            # Limit the range to the first limit+1 rows across the sheet's real column span
+            range_name = plan_sheet_range(sheet_title, sheet_props.get('gridProperties'), end_row=limit + 1)
 
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption=ValueRenderOption.FORMULA.value
-            ).execute
-        )
+            result = await get_cached_sheet_values(service, spreadsheet_id, range_name, ValueRenderOption.FORMULA.value)
 
-        all_data = result.get('values', [])
+            all_data = result.get('values', [])
 
         # Calculate dimensions
         if all_data:
@@ -457,25 +965,9 @@ class GoogleSheetDataTable(DataTableInterface):
             headers = [str(h) if h is not None else "" for h in all_data[0]] if all_data else []
             data_rows = all_data[1:] if len(all_data) > 1 else []
 
-            # Ensure consistent column count
-            if headers:
-                max_cols = len(headers)
-                for row in data_rows:
-                    # Pad short rows
-                    while len(row) < max_cols:
-                        row.append("")
-                    # Truncate long rows
-                    if len(row) > max_cols:
-                        row[:] = row[:max_cols]
-
-        # Convert data from list of lists to list of dicts
-        data = []
-        if headers and data_rows:
-            for row in data_rows:
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    row_dict[header] = row[i] if i < len(row) else ""
-                data.append(row_dict)
+        # Shape rows for the response (records by default), padded/truncated to the header width
+        data = self._rows_to_table(headers, data_rows, response_format)
+        data_row_count = len(data_rows) if headers else 0
 
         # Build metadata
         metadata = {
@@ -487,20 +979,81 @@ class GoogleSheetDataTable(DataTableInterface):
             "preview_limit": limit,
             "is_preview": True,
             "value_render_option": ValueRenderOption.FORMULA.value,
-            "row_count": len(data),
+            "row_count": data_row_count,
             "column_count": len(headers)
         }
+        if sample:
+            metadata["sample"] = sample
+            metadata["sample_row_numbers"] = sample_row_numbers
 
         return TableResponse(
             success=True,
             table_id=f"gs_{spreadsheet_id}_{gid or '0'}_preview_formulas",
             name=f"Preview (Formulas): {sheet_title}",
-            shape=f"({len(data)},{len(headers)})",
-            data=data,
+            shape=f"({data_row_count},{len(headers)})",
+            **self._table_fields(headers, data, response_format),
             source_info=metadata,
             error=None,
-            message=f"Preview loaded {len(data)} row(s) with formulas from Google Sheets (limit: {limit})"
+            message=(
+                f"Preview loaded {data_row_count} {sample} sampled row(s) with formulas from Google Sheets (limit: {limit})"
+                if sample else
+                f"Preview loaded {data_row_count} row(s) with formulas from Google Sheets (limit: {limit})"
+            )
+        )
+
+    async def _read_sample_windows(
+        self,
+        service,
+        sheet_context: SheetContext,
+        sample_rows: int,
+        mode: str,
+        seed: Optional[int] = None
+    ) -> tuple:
+        """
+        Read the header row plus sampled row windows (FORMULA render) in one batchGet.
+
+        The used range comes from the cached sheet profile when there is one, otherwise
+        from probe_data_bounds().
+
+        Returns:
+            (rows, row_numbers): header row followed by the sampled rows in sheet order, and
+            the 1-based sheet row number of each sampled row
+        """
+        spreadsheet_id = sheet_context.spreadsheet_id
+        sheet_title = sheet_context.title
+        grid_properties = sheet_context.properties.get('gridProperties')
+
+        profile = get_cached_sheet_profile(service, spreadsheet_id, sheet_context.sheet_id)
+        if profile is not None:
+            last_row = profile_last_row(profile)
+        else:
+            last_row, _ = await probe_data_bounds(service, spreadsheet_id, sheet_title, grid_properties)
+
+        windows = plan_sample_windows(2, last_row, sample_rows, mode=mode, seed=seed)
+        ranges = [plan_sheet_range(sheet_title, grid_properties, end_row=1)] + [
+            plan_sheet_range(sheet_title, grid_properties, start_row=first, end_row=last)
+            for first, last in windows
+        ]
+        logger.info(f"Sampling {sample_rows} of {max(last_row - 1, 0)} rows in {len(windows)} window(s) ({mode})")
+
+        result = await asyncio.to_thread(
+            service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                valueRenderOption=ValueRenderOption.FORMULA.value
+            ).execute
         )
+        value_ranges = result.get('valueRanges', [])
+        rows = value_ranges[0].get('values', [])[:1] if value_ranges else []
+        if not rows:
+            return [], []
+
+        row_numbers = []
+        for (first, _), value_range in zip(windows, value_ranges[1:]):
+            window = value_range.get('values', [])
+            rows.extend(window)
+            row_numbers.extend(range(first, first + len(window)))
+        return rows, row_numbers
 
     async def write_new_sheet(
         self,
@@ -540,13 +1093,13 @@ class GoogleSheetDataTable(DataTableInterface):
 
             # Prepare data for Google Sheets API
             # Serialize nested structures (lists/dicts) to JSON strings
-            # Convert other types to strings (Google Sheets API requirement)
+            # Numbers and booleans stay typed, other values become text
             from datatable_tools.google_sheets_helpers import serialize_row
 
             values = [serialize_row(row) for row in final_data]
 
-            # Convert to strings after serialization
-            values = [[str(cell) if cell is not None else "" for cell in row] for row in values]
+            # Encode cells after serialization
+            values = [encode_write_row(row) for row in values]
 
             # Prepare write data with headers
             write_data = []
@@ -625,9 +1178,7 @@ class GoogleSheetDataTable(DataTableInterface):
             logger.info(f"Creating worksheet '{worksheet_name}' in spreadsheet {spreadsheet_id}")
 
             # Get current worksheets
-            metadata = await asyncio.to_thread(
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-            )
+            metadata = await get_spreadsheet_metadata(service, spreadsheet_id)
             sheets = metadata.get('sheets', [])
 
             # Check if worksheet with this name already exists
@@ -657,6 +1208,7 @@ class GoogleSheetDataTable(DataTableInterface):
                     }]
                 }
 
+                mark_spreadsheet_modified(service, spreadsheet_id)
                 add_result = await asyncio.to_thread(
                     service.spreadsheets().batchUpdate(
                         spreadsheetId=spreadsheet_id,
@@ -667,6 +1219,9 @@ class GoogleSheetDataTable(DataTableInterface):
                 worksheet_id = add_result['replies'][0]['addSheet']['properties']['sheetId']
                 logger.info(f"Successfully created worksheet '{worksheet_name}' with ID {worksheet_id}")
 
+                # Worksheet list changed, cached metadata is stale
+                invalidate_spreadsheet_metadata(service, spreadsheet_id)
+
             # Process input data (handles both 2D array and list of dicts)
             extracted_headers, data_rows = process_data_input(data)
 
@@ -687,8 +1242,8 @@ class GoogleSheetDataTable(DataTableInterface):
 
             values = [serialize_row(row) for row in final_data]
 
-            # Convert to strings after serialization
-            values = [[str(cell) if cell is not None else "" for cell in row] for row in values]
+            # Encode cells after serialization
+            values = [encode_write_row(row) for row in values]
 
             # Prepare write data with headers
             write_data = []
@@ -700,6 +1255,7 @@ class GoogleSheetDataTable(DataTableInterface):
             if write_data:
                 range_name = f"'{worksheet_name}'!A1"
                 body = {'values': write_data}
+                mark_spreadsheet_modified(service, spreadsheet_id)
                 await asyncio.to_thread(
                     service.spreadsheets().values().update(
                         spreadsheetId=spreadsheet_id,
@@ -735,44 +1291,56 @@ class GoogleSheetDataTable(DataTableInterface):
         self,
         service,  # Authenticated Google Sheets service
         uri: str,
-        data: List[List[Any]]
+        data: List[List[Any]],
+        sheet_context: Optional[SheetContext] = None,
+        insert_data_option: str = 'OVERWRITE',
+        coalesce: bool = False
     ) -> Dict[str, Any]:
         """
         Append data as new rows below existing data in Google Sheets.
 
         Implementation of DataTableInterface.append_rows() for Google Sheets.
 
-        Automatically resizes the sheet if the append operation would exceed grid limits.
+        Rows go below the last row with data in any column and start at column A, found by
+        probing a few small windows (see probe_data_bounds) instead of downloading the sheet.
+        The write is a values.append anchored at that row: appends racing for the same anchor
+        are stacked by the API's table detection rather than overwriting each other. Rows are
+        added to the grid by the API as needed; columns are grown up front (from cached grid
+        size) if the data is wider than the sheet.
 
         Args:
             service: Authenticated Google Sheets API service object
             uri: Google Sheets URI
             data: 2D array of row data to append or list of dicts (DataFrame-like)
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+            insert_data_option: How the input data should be inserted:
+                - 'OVERWRITE': Write into the empty rows after the data (default)
+                - 'INSERT_ROWS': Insert new rows for the data, shifting anything below down
+            coalesce: Merge with other coalesced appends to the same worksheet (and insert
+                option) arriving within APPEND_COALESCE_WINDOW into one ordered values.append
+                (see coalesce_append). Each call still reports its own rows' range.
+
+        Returns:
+            UpdateResponse whose range is the appended range reported by the API
         """
         try:
+            # Validate insert mode early (raises ValueError for unknown options)
+            insert_data_option = InsertDataOption(insert_data_option).value
+
             # Parse URI to extract spreadsheet_id and gid
             spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
             # Get sheet properties by gid (or first sheet if no gid)
-            sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            sheet_props = sheet_context.properties
             sheet_title = sheet_props['title']
             sheet_id = sheet_props['sheetId']
 
             # Get current grid dimensions from sheet properties
-            metadata = await asyncio.to_thread(
-                service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute
-            )
-            sheets = metadata.get('sheets', [])
-            current_grid_row_count = 1000  # Default fallback
-            current_grid_col_count = 26    # Default fallback
-
-            for sheet in sheets:
-                if sheet.get('properties', {}).get('sheetId') == sheet_id:
-                    grid_props = sheet.get('properties', {}).get('gridProperties', {})
-                    current_grid_row_count = grid_props.get('rowCount', 1000)
-                    current_grid_col_count = grid_props.get('columnCount', 100)
-                    logger.info(f"Current grid dimensions: {current_grid_row_count} rows x {current_grid_col_count} columns")
-                    break
+            grid_props = sheet_props.get('gridProperties', {})
+            current_grid_row_count = grid_props.get('rowCount', 1000)
+            current_grid_col_count = grid_props.get('columnCount', 100)
+            logger.info(f"Current grid dimensions: {current_grid_row_count} rows x {current_grid_col_count} columns")
 
             # Process input data (handles both 2D array and list of dicts)
             extracted_headers, data_rows = process_data_input(data)
@@ -786,55 +1354,20 @@ class GoogleSheetDataTable(DataTableInterface):
                 # For append_rows, we only write data rows, not headers
                 values_to_write = processed_rows if detected_headers else data_rows
 
-            # Convert to strings for Google Sheets API
-            values = [[str(cell) if cell is not None else "" for cell in row] for row in values_to_write]
+            # Encode cells for Google Sheets API (numbers and booleans stay typed)
+            values = [encode_write_row(row) for row in values_to_write]
 
             if not values:
                 values = [[""]]
 
-            # Get current data to determine last row
-            range_name = f"'{sheet_title}'!A:ZZ"
-            result = await asyncio.to_thread(
-                service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name,
-                    valueRenderOption=ValueRenderOption.FORMATTED_VALUE.value
-                ).execute
-            )
-
-            all_data = result.get('values', [])
-            row_count = len(all_data)
-
-            # Calculate append position (start from next row after last data)
-            start_row = row_count + 1
-            start_col = "A"
-            end_row = start_row + len(values) - 1
-            end_col_index = len(values[0]) - 1 if values else 0
-            end_col = column_index_to_letter(end_col_index)
-
-            # Check if we need to resize the sheet
-            rows_to_append = len(values)
-            required_row_count = row_count + rows_to_append
-            required_col_count = end_col_index + 1
-
-            need_resize = False
-            new_row_count = current_grid_row_count
+            # Only columns need to be grown up front - values.append adds rows itself
+            required_col_count = max(len(row) for row in values)
+            need_resize = required_col_count > current_grid_col_count
             new_col_count = current_grid_col_count
 
-            if required_row_count > current_grid_row_count:
-                # Add buffer for future operations (1000 rows)
-                new_row_count = required_row_count + 1000
-                need_resize = True
-                logger.info(f"Sheet resize needed: rows {current_grid_row_count} -> {new_row_count}")
-
-            if required_col_count > current_grid_col_count:
+            if need_resize:
                 # Add buffer for future operations (10 columns)
                 new_col_count = required_col_count + 10
-                need_resize = True
-                logger.info(f"Sheet resize needed: columns {current_grid_col_count} -> {new_col_count}")
-
-            # Resize the sheet if needed
-            if need_resize:
                 resize_request = {
                     "requests": [
                         {
@@ -842,45 +1375,80 @@ class GoogleSheetDataTable(DataTableInterface):
                                 "properties": {
                                     "sheetId": sheet_id,
                                     "gridProperties": {
-                                        "rowCount": new_row_count,
                                         "columnCount": new_col_count
                                     }
                                 },
-                                "fields": "gridProperties.rowCount,gridProperties.columnCount"
+                                "fields": "gridProperties.columnCount"
                             }
                         }
                     ]
                 }
 
-                logger.info(f"Resizing sheet '{sheet_title}' to {new_row_count} rows x {new_col_count} columns")
+                logger.info(f"Resizing sheet '{sheet_title}' columns {current_grid_col_count} -> {new_col_count}")
+                mark_spreadsheet_modified(service, spreadsheet_id)
                 await asyncio.to_thread(
                     service.spreadsheets().batchUpdate(
                         spreadsheetId=spreadsheet_id,
                         body=resize_request
                     ).execute
                 )
-                logger.info("Sheet successfully resized")
-
-            # Create range address
-            range_address = f"{start_col}{start_row}:{end_col}{end_row}"
-            full_range = f"'{sheet_title}'!{range_address}"
+                sheet_context.update_grid(service, column_count=new_col_count)
+
+            async def send(rows: list) -> dict:
+                # Anchor below the last row with data: a whole-sheet range would let the API's
+                # table detection pick the first table instead (stopping at blank rows, or
+                # starting at the table's first column rather than A)
+                last_row = await get_last_row_with_data(
+                    service, spreadsheet_id, sheet_title, grid_properties=sheet_props.get('gridProperties')
+                )
+                anchor_range = f"{quote_sheet_title(sheet_title)}!A{last_row + 1}"
+                mark_spreadsheet_modified(service, spreadsheet_id)
+                result = await asyncio.to_thread(
+                    service.spreadsheets().values().append(
+                        spreadsheetId=spreadsheet_id,
+                        range=anchor_range,
+                        valueInputOption=ValueInputOption.USER_ENTERED.value,
+                        insertDataOption=insert_data_option,
+                        body={'values': rows}
+                    ).execute
+                )
 
-            # Append data
-            body = {'values': values}
-            await asyncio.to_thread(
-                service.spreadsheets().values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=full_range,
-                    valueInputOption=ValueInputOption.USER_ENTERED.value,
-                    body=body
-                ).execute
-            )
+                # Keep cached grid size in sync with rows the API added
+                end_row_match = re.search(r'(\d+)$', result.get('updates', {}).get('updatedRange', ''))
+                if end_row_match:
+                    end_row = int(end_row_match.group(1))
+                    if insert_data_option == InsertDataOption.INSERT_ROWS.value:
+                        sheet_context.update_grid(service, row_count=current_grid_row_count + len(rows))
+                    elif end_row > current_grid_row_count:
+                        sheet_context.update_grid(service, row_count=end_row)
+                return result
+
+            if coalesce:
+                result, offset = await coalesce_append(
+                    service, (spreadsheet_id, sheet_id, insert_data_option), values, send
+                )
+            else:
+                result, offset = await send(values), 0
+
+            # Report the range the API actually wrote to (e.g. "'Sheet1'!A101:C102")
+            updates = result.get('updates', {})
+            updated_range = updates.get('updatedRange', '')
+            range_address = updated_range.split('!', 1)[-1] if updated_range else ''
+            updated_cells = updates.get('updatedCells', sum(len(row) for row in values))
+
+            start_match = re.match(r'^([A-Z]+)(\d+)', range_address)
+            if coalesce and start_match:
+                # This call's rows within the merged append
+                first_row = int(start_match.group(2)) + offset
+                end_col = column_index_to_letter(column_letter_to_index(start_match.group(1)) + required_col_count - 1)
+                range_address = f"{start_match.group(1)}{first_row}:{end_col}{first_row + len(values) - 1}"
+                updated_cells = sum(len(row) for row in values)
 
             spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
 
             message = f"Successfully appended rows at {range_address} in worksheet '{sheet_title}'"
             if need_resize:
-                message += f" (sheet auto-resized to {new_row_count} rows x {new_col_count} columns)"
+                message += f" (sheet auto-resized to {new_col_count} columns)"
 
             return UpdateResponse(
                 success=True,
@@ -888,7 +1456,7 @@ class GoogleSheetDataTable(DataTableInterface):
                 spreadsheet_id=spreadsheet_id,
                 worksheet=sheet_title,
                 range=range_address,
-                updated_cells=sum(len(row) for row in values),
+                updated_cells=updated_cells,
                 shape=f"({len(values)},{len(values[0]) if values else 0})",
                 error=None,
                 message=message
@@ -902,7 +1470,8 @@ class GoogleSheetDataTable(DataTableInterface):
         self,
         service,  # Authenticated Google Sheets service
         uri: str,
-        data: List[List[Any]]
+        data: List[List[Any]],
+        sheet_context: Optional[SheetContext] = None
     ) -> Dict[str, Any]:
         """
         Append data as new columns to the right of existing data in Google Sheets.
@@ -920,25 +1489,21 @@ class GoogleSheetDataTable(DataTableInterface):
             service: Authenticated Google Sheets API service object
             uri: Google Sheets URI
             data: 2D array of column data to append or list of dicts (DataFrame-like)
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
         """
         try:
             # Parse URI to extract spreadsheet_id and gid
             spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
             # Get sheet properties by gid (or first sheet if no gid)
-            sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            sheet_props = sheet_context.properties
             sheet_title = sheet_props['title']
             sheet_id = sheet_props['sheetId']
 
             # Read existing sheet data to get current column headers
-            range_name = f"'{sheet_title}'!A:ZZ"
-            result = await asyncio.to_thread(
-                service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_name,
-                    valueRenderOption=ValueRenderOption.FORMATTED_VALUE.value
-                ).execute
-            )
+            range_name = plan_sheet_range(sheet_title, sheet_props.get('gridProperties'))
+            result = await get_sheet_values(service, spreadsheet_id, range_name, ValueRenderOption.FORMATTED_VALUE.value)
 
             all_data = result.get('values', [])
 
@@ -1049,8 +1614,8 @@ class GoogleSheetDataTable(DataTableInterface):
                 filtered_row = [row[idx] if idx < len(row) else "" for idx in new_column_indices]
                 filtered_data.append(filtered_row)
 
-            # Convert to strings for Google Sheets API
-            values_only = [[str(cell) if cell is not None else "" for cell in row] for row in filtered_data]
+            # Encode cells for Google Sheets API (numbers and booleans stay typed)
+            values_only = [encode_write_row(row) for row in filtered_data]
 
             # Prepare write data with headers (only new columns)
             values = []
@@ -1078,6 +1643,7 @@ class GoogleSheetDataTable(DataTableInterface):
 
             # Append data
             body = {'values': values}
+            mark_spreadsheet_modified(service, spreadsheet_id)
             await asyncio.to_thread(
                 service.spreadsheets().values().update(
                     spreadsheetId=spreadsheet_id,
@@ -1116,7 +1682,9 @@ class GoogleSheetDataTable(DataTableInterface):
         data: List[List[Any]],
         range_address: Optional[str] = None,
         value_input_option: str = 'USER_ENTERED',
-        include_header: bool = True
+        include_header: bool = True,
+        sheet_context: Optional[SheetContext] = None,
+        diff: bool = False
     ) -> Dict[str, Any]:
         """
         Writes cell values to a Google Sheets range, replacing existing content.
@@ -1137,66 +1705,51 @@ class GoogleSheetDataTable(DataTableInterface):
                 - 'USER_ENTERED': Values are parsed as if typed by user (formulas, numbers, dates parsed)
                 Default is 'USER_ENTERED'.
             include_header: If False (default), uses auto-detection to skip headers. If True, always includes headers.
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+            diff: Read the target window once (entered and display values, see
+                get_formula_and_formatted_values) and only write the cells that change,
+                grouped into contiguous rectangles (see plan_changed_blocks).
+                updated_cells then counts the written cells and skipped_cells the
+                unchanged ones; nothing is written when no cell changes.
         """
         try:
             # Parse URI to extract spreadsheet_id and gid
             spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
             # Get sheet properties by gid (or first sheet if no gid)
-            sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            sheet_props = sheet_context.properties
             sheet_title = sheet_props['title']
             sheet_id = sheet_props['sheetId']
 
-            # Load original data to detect if it has headers
-            # Read from the specific range being updated (or entire sheet if no range specified)
-            if range_address:
-                # Extract column range from range_address for header detection
-                # Examples: "I1:K10" -> "I:K", "A1" -> "A:ZZ", "2:10" -> "A:ZZ"
-                import re
-                if ':' in range_address:
-                    # Parse range like "I1:K10" or "I:K"
-                    start_part, end_part = range_address.split(':', 1)
-                    # Extract column letters
+            # Leading rows of the target's column span, to detect if the original data has headers.
+            # auto_detect_headers only looks at the first two rows, so the worksheet's cached header
+            # sample is enough; with include_header=True the result is not used and nothing is read.
+            original_has_headers = False
+            if not include_header:
+                header_rows = await get_header_sample(
+                    service, spreadsheet_id, sheet_title, sheet_id, sheet_props.get('gridProperties')
+                )
+                column_span = None
+                if range_address:
+                    # Examples: "I1:K10" -> I:K, "A1" -> A:A, "2:10" -> whole width
+                    start_part, end_part = range_address.split(':', 1) if ':' in range_address else (range_address, range_address)
                     start_col_match = re.match(r'^([A-Z]+)', start_part)
                     end_col_match = re.match(r'^([A-Z]+)', end_part)
-
                     if start_col_match and end_col_match:
-                        # Column range detected (e.g., "I1:K10" or "I:K")
-                        start_col = start_col_match.group(1)
-                        end_col = end_col_match.group(1)
-                        detection_range = f"'{sheet_title}'!{start_col}:{end_col}"
-                    else:
-                        # Row range like "2:10" - use entire sheet
-                        detection_range = f"'{sheet_title}'!A:ZZ"
-                else:
-                    # Single cell like "A1" - extract column and read that column
-                    col_match = re.match(r'^([A-Z]+)', range_address)
-                    if col_match:
-                        col = col_match.group(1)
-                        detection_range = f"'{sheet_title}'!{col}:{col}"
-                    else:
-                        detection_range = f"'{sheet_title}'!A:ZZ"
-            else:
-                detection_range = f"'{sheet_title}'!A:ZZ"
-
-            result = await asyncio.to_thread(
-                service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=detection_range,
-                    valueRenderOption=ValueRenderOption.FORMATTED_VALUE.value
-                ).execute
-            )
-            original_data = result.get('values', [])
-            logger.info(f"Header detection reading from range: {detection_range}")
+                        column_span = (
+                            column_letter_to_index(start_col_match.group(1)),
+                            column_letter_to_index(end_col_match.group(1)) + 1
+                        )
+                original_data = [row[slice(*column_span)] for row in header_rows] if column_span else header_rows
+                logger.info(f"Header detection on the first {len(header_rows)} rows (columns {column_span or 'all'})")
 
-            # Detect if original data has headers
-            original_has_headers = False
-            if original_data:
-                detected_headers, _ = auto_detect_headers(original_data)
-                original_has_headers = bool(detected_headers)
-                logger.info(f"Original data header detection: {original_has_headers}")
-                if original_has_headers:
-                    logger.info(f"Detected original headers: {detected_headers}")
+                if original_data:
+                    detected_headers, _ = auto_detect_headers(original_data)
+                    original_has_headers = bool(detected_headers)
+                    logger.info(f"Original data header detection: {original_has_headers}")
+                    if original_has_headers:
+                        logger.info(f"Detected original headers: {detected_headers}")
 
             # Process input data (handles both 2D array and list of dicts)
             extracted_headers, data_rows = process_data_input(data)
@@ -1221,13 +1774,13 @@ class GoogleSheetDataTable(DataTableInterface):
 
                 if skip_header_for_update:
                     # Skip headers - only write data rows
-                    values = [[str(cell) if cell is not None else "" for cell in row] for row in data_rows]
+                    values = [encode_write_row(row) for row in data_rows]
                     logger.info(f"[include_header=False] Skipping extracted headers from list of dicts: {extracted_headers}")
                     logger.info(f"[include_header=False] Writing {len(data_rows)} data rows only (no header row)")
                 else:
                     # Include headers
                     values = [[str(h) for h in extracted_headers]]
-                    values.extend([[str(cell) if cell is not None else "" for cell in row] for row in data_rows])
+                    values.extend([encode_write_row(row) for row in data_rows])
                     if include_header:
                         logger.info(f"[include_header=True] Including extracted headers from list of dicts: {extracted_headers}")
                     else:
@@ -1246,18 +1799,18 @@ class GoogleSheetDataTable(DataTableInterface):
                 if detected_headers and not skip_header_for_update:
                     # Include detected headers
                     values = [[str(h) for h in detected_headers]]
-                    values.extend([[str(cell) if cell is not None else "" for cell in row] for row in processed_rows])
+                    values.extend([encode_write_row(row) for row in processed_rows])
                     if include_header:
                         logger.info(f"[include_header=True] Including detected headers in output: {detected_headers}")
                     else:
                         logger.info(f"[include_header=False, no auto-skip] Including detected headers in output: {detected_headers}")
                 elif detected_headers and skip_header_for_update:
                     # Skip header row (include_header=False and both original & new data have headers)
-                    values = [[str(cell) if cell is not None else "" for cell in row] for row in processed_rows]
+                    values = [encode_write_row(row) for row in processed_rows]
                     logger.info(f"[include_header=False] Skipping detected headers in new data: {detected_headers}")
                 else:
                     # No headers detected in new data - use all data rows as-is
-                    values = [[str(cell) if cell is not None else "" for cell in row] for row in data_rows]
+                    values = [encode_write_row(row) for row in data_rows]
 
             if not values:
                 values = [[""]]
@@ -1265,7 +1818,8 @@ class GoogleSheetDataTable(DataTableInterface):
             # Parse worksheet name from range_address if present (e.g., "Sheet1!A1:J6")
             # This returns the basic parsed range, we'll auto-expand it next
             _, parsed_sheet_title, parsed_sheet_id = await parse_range_address(
-                service, spreadsheet_id, range_address, sheet_title, sheet_id
+                service, spreadsheet_id, range_address, sheet_title, sheet_id,
+                sheet_context=sheet_context
             )
 
             # Extract just the range part (without sheet name) for auto-expansion
@@ -1340,60 +1894,51 @@ class GoogleSheetDataTable(DataTableInterface):
             # Create full range notation
             full_range = f"'{sheet_title}'!{final_range}"
 
-            # Batch processing for large datasets to avoid API limits
-            # Google Sheets API: 2MB recommended max, 180s timeout per request
-            # For large datasets (>2000 rows), split into batches to stay under limits
-            BATCH_SIZE = 2000  # rows per batch (conservative for safety)
-            total_rows = len(values)
-
-            if total_rows > BATCH_SIZE:
-                logger.info(f"Large dataset detected ({total_rows} rows). Using batch processing with batch size {BATCH_SIZE}")
+            # Payloads over the API's recommended ~2MB are split into byte-budgeted ValueRanges
+            # and sent as concurrent values().batchUpdate requests (see plan_write_requests)
+            payload_bytes = sum(map(estimate_row_bytes, values))
+            updated_cells = sum(len(row) for row in values)
+            skipped_cells = None
 
+            if diff or payload_bytes > WRITE_REQUEST_BYTES:
                 # Parse the start cell from final_range
                 match = re.match(r'^([A-Z]+)(\d+)(?::.*)?$', final_range)
                 if not match:
                     raise ValueError(f"Invalid range format for batch processing: {final_range}")
 
-                start_col = match.group(1)
+                start_col_index = column_letter_to_index(match.group(1))
                 start_row = int(match.group(2))
 
-                # Calculate end column based on data width
-                cols = max(len(row) for row in values) if values else 0
-                start_col_index = column_letter_to_index(start_col)
-                end_col_index = start_col_index + cols - 1
-                end_col = column_index_to_letter(end_col_index)
-
-                # Process in batches
-                for batch_idx in range(0, total_rows, BATCH_SIZE):
-                    batch_end_idx = min(batch_idx + BATCH_SIZE, total_rows)
-                    batch_values = values[batch_idx:batch_end_idx]
-                    batch_rows = len(batch_values)
-
-                    # Calculate batch range
-                    batch_start_row = start_row + batch_idx
-                    batch_end_row = batch_start_row + batch_rows - 1
-                    batch_range = f"'{sheet_title}'!{start_col}{batch_start_row}:{end_col}{batch_end_row}"
-
-                    logger.info(f"Processing batch {batch_idx//BATCH_SIZE + 1}/{(total_rows-1)//BATCH_SIZE + 1}: rows {batch_start_row}-{batch_end_row} ({batch_rows} rows)")
-
-                    # Update batch
-                    body = {'values': batch_values}
-                    await asyncio.to_thread(
-                        service.spreadsheets().values().update(
-                            spreadsheetId=spreadsheet_id,
-                            range=batch_range,
-                            valueInputOption=value_input_option,
-                            body=body
-                        ).execute
+            if diff:
+                # Compare against the current window and write only the changed rectangles
+                end_col = column_index_to_letter(start_col_index + max(max(len(row) for row in values), 1) - 1)
+                window = f"{quote_sheet_title(sheet_title)}!{match.group(1)}{start_row}:{end_col}{start_row + len(values) - 1}"
+                current_values, current_formatted = await get_formula_and_formatted_values(service, spreadsheet_id, window)
+                if value_input_option != ValueInputOption.USER_ENTERED.value:
+                    # RAW stores the text as is, so only an identical entered value is unchanged
+                    current_formatted = None
+                blocks, skipped_cells = plan_changed_blocks(values, current_values, current_formatted)
+                updated_cells -= skipped_cells
+                logger.info(f"Diff write: {updated_cells} changed cells in {len(blocks)} rectangles, {skipped_cells} unchanged")
+
+                if blocks:
+                    requests = plan_write_requests(
+                        sheet_title, [(start_row + r, start_col_index + c, rows) for r, c, rows in blocks]
                     )
+                    await write_value_ranges(service, spreadsheet_id, requests, value_input_option)
+            elif payload_bytes > WRITE_REQUEST_BYTES:
+                requests = plan_write_requests(sheet_title, [(start_row, start_col_index, values)])
+                logger.info(f"Large dataset detected ({len(values)} rows, ~{payload_bytes} bytes). Writing in {len(requests)} batch requests")
 
-                logger.info(f"Batch processing completed: {total_rows} rows updated in {(total_rows-1)//BATCH_SIZE + 1} batches")
+                await write_value_ranges(service, spreadsheet_id, requests, value_input_option)
+                logger.info(f"Batch processing completed: {len(values)} rows updated in {len(requests)} requests")
             else:
                 # Small dataset - single API call
                 # Use value_input_option parameter to control how data is interpreted:
                 # - RAW: literal text (default for backwards compatibility)
                 # - USER_ENTERED: parses formulas, numbers, dates, etc.
                 body = {'values': values}
+                mark_spreadsheet_modified(service, spreadsheet_id)
                 await asyncio.to_thread(
                     service.spreadsheets().values().update(
                         spreadsheetId=spreadsheet_id,
@@ -1415,10 +1960,13 @@ class GoogleSheetDataTable(DataTableInterface):
                 spreadsheet_id=spreadsheet_id,
                 worksheet=sheet_title,
                 range=final_range,
-                updated_cells=sum(len(row) for row in values),
+                updated_cells=updated_cells,
+                skipped_cells=skipped_cells,
                 shape=f"({len(values)},{len(values[0]) if values else 0})",
                 error=None,
-                message=f"Successfully updated range {final_range} in worksheet '{sheet_title}'"
+                message=f"Successfully updated range {final_range} in worksheet '{sheet_title}'" + (
+                    f" ({updated_cells} cells written, {skipped_cells} unchanged cells skipped)" if diff else ""
+                )
             )
 
         except Exception as e:
@@ -1432,7 +1980,8 @@ class GoogleSheetDataTable(DataTableInterface):
         image_url: str,
         cell_address: str,
         width_pixels: int = 400,
-        height_pixels: int = 300
+        height_pixels: int = 300,
+        sheet_context: Optional[SheetContext] = None
     ) -> Dict[str, Any]:
         """
         Insert an image into a cell using IMAGE formula (mode 4) and auto-resize the cell.
@@ -1448,6 +1997,7 @@ class GoogleSheetDataTable(DataTableInterface):
             cell_address: Cell address in A1 notation (e.g., "A1", "B5", "C10")
             width_pixels: Image and cell width in pixels (default: 400)
             height_pixels: Image and cell height in pixels (default: 300)
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
 
         Returns:
             Dict with success status and details
@@ -1463,7 +2013,8 @@ class GoogleSheetDataTable(DataTableInterface):
             spreadsheet_id, gid = parse_google_sheets_uri(uri)
 
             # Get sheet properties by gid
-            sheet_props = await get_sheet_by_gid(service, spreadsheet_id, gid)
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            sheet_props = sheet_context.properties
             sheet_id = sheet_props['sheetId']
             sheet_title = sheet_props['title']
 
@@ -1488,6 +2039,7 @@ class GoogleSheetDataTable(DataTableInterface):
             # Use update_range to insert the formula
             range_name = f"'{sheet_title}'!{cell_address}"
             body = {'values': [[image_formula]]}
+            mark_spreadsheet_modified(service, spreadsheet_id)
             await asyncio.to_thread(
                 service.spreadsheets().values().update(
                     spreadsheetId=spreadsheet_id,
@@ -1533,6 +2085,7 @@ class GoogleSheetDataTable(DataTableInterface):
 
             # Execute batch update for resizing
             resize_body = {"requests": resize_requests}
+            mark_spreadsheet_modified(service, spreadsheet_id)
             await asyncio.to_thread(
                 service.spreadsheets().batchUpdate(
                     spreadsheetId=spreadsheet_id,
@@ -1561,13 +2114,297 @@ class GoogleSheetDataTable(DataTableInterface):
             logger.error(f"Error inserting image in {uri}: {e}")
             raise Exception(f"Failed to insert image in {uri}: {e}") from e
 
+    def _compile_batch_operation(
+        self,
+        index: int,
+        operation: Dict[str, Any],
+        sheet_context: SheetContext,
+        grids: Dict[int, list]
+    ) -> tuple:
+        """
+        Translate one batch() operation into spreadsheets().batchUpdate requests.
+
+        grids holds [row_count, column_count] per sheetId as the batch will have left it;
+        rows/columns are appended (appendDimension) before writes that would not fit.
+
+        Returns:
+            (requests, BatchOperationResult)
+        """
+        kind = operation.get('op')
+        if kind not in BATCH_OPERATIONS:
+            raise ValueError(f"Operation {index}: unknown op '{kind}'. Supported: {', '.join(BATCH_OPERATIONS)}")
+
+        worksheet = operation.get('worksheet')
+        properties = sheet_context.get_sheet_by_title(worksheet) if worksheet else sheet_context.properties
+        if properties is None:
+            raise ValueError(f"Operation {index}: worksheet '{worksheet}' not found")
+        sheet_id = properties['sheetId']
+        grid = grids.setdefault(sheet_id, [
+            properties.get('gridProperties', {}).get('rowCount', 1000),
+            properties.get('gridProperties', {}).get('columnCount', 26)
+        ])
+        missing = [name for name in BATCH_REQUIRED_FIELDS.get(kind, ()) if operation.get(name) is None]
+        if missing:
+            raise ValueError(f"Operation {index} ({kind}): missing {', '.join(missing)}")
+        requests = []
+
+        def parse_cell(address: str) -> tuple:
+            match = re.match(r'^([A-Z]+)(\d+)(?::.*)?$', address.upper())
+            if not match:
+                raise ValueError(f"Operation {index}: invalid cell address '{address}'. Expected format like 'A1', 'B5'")
+            return int(match.group(2)) - 1, column_letter_to_index(match.group(1))
+
+        def ensure_grid(row_count: int, column_count: int) -> None:
+            for dimension, position, needed in (('ROWS', 0, row_count), ('COLUMNS', 1, column_count)):
+                if needed > grid[position]:
+                    requests.append({'appendDimension': {
+                        'sheetId': sheet_id, 'dimension': dimension, 'length': needed - grid[position]
+                    }})
+                    grid[position] = needed
+
+        if kind in ('update_range', 'append_rows'):
+            extracted_headers, data_rows = process_data_input(operation['data'])
+            if kind == 'update_range':
+                include_header = operation.get('include_header', True)
+                values = ([list(extracted_headers)] if extracted_headers and include_header else []) + data_rows
+            elif extracted_headers:
+                values = data_rows
+            else:
+                # Like append_rows: a detected header row in a 2D array is not appended
+                detected_headers, processed_rows = auto_detect_headers(data_rows)
+                values = processed_rows if detected_headers else data_rows
+            if not values:
+                raise ValueError(f"Operation {index}: no data to write")
+            width = max(len(row) for row in values)
+            updated_cells = sum(len(row) for row in values)
+
+            if kind == 'append_rows':
+                # appendCells writes below the last row with data and adds rows itself
+                ensure_grid(0, width)
+                requests.append({'appendCells': {
+                    'sheetId': sheet_id, 'rows': encode_row_data(values), 'fields': 'userEnteredValue'
+                }})
+                return requests, BatchOperationResult(
+                    index=index, op=kind, worksheet=properties['title'], updated_cells=updated_cells,
+                    message=f"Appended {len(values)} rows"
+                )
+
+            row_index, col_index = parse_cell(operation.get('range_address') or "A1")
+            ensure_grid(row_index + len(values), col_index + width)
+            requests.append({'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': row_index, 'columnIndex': col_index},
+                'rows': encode_row_data(values),
+                'fields': 'userEnteredValue'
+            }})
+            range_address = (
+                f"{column_index_to_letter(col_index)}{row_index + 1}:"
+                f"{column_index_to_letter(col_index + width - 1)}{row_index + len(values)}"
+            )
+            return requests, BatchOperationResult(
+                index=index, op=kind, worksheet=properties['title'], range=range_address,
+                updated_cells=updated_cells, message=f"Updated range {range_address}"
+            )
+
+        if kind == 'insert_image':
+            cell_address = operation['cell_address']
+            row_index, col_index = parse_cell(cell_address)
+            width_pixels = operation.get('width_pixels', 400)
+            height_pixels = operation.get('height_pixels', 300)
+            ensure_grid(row_index + 1, col_index + 1)
+            image_formula = f'=IMAGE("{operation["image_url"]}", 4, {height_pixels}, {width_pixels})'
+            requests.append({'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': row_index, 'columnIndex': col_index},
+                'rows': encode_row_data([[image_formula]]),
+                'fields': 'userEnteredValue'
+            }})
+            for dimension, position, pixel_size in (('ROWS', row_index, height_pixels), ('COLUMNS', col_index, width_pixels)):
+                requests.append({'updateDimensionProperties': {
+                    'range': {'sheetId': sheet_id, 'dimension': dimension, 'startIndex': position, 'endIndex': position + 1},
+                    'properties': {'pixelSize': pixel_size},
+                    'fields': 'pixelSize'
+                }})
+            return requests, BatchOperationResult(
+                index=index, op=kind, worksheet=properties['title'], range=cell_address.upper(), updated_cells=1,
+                message=f"Inserted {width_pixels}x{height_pixels}px image in cell {cell_address.upper()}"
+            )
+
+        if kind == 'resize_dimension':
+            dimension = operation.get('dimension', 'ROWS').upper()
+            if dimension not in ('ROWS', 'COLUMNS'):
+                raise ValueError(f"Operation {index}: dimension must be 'ROWS' or 'COLUMNS'")
+            start_index = operation.get('start_index', 0)
+            end_index = operation.get('end_index', start_index + 1)
+            requests.append({'updateDimensionProperties': {
+                'range': {'sheetId': sheet_id, 'dimension': dimension, 'startIndex': start_index, 'endIndex': end_index},
+                'properties': {'pixelSize': operation['pixel_size']},
+                'fields': 'pixelSize'
+            }})
+            return requests, BatchOperationResult(
+                index=index, op=kind, worksheet=properties['title'],
+                message=f"Resized {dimension.lower()} {start_index}-{end_index - 1} to {operation['pixel_size']}px"
+            )
+
+        # resize_sheet
+        grid_properties = {}
+        if operation.get('row_count') is not None:
+            grid_properties['rowCount'] = grid[0] = operation['row_count']
+        if operation.get('column_count') is not None:
+            grid_properties['columnCount'] = grid[1] = operation['column_count']
+        if not grid_properties:
+            raise ValueError(f"Operation {index}: resize_sheet needs row_count and/or column_count")
+        requests.append({'updateSheetProperties': {
+            'properties': {'sheetId': sheet_id, 'gridProperties': grid_properties},
+            'fields': ','.join(f"gridProperties.{name}" for name in grid_properties)
+        }})
+        return requests, BatchOperationResult(
+            index=index, op=kind, worksheet=properties['title'],
+            message=f"Resized sheet to {grid[0]} rows x {grid[1]} columns"
+        )
+
+    async def batch(
+        self,
+        service,  # Authenticated Google Sheets service
+        uri: str,
+        operations: List[Dict[str, Any]],
+        sheet_context: Optional[SheetContext] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply several write operations to one spreadsheet in a single, atomic batchUpdate.
+
+        Each operation is a dict with an "op" key (see BATCH_OPERATIONS) and an optional
+        "worksheet" title (default: the worksheet of uri):
+            - update_range: data, range_address (start cell, default "A1"), include_header (default True)
+            - append_rows: data (appended below the last row with data)
+            - insert_image: cell_address, image_url, width_pixels (400), height_pixels (300)
+            - resize_dimension: dimension ("ROWS"/"COLUMNS"), start_index, end_index
+              (0-based, end exclusive), pixel_size
+            - resize_sheet: row_count and/or column_count
+
+        Operations are compiled into updateCells/appendCells/updateDimensionProperties/
+        updateSheetProperties requests (plus appendDimension where writes need a larger grid)
+        and sent as one spreadsheets().batchUpdate, so either all of them apply or none does.
+        Values are written typed (see encode_cell_data): text is not parsed as numbers or dates.
+
+        Args:
+            service: Authenticated Google Sheets API service object
+            uri: Google Sheets URI
+            operations: Operations to apply, in order
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
+
+        Returns:
+            BatchResponse with one BatchOperationResult per operation
+        """
+        try:
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            spreadsheet_id = sheet_context.spreadsheet_id
+            if not operations:
+                raise ValueError("No operations given")
+
+            grids: Dict[int, list] = {}
+            requests = []
+            results = []
+            for index, operation in enumerate(operations):
+                operation_requests, result = self._compile_batch_operation(index, operation, sheet_context, grids)
+                requests.extend(operation_requests)
+                results.append(result)
+
+            logger.info(f"Applying {len(operations)} operations as {len(requests)} batchUpdate requests")
+            mark_spreadsheet_modified(service, spreadsheet_id)
+            await asyncio.to_thread(
+                service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={'requests': requests}
+                ).execute
+            )
+
+            if any(operation.get('op') == 'append_rows' for operation in operations):
+                # appendCells adds rows past the compiled grid sizes - refetch metadata on next use
+                invalidate_spreadsheet_metadata(service, spreadsheet_id)
+                grids = {}
+
+            # Keep cached grid sizes in sync with the dimensions the batch changed
+            for sheet_id, (row_count, column_count) in grids.items():
+                if sheet_id == sheet_context.sheet_id:
+                    sheet_context.update_grid(service, row_count=row_count, column_count=column_count)
+                else:
+                    update_cached_sheet_properties(
+                        service, spreadsheet_id, sheet_id, row_count=row_count, column_count=column_count
+                    )
+
+            return BatchResponse(
+                success=True,
+                spreadsheet_url=sheet_context.worksheet_url,
+                spreadsheet_id=spreadsheet_id,
+                results=results,
+                error=None,
+                message=f"Applied {len(operations)} operations in one request"
+            )
+
+        except Exception as e:
+            logger.error(f"Error applying batch operations to {uri}: {e}")
+            raise Exception(f"Failed to apply batch operations to {uri}: {e}") from e
+
+    async def _load_lookup_tables(
+        self,
+        service,
+        uri: str,
+        sheet_context: SheetContext
+    ) -> tuple:
+        """
+        Read a worksheet rendered as FORMULA and as FORMATTED_VALUE for update_by_lookup.
+
+        Both renderings come from one spreadsheets().get(includeGridData=True) call and share a
+        single header detection, so rows line up by construction. Grids large enough to need
+        chunked reads fall back to two concurrent load_data_table() reads (grid data is several
+        times bulkier per cell than plain values).
+
+        Returns:
+            (formula_data, formatted_data, source_info) with the data as lists of dicts
+            (materialized with list(): the lookup indexes rows repeatedly, and a TableRecords
+            view would rebuild the row dict on every access)
+        """
+        grid_properties = sheet_context.properties.get('gridProperties')
+        if needs_chunked_read(grid_properties):
+            formula_response, load_response = await asyncio.gather(
+                self.load_data_table(service, uri, value_render_option='FORMULA', sheet_context=sheet_context),
+                self.load_data_table(service, uri, value_render_option='FORMATTED_VALUE', sheet_context=sheet_context)
+            )
+            return list(formula_response.data), list(load_response.data), load_response.source_info
+
+        spreadsheet_id = sheet_context.spreadsheet_id
+        sheet_title = sheet_context.title
+        sheet_id = sheet_context.sheet_id
+        formula_rows, formatted_rows = await get_formula_and_formatted_values(
+            service, spreadsheet_id, plan_sheet_range(sheet_title, grid_properties)
+        )
+
+        header_row_idx, headers, data_rows = self._split_header_row(formatted_rows, True)
+        # list() rather than to_list(): without headers _rows_to_table returns a plain []
+        formula_data = list(self._rows_to_table(headers, formula_rows[header_row_idx + 1:]))
+        formatted_data = list(self._rows_to_table(headers, data_rows))
+
+        row_count = len(formatted_rows)
+        col_count = max((len(row) for row in formatted_rows), default=0)
+        source_info = {
+            "type": "google_sheets",
+            "spreadsheet_id": spreadsheet_id,
+            "original_uri": uri,
+            "worksheet": sheet_title,
+            "used_range": f"A1:{column_index_to_letter(col_count - 1)}{row_count}" if row_count > 0 and col_count > 0 else "A1:A1",
+            "worksheet_url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}",
+            "row_count": row_count,
+            "column_count": col_count
+        }
+        return formula_data, formatted_data, source_info
+
     async def update_by_lookup(
         self,
         service,  # Authenticated Google Sheets service
         uri: str,
         data: List[Dict[str, Any]],
         on: Union[str, List[str]],
-        override: bool = False
+        override: bool = False,
+        sheet_context: Optional[SheetContext] = None
     ) -> Dict[str, Any]:
         """
         Update Google Sheets data by looking up rows using one or more key columns.
@@ -1588,6 +2425,7 @@ class GoogleSheetDataTable(DataTableInterface):
                 All specified columns must exist in both sheet and data.
             override: If True, empty/null values in data will clear existing cells;
                      If False, empty/null values will preserve existing values
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
 
         Returns:
             UpdateResponse with success status, updated cell count, and metadata
@@ -1645,26 +2483,18 @@ class GoogleSheetDataTable(DataTableInterface):
                 if not all(key in row for row in data):
                     raise ValueError(f"Lookup column '{key}' not found in all rows of update data")
 
-            # Read twice: once for formulas (to detect which cells have formulas), once for formatted values (for lookup matching)
-            # This preserves formulas while maintaining proper date/number formatting for lookups
-            logger.info(f"Loading existing sheet data from {uri} - reading twice (FORMULA + FORMATTED_VALUE)")
-
-            # Read 1: Get formulas to detect which cells contain formulas
-            formula_response = await self.load_data_table(service, uri, value_render_option='FORMULA')
-            if not formula_response.success:
-                raise Exception(f"Failed to load sheet formulas for update by lookup: {formula_response.error}")
-            formula_data = formula_response.data  # List of dicts with formulas
+            # Resolve sheet metadata once and share it with every nested read/write below
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
 
-            # Read 2: Get formatted values for proper lookup matching (dates, numbers, etc.)
-            load_response = await self.load_data_table(service, uri, value_render_option='FORMATTED_VALUE')
-            if not load_response.success:
-                raise Exception(f"Failed to load sheet for update by lookup: {load_response.error}")
-            existing_data = load_response.data  # List of dicts with formatted values
+            # Formulas (to detect which cells have formulas) and formatted values (for lookup matching)
+            # are read together. This preserves formulas while maintaining proper date/number formatting for lookups
+            logger.info(f"Loading existing sheet data from {uri} (FORMULA + FORMATTED_VALUE)")
+            formula_data, existing_data, source_info = await self._load_lookup_tables(service, uri, sheet_context)
 
             # Special handling for empty sheet
             if not existing_data:
                 # Check if sheet is completely empty (no rows at all) or has only headers
-                row_count = load_response.source_info.get('row_count', 0)
+                row_count = source_info.get('row_count', 0)
                 is_completely_empty = row_count == 0
 
                 if is_completely_empty:
@@ -1673,7 +2503,7 @@ class GoogleSheetDataTable(DataTableInterface):
                     logger.info(
                         f"Sheet is completely empty (no headers, no data). "
                         f"Writing headers and data from A1. "
-                        f"Sheet info: {load_response.source_info.get('worksheet', 'unknown')}"
+                        f"Sheet info: {source_info.get('worksheet', 'unknown')}"
                     )
 
                     # Convert list of dicts to headers + rows format
@@ -1685,11 +2515,11 @@ class GoogleSheetDataTable(DataTableInterface):
                         raise ValueError("Data must be a list of dicts for update_by_lookup")
 
                     # Write headers + data using update_range
-                    response = await self.update_range(service, uri, write_data, "A1")
+                    response = await self.update_range(service, uri, write_data, "A1", sheet_context=sheet_context)
 
                     # Enhance response message
                     if response.success:
-                        metadata = load_response.source_info
+                        metadata = source_info
                         spreadsheet_id = metadata['spreadsheet_id']
                         sheet_id = metadata.get('worksheet_url', '').split('gid=')[-1] if 'worksheet_url' in metadata else '0'
                         spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
@@ -1717,25 +2547,19 @@ class GoogleSheetDataTable(DataTableInterface):
                     logger.info(
                         f"Sheet has only headers (no data rows). "
                         f"Converting update_by_lookup to append operation. "
-                        f"Sheet info: {load_response.source_info.get('worksheet', 'unknown')}, "
+                        f"Sheet info: {source_info.get('worksheet', 'unknown')}, "
                         f"Row count: {row_count}, "
-                        f"Col count: {load_response.source_info.get('column_count', 0)}"
+                        f"Col count: {source_info.get('column_count', 0)}"
                     )
 
                     # Read headers from first row of sheet to align data
-                    metadata = load_response.source_info
+                    metadata = source_info
                     spreadsheet_id = metadata['spreadsheet_id']
                     sheet_title = metadata['worksheet']
 
                     # Read first row to get headers
                     range_name = f"'{sheet_title}'!1:1"
-                    header_result = await asyncio.to_thread(
-                        service.spreadsheets().values().get(
-                            spreadsheetId=spreadsheet_id,
-                            range=range_name,
-                            valueRenderOption=ValueRenderOption.FORMATTED_VALUE.value
-                        ).execute
-                    )
+                    header_result = await get_sheet_values(service, spreadsheet_id, range_name, ValueRenderOption.FORMATTED_VALUE.value)
                     header_row = header_result.get('values', [[]])[0] if header_result.get('values') else []
                     existing_headers = [str(h) if h is not None else "" for h in header_row]
 
@@ -1745,11 +2569,11 @@ class GoogleSheetDataTable(DataTableInterface):
                     aligned_data = align_dict_data_to_headers(data, existing_headers)
 
                     # Use append_rows to add aligned data
-                    response = await self.append_rows(service, uri, aligned_data)
+                    response = await self.append_rows(service, uri, aligned_data, sheet_context=sheet_context)
 
                     # Enhance response message to indicate fallback behavior
                     if response.success:
-                        metadata = load_response.source_info
+                        metadata = source_info
                         spreadsheet_id = metadata['spreadsheet_id']
                         sheet_id = metadata.get('worksheet_url', '').split('gid=')[-1] if 'worksheet_url' in metadata else '0'
                         spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit#gid={sheet_id}"
@@ -1775,7 +2599,7 @@ class GoogleSheetDataTable(DataTableInterface):
                     return response
 
             existing_headers = list(existing_data[0].keys())
-            metadata = load_response.source_info
+            metadata = source_info
             spreadsheet_id = metadata['spreadsheet_id']
             sheet_title = metadata['worksheet']
             sheet_id = metadata.get('worksheet_url', '').split('gid=')[-1] if 'worksheet_url' in metadata else '0'
@@ -1940,7 +2764,7 @@ class GoogleSheetDataTable(DataTableInterface):
             # Write updated data rows back to sheet (starting from A2 to preserve header formulas)
             # Note: We only write data rows, not headers, to avoid overwriting formula headers
             range_address = "A2"
-            response = await self.update_range(service, uri, filtered_result_data, range_address, value_input_option='USER_ENTERED')
+            response = await self.update_range(service, uri, filtered_result_data, range_address, value_input_option='USER_ENTERED', sheet_context=sheet_context)
 
             # Append unmatched rows as new data if any
             appended_count = 0
@@ -1950,7 +2774,7 @@ class GoogleSheetDataTable(DataTableInterface):
                 # Align unmatched rows to match existing sheet headers
                 aligned_unmatched_rows = align_dict_data_to_headers(unmatched_rows, existing_headers)
 
-                append_response = await self.append_rows(service, uri, aligned_unmatched_rows)
+                append_response = await self.append_rows(service, uri, aligned_unmatched_rows, sheet_context=sheet_context)
                 if append_response.success:
                     appended_count = len(unmatched_rows)
                     logger.info(f"Successfully appended {appended_count} unmatched rows")
@@ -2026,12 +2850,8 @@ class GoogleSheetDataTable(DataTableInterface):
 
             logger.info(f"Listing worksheets for spreadsheet: {spreadsheet_id}")
 
-            # Get spreadsheet metadata
-            result = await asyncio.to_thread(
-                service.spreadsheets().get(
-                    spreadsheetId=spreadsheet_id
-                ).execute
-            )
+            # Get spreadsheet metadata (always fresh, and re-warms the metadata cache)
+            result = await get_spreadsheet_metadata(service, spreadsheet_id, force_refresh=True)
 
             spreadsheet_title = result.get('properties', {}).get('title', 'Untitled')
             sheets = result.get('sheets', [])
@@ -2073,6 +2893,92 @@ class GoogleSheetDataTable(DataTableInterface):
             logger.error(f"Error listing worksheets: {e}")
             raise Exception(f"Failed to list worksheets: {e}") from e
 
+    async def sheet_profile(
+        self,
+        service,  # Authenticated Google Sheets service
+        uri: str,
+        force_refresh: bool = False,
+        sheet_context: Optional[SheetContext] = None
+    ) -> Dict[str, Any]:
+        """
+        Profile a worksheet from a single read: boundaries, header row and per-column stats.
+
+        The worksheet is read once, rendered both as FORMATTED_VALUE (boundaries, header
+        row, non-empty counts - the same rendering the boundary probes use) and as FORMULA
+        (formula counts). The profile is cached briefly (and dropped on any write through
+        this server) so get_last_row, get_last_column and get_used_range can answer from
+        it without another read and give the same answers as without it.
+
+        Args:
+            service: Authenticated Google Sheets API service object
+            uri: Google Sheets URI (full URL with gid parameter)
+            force_refresh: Ignore a cached profile and read the worksheet again
+            sheet_context: Resolved worksheet to reuse (optional)
+
+        Returns:
+            SheetProfileResponse with used_range, last_row, last_column, header_row,
+            headers and per-column non-empty/formula counts
+        """
+        try:
+            from datatable_tools.models import SheetProfileResponse, ColumnProfile
+
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            spreadsheet_id = sheet_context.spreadsheet_id
+            sheet_title = sheet_context.title
+
+            profile = None if force_refresh else get_cached_sheet_profile(service, spreadsheet_id, sheet_context.sheet_id)
+            cached = profile is not None
+            if profile is None:
+                grid_properties = sheet_context.properties.get('gridProperties')
+                range_name = plan_sheet_range(sheet_title, grid_properties)
+                if needs_chunked_read(grid_properties):
+                    # Grid data is several times bulkier per cell than plain values
+                    formatted_result, formula_result = await asyncio.gather(
+                        get_sheet_values(service, spreadsheet_id, range_name, "FORMATTED_VALUE"),
+                        get_sheet_values(service, spreadsheet_id, range_name, "FORMULA")
+                    )
+                    formatted_rows = formatted_result.get('values', [])
+                    formula_rows = formula_result.get('values', [])
+                else:
+                    formula_rows, formatted_rows = await get_formula_and_formatted_values(
+                        service, spreadsheet_id, range_name
+                    )
+                profile = build_sheet_profile(formatted_rows, formula_rows)
+                cache_sheet_profile(service, spreadsheet_id, sheet_context.sheet_id, profile)
+
+            last_row = profile['last_row']
+            last_column = profile['last_column']
+            last_column_letter = column_index_to_letter(max(last_column - 1, 0))
+            used_range = f"A1:{last_column_letter}{last_row}" if last_row else "A1:A1"
+
+            if last_row:
+                message = (
+                    f"Profiled worksheet '{sheet_title}': {used_range} "
+                    f"({last_row} rows x {last_column} columns)"
+                )
+            else:
+                message = f"No data found in worksheet '{sheet_title}'"
+
+            return SheetProfileResponse(
+                success=True,
+                spreadsheet_id=spreadsheet_id,
+                spreadsheet_url=sheet_context.worksheet_url,
+                worksheet=sheet_title,
+                used_range=used_range,
+                last_row=last_row,
+                last_column=last_column_letter,
+                last_column_index=max(last_column - 1, 0),
+                header_row=profile['header_row'],
+                headers=profile['headers'],
+                columns=[ColumnProfile(**column) for column in profile['columns']],
+                cached=cached,
+                message=message
+            )
+
+        except Exception as e:
+            logger.error(f"Error profiling worksheet: {e}")
+            raise Exception(f"Failed to profile worksheet: {e}") from e
+
     async def copy_sheet(
         self,
         drive_service,  # Authenticated Google Drive service
@@ -2196,14 +3102,7 @@ class GoogleSheetDataTable(DataTableInterface):
 
         logger.info(f"Reading raw data from worksheet '{worksheet_title}' (range: {range_name})")
 
-        result = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption=value_render_option,
-                majorDimension='ROWS'
-            ).execute
-        )
+        result = await get_sheet_values(service, spreadsheet_id, range_name, value_render_option)
 
         raw_data = result.get('values', [])
         actual_range = result.get('range', range_name)  # e.g., "Sheet!A1:AB100"
@@ -2409,15 +3308,15 @@ class GoogleSheetDataTable(DataTableInterface):
                 # worksheet_data is already a raw 2D array from API with consistent column count
                 # All rows are padded to the same width, preserving column positions
 
-                # Convert all values to strings for Google Sheets API
+                # Encode values for Google Sheets API (numbers and booleans stay typed)
                 write_data = []
                 for row in worksheet_data:
-                    # Ensure row is a list and convert all cells to strings
+                    # Ensure row is a list and encode all cells
                     if isinstance(row, list):
-                        write_data.append([str(cell) if cell is not None else "" for cell in row])
+                        write_data.append(encode_write_row(row))
                     else:
                         # Single cell or scalar
-                        write_data.append([str(row)])
+                        write_data.append([encode_write_value(row)])
 
                 # Write data to the worksheet using USER_ENTERED to interpret formulas
                 if write_data:
@@ -2468,7 +3367,8 @@ class GoogleSheetDataTable(DataTableInterface):
         auto_fill: bool = False,
         lookup_column: str = "A",
         skip_if_exists: bool = True,
-        value_input_option: str = "USER_ENTERED"
+        value_input_option: str = "USER_ENTERED",
+        sheet_context: Optional[SheetContext] = None
     ) -> UpdateResponse:
         """
         Copy a range with formulas, adapting cell references based on position change.
@@ -2490,6 +3390,7 @@ class GoogleSheetDataTable(DataTableInterface):
             lookup_column: Column to check for data when auto_fill=True (default: "A")
             skip_if_exists: If True, skips rows where first destination cell has value (default: True)
             value_input_option: How to interpret data (default: "USER_ENTERED" to parse formulas)
+            sheet_context: Already resolved SheetContext from the calling operation (optional)
 
         Returns:
             UpdateResponse with success status and details
@@ -2509,7 +3410,8 @@ class GoogleSheetDataTable(DataTableInterface):
         try:
             # Parse URI
             spreadsheet_id, gid = parse_google_sheets_uri(uri)
-            sheet_properties = await get_sheet_by_gid(service, spreadsheet_id, gid)
+            sheet_context = await self._resolve_sheet_context(service, uri, sheet_context)
+            sheet_properties = sheet_context.properties
             sheet_title = sheet_properties['title']
 
             # Validate parameters
@@ -2562,13 +3464,7 @@ class GoogleSheetDataTable(DataTableInterface):
                         # Read entire first column of destination range in one API call
                         batch_check_range = f"'{sheet_title}'!{start_col}{to_range_parsed['start_row']}:{start_col}{to_range_parsed['end_row']}"
                         try:
-                            check_result = await asyncio.to_thread(
-                                service.spreadsheets().values().get(
-                                    spreadsheetId=spreadsheet_id,
-                                    range=batch_check_range,
-                                    valueRenderOption=ValueRenderOption.UNFORMATTED_VALUE.value
-                                ).execute
-                            )
+                            check_result = await get_sheet_values(service, spreadsheet_id, batch_check_range, ValueRenderOption.UNFORMATTED_VALUE.value)
                             check_values = check_result.get('values', [])
                             # Map row numbers to their values
                             for idx, row_values in enumerate(check_values):
@@ -2614,13 +3510,7 @@ class GoogleSheetDataTable(DataTableInterface):
 
             # Read source range with formulas once
             full_from_range = f"'{sheet_title}'!{from_range}"
-            result = await asyncio.to_thread(
-                service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=full_from_range,
-                    valueRenderOption=ValueRenderOption.FORMULA.value
-                ).execute
-            )
+            result = await get_sheet_values(service, spreadsheet_id, full_from_range, ValueRenderOption.FORMULA.value)
 
             source_values = result.get('values', [])
             if not source_values:
@@ -2678,6 +3568,7 @@ class GoogleSheetDataTable(DataTableInterface):
                     # Write this chunk immediately to avoid memory issues and provide progress
                     if batch_data:
                         logger.info(f"Writing chunk of {len(batch_data)} ranges to Google Sheets")
+                        mark_spreadsheet_modified(service, spreadsheet_id)
                         await asyncio.to_thread(
                             service.spreadsheets().values().batchUpdate(
                                 spreadsheetId=spreadsheet_id,
@@ -2798,6 +3689,7 @@ class GoogleSheetDataTable(DataTableInterface):
 
                     logger.info(f"Expanding grid to {new_rows} rows x {new_cols} columns")
 
+                    mark_spreadsheet_modified(service, spreadsheet_id)
                     await asyncio.to_thread(
                         service.spreadsheets().batchUpdate(
                             spreadsheetId=spreadsheet_id,
@@ -2817,9 +3709,11 @@ class GoogleSheetDataTable(DataTableInterface):
                             }
                         ).execute
                     )
+                    sheet_context.update_grid(service, row_count=new_rows, column_count=new_cols)
 
                 # Write all adapted values in a single batch operation
                 logger.info(f"Writing {len(batch_data)} ranges in a single batch API call")
+                mark_spreadsheet_modified(service, spreadsheet_id)
                 batch_update_result = await asyncio.to_thread(
                     service.spreadsheets().values().batchUpdate(
                         spreadsheetId=spreadsheet_id,
@@ -2909,21 +3803,9 @@ class GoogleSheetDataTable(DataTableInterface):
         dest_range = f"'{sheet_title}'!{first_dest_col}1:{first_dest_col}10000"
 
         # Read both columns in parallel
-        result_lookup = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=lookup_range,
-                valueRenderOption=ValueRenderOption.UNFORMATTED_VALUE.value
-            ).execute
-        )
+        result_lookup = await get_sheet_values(service, spreadsheet_id, lookup_range, ValueRenderOption.UNFORMATTED_VALUE.value)
 
-        result_dest = await asyncio.to_thread(
-            service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=dest_range,
-                valueRenderOption=ValueRenderOption.UNFORMATTED_VALUE.value
-            ).execute
-        )
+        result_dest = await get_sheet_values(service, spreadsheet_id, dest_range, ValueRenderOption.UNFORMATTED_VALUE.value)
 
         lookup_values = result_lookup.get('values', [])
         dest_values = result_dest.get('values', [])
@@ -37,10 +37,14 @@ _google_sheet_instance = GoogleSheetDataTable()
 TOOL_REGISTRY = {
     # Google Sheets tools
     "google_sheets__load_data_table": _google_sheet_instance.load_data_table,
+    # In-process only: returns pl.DataFrame / pyarrow.Table / Arrow IPC bytes, not JSON
+    "google_sheets__load_data_frame": _google_sheet_instance.load_data_frame,
     "google_sheets__update_range": _google_sheet_instance.update_range,
     "google_sheets__append_rows": _google_sheet_instance.append_rows,
     "google_sheets__append_columns": _google_sheet_instance.append_columns,
     "google_sheets__write_new_sheet": _google_sheet_instance.write_new_sheet,
+    "google_sheets__sheet_profile": _google_sheet_instance.sheet_profile,
+    "google_sheets__batch_operations": _google_sheet_instance.batch,
 }
 
 
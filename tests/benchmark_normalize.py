@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row normalization and record building in GoogleSheetDataTable._rows_to_table
+
+Compares the current implementation against the previous per-cell approaches (records:
+pad with a while loop, then build each dict cell by cell; columns: one comprehension per
+column) on ragged rows as the Sheets API returns them (trailing empty cells omitted).
+Target: 200k x 50 cells shaped into records - the default format, every dict built - in
+under a second. Records are bounded below by CPython's dict building cost, so on a slow
+machine the target can be missed by a small margin; rows and columns should stay well
+below it.
+
+Usage:
+    python -m tests.benchmark_normalize
+    python -m tests.benchmark_normalize --rows 50000 --cols 20
+"""
+
+import argparse
+import time
+
+from datatable_tools.models import ResponseFormat
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+
+TARGET_SECONDS = 1.0
+
+
+def make_rows(rows: int, cols: int) -> list:
+    # Every third row ends early, every seventh has an extra cell beyond the headers
+    result = []
+    for r in range(rows):
+        width = cols - (r % 5) if r % 3 == 0 else cols + 1 if r % 7 == 0 else cols
+        result.append([f"{r}:{c}" for c in range(width)])
+    return result
+
+
+def previous_records(headers: list, rows: list) -> list:
+    max_cols = len(headers)
+    for row in rows:
+        while len(row) < max_cols:
+            row.append("")
+        if len(row) > max_cols:
+            row[:] = row[:max_cols]
+    return [{header: row[i] if i < len(row) else "" for i, header in enumerate(headers)} for row in rows]
+
+
+def previous_columns(headers: list, rows: list) -> dict:
+    return {header: [row[i] if i < len(row) else "" for row in rows] for i, header in enumerate(headers)}
+
+
+def best_of(repeat: int, func, headers: list, rows: list) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        data = [list(row) for row in rows]  # The previous approach mutates rows in place
+        start = time.perf_counter()
+        func(headers, data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--cols', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    headers = [f"column_{c:03d}" for c in range(args.cols)]
+    rows = make_rows(args.rows, args.cols)
+    table = GoogleSheetDataTable()
+
+    print(f"{args.rows} rows x {args.cols} columns, best of {args.repeat}")
+    print(f"{'variant':<22}{'seconds':>10}")
+    timings = {}
+    previous = {
+        ResponseFormat.RECORDS: best_of(args.repeat, previous_records, headers, rows),
+        ResponseFormat.COLUMNS: best_of(args.repeat, previous_columns, headers, rows),
+    }
+    for response_format, seconds in previous.items():
+        print(f"{'previous (' + response_format.value + ')':<22}{seconds:>10.3f}")
+    for response_format in ResponseFormat:
+        if response_format == ResponseFormat.RECORDS:
+            # Records are a lazy TableRecords view, time building every dict from it
+            shape = lambda h, r: table._rows_to_table(h, r).to_list()
+        else:
+            shape = lambda h, r, fmt=response_format: table._rows_to_table(h, r, fmt)
+        seconds = best_of(args.repeat, shape, headers, rows)
+        print(f"{response_format.value:<22}{seconds:>10.3f}")
+        timings[response_format] = seconds
+
+    records = timings[ResponseFormat.RECORDS]
+    status = "OK" if records < TARGET_SECONDS else "SLOWER THAN TARGET"
+    print(f"records (default format): {records:.3f}s, target < {TARGET_SECONDS:.1f}s: {status}")
+    for response_format, seconds in previous.items():
+        print(f"{response_format.value}: {seconds / timings[response_format]:.1f}x faster than previous")
+
+
+if __name__ == '__main__':
+    main()
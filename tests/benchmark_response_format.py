@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TableResponse payload size and serialization time per response format
+
+Loads a synthetic sheet through GoogleSheetDataTable.load_data_table (in-memory fake
+service, no network) and measures the JSON the MCP layer would send for each format.
+
+Usage:
+    python -m tests.benchmark_response_format
+    python -m tests.benchmark_response_format --rows 20000 --cols 80
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+def check_payload(payload: str, response_format: str, rows: int, cols: int) -> None:
+    """Fail loudly when a format does not carry the whole table (sizes would be meaningless)."""
+    data = json.loads(payload)["data"]
+    if response_format == "columns":
+        assert isinstance(data, dict), f"columns: payload data is a {type(data).__name__}, expected an object"
+        assert len(data) == cols, f"columns: {len(data)} columns in payload, expected {cols}"
+        assert all(len(values) == rows for values in data.values()), f"columns: expected {rows} values per column"
+    else:
+        assert len(data) == rows, f"{response_format}: {len(data)} rows in payload, expected {rows}"
+        assert all(len(row) == cols for row in data), f"{response_format}: expected {cols} cells per row"
+
+
+def make_values(rows: int, cols: int) -> list:
+    headers = [f"column_header_{c:03d}" for c in range(cols)]
+    return [headers] + [[f"{r * cols + c}" for c in range(cols)] for r in range(rows)]
+
+
+async def run(rows: int, cols: int, repeat: int) -> None:
+    service = FakeSheetsService({"Bench": make_values(rows, cols)}, row_count=rows + 1, column_count=cols)
+    table = GoogleSheetDataTable()
+
+    print(f"Sheet: {rows} rows x {cols} columns, best of {repeat}")
+    print(f"{'format':<10}{'payload (KiB)':>16}{'serialize (ms)':>18}{'vs records':>14}")
+
+    baseline = None
+    for response_format in ("records", "rows", "columns"):
+        response = await table.load_data_table(service, service.uri(), response_format=response_format)
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            payload = response.model_dump_json()
+            best = min(best, time.perf_counter() - start)
+        check_payload(payload, response_format, rows, cols)
+        size = len(payload.encode('utf-8'))
+        baseline = baseline or size
+        print(f"{response_format:<10}{size / 1024:>16.1f}{best * 1000:>18.1f}{size / baseline:>13.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--cols', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.rows, args.cols, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
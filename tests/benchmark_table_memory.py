@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of table responses - eager list of dicts vs TableRecords
+
+Measures with tracemalloc the peak memory and live allocations of shaping rows read
+from the API into a records TableResponse, and of serializing it to JSON:
+- eager: one dict per row, then validated (and copied) by Pydantic (previous behavior)
+- lazy: TableRecords keeps the row lists; dicts are built one at a time while serializing
+
+Usage:
+    python -m tests.benchmark_table_memory
+    python -m tests.benchmark_table_memory --rows 20000 --cols 30
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+from datatable_tools.models import TableResponse
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+
+
+class EagerTableResponse(BaseModel):
+    """TableResponse as it was: data validated as a plain union of lists/dicts."""
+    success: bool
+    data: Union[List[Dict[str, Any]], List[List[Any]], Dict[str, List[Any]]] = []
+    headers: Optional[List[str]] = None
+    message: str
+
+
+def make_rows(rows: int, cols: int) -> list:
+    return [[f"{r}:{c}" for c in range(cols - (r % 3))] for r in range(rows)]
+
+
+def eager(headers: list, rows: list) -> BaseModel:
+    data = [{header: row[i] if i < len(row) else "" for i, header in enumerate(headers)} for row in rows]
+    return EagerTableResponse(success=True, data=data, message="eager")
+
+
+def lazy(headers: list, rows: list) -> BaseModel:
+    data = GoogleSheetDataTable()._rows_to_table(headers, rows)
+    return TableResponse(success=True, data=data, message="lazy")
+
+
+def measure(build, headers: list, rows: list) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = build(headers, rows)
+    built = time.perf_counter() - start
+    live, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    payload = response.model_dump_json()
+    serialized = time.perf_counter() - start
+    _, serialize_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "live": live, "peak": peak, "blocks": blocks, "built": built,
+        "serialize_peak": serialize_peak, "serialized": serialized, "size": len(payload)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--cols', type=int, default=30)
+    args = parser.parse_args()
+
+    headers = [f"column_{c:03d}" for c in range(args.cols)]
+    rows = make_rows(args.rows, args.cols)
+    mib = 1024 * 1024
+
+    print(f"{args.rows} rows x {args.cols} columns (row lists from the API not counted)")
+    print(f"{'variant':<8}{'live MiB':>10}{'peak MiB':>10}{'blocks':>12}{'build s':>9}"
+          f"{'json peak MiB':>15}{'json s':>8}")
+    for name, build in (("eager", eager), ("lazy", lazy)):
+        r = measure(build, headers, rows)
+        print(f"{name:<8}{r['live'] / mib:>10.1f}{r['peak'] / mib:>10.1f}{r['blocks']:>12,}{r['built']:>9.2f}"
+              f"{r['serialize_peak'] / mib:>15.1f}{r['serialized']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
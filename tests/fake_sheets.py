@@ -0,0 +1,501 @@
+"""
+In-memory, recording fake of the Google Sheets v4 service (no server required)
+
+Implements the subset of spreadsheets() / values() endpoints used by
+GoogleSheetDataTable closely enough for unit tests: A1 ranges are resolved
+against a real grid, reads are trimmed and echo the clipped range like the
+API does, writes outside the grid fail, and every request is recorded in
+`service.calls` so tests can assert on round trips.
+
+Usage:
+    service = FakeSheetsService({"Sheet1": [["name", "age"], ["Alice", "30"]]})
+    await GoogleSheetDataTable().load_data_table(service, service.uri())
+    assert service.count("spreadsheets.get") == 1
+"""
+
+import json
+import re
+import threading
+import time
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _col_to_index(letters: str) -> int:
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+
+def _index_to_col(index: int) -> str:
+    result = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        result = chr(ord('A') + remainder) + result
+    return result
+
+
+# Calls that change the spreadsheet (and so its Drive file version)
+WRITE_CALLS = {"spreadsheets.batchUpdate", "values.update", "values.batchUpdate", "values.append"}
+
+
+class _Request:
+    """Deferred API call, mirrors googleapiclient's HttpRequest.execute()"""
+
+    def __init__(self, service: "FakeSheetsService", name: str, kwargs: dict, handler):
+        self._service = service
+        self._name = name
+        self._kwargs = kwargs
+        self._handler = handler
+        # Like HttpRequest.postproc: when set, execute() returns postproc(resp, body bytes)
+        self.postproc = None
+
+    def execute(self):
+        service = self._service
+        with service._lock:
+            service.calls.append((self._name, self._kwargs))
+            service.in_flight += 1
+            service.max_in_flight = max(service.max_in_flight, service.in_flight)
+        try:
+            if service.latency:
+                time.sleep(service.latency)
+            result = self._handler(**self._kwargs)
+            if self._name in WRITE_CALLS:
+                service.version += 1
+            if self.postproc is not None:
+                # The API pretty-prints its JSON responses
+                return self.postproc({'status': '200'}, json.dumps(result, indent=2).encode('utf-8'))
+            return result
+        finally:
+            with service._lock:
+                service.in_flight -= 1
+
+
+class _Sheet:
+    def __init__(self, sheet_id: int, title: str, values: List[List[Any]], row_count: int, column_count: int):
+        self.sheet_id = sheet_id
+        self.title = title
+        self.row_count = row_count
+        self.column_count = column_count
+        self.cells: Dict[Tuple[int, int], Any] = {}
+        for r, row in enumerate(values):
+            for c, value in enumerate(row):
+                if value not in ("", None):
+                    self.cells[(r, c)] = value
+
+    def properties(self) -> dict:
+        return {
+            'sheetId': self.sheet_id,
+            'title': self.title,
+            'index': 0,
+            'sheetType': 'GRID',
+            'gridProperties': {'rowCount': self.row_count, 'columnCount': self.column_count}
+        }
+
+
+class FakeSheetsService:
+    """Recording fake for service.spreadsheets() (one spreadsheet)"""
+
+    def __init__(
+        self,
+        sheets: Dict[str, List[List[Any]]],
+        spreadsheet_id: str = "fake-spreadsheet",
+        row_count: Optional[int] = None,
+        column_count: Optional[int] = None,
+        formatted: Optional[Dict[Tuple[str, int, int], Any]] = None,
+        latency: float = 0.0
+    ):
+        self.spreadsheet_id = spreadsheet_id
+        # Simulated round-trip time in seconds (execute() runs in a worker thread)
+        self.latency = latency
+        self.title = "Fake Spreadsheet"
+        self.calls: List[Tuple[str, dict]] = []
+        # Number of cells returned by values reads, a proxy for payload size
+        self.cells_transferred = 0
+        # Drive file version, bumped by every write (tests bump it for simulated external edits)
+        self.version = 1
+        # Concurrent execute() calls (now / peak)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.sheets: List[_Sheet] = []
+        # Row heights / column widths set by updateDimensionProperties: {(sheet_id, dimension, index): pixels}
+        self.pixel_sizes: Dict[Tuple[int, str, int], int] = {}
+        # FORMATTED_VALUE display text per cell: {(title, row, col): value}
+        self.formatted = formatted or {}
+        for index, (title, values) in enumerate(sheets.items()):
+            rows = row_count or max(1000, len(values))
+            cols = column_count or max(26, max((len(r) for r in values), default=0))
+            self.sheets.append(_Sheet(index * 100, title, values, rows, cols))
+
+    # ------------------------------------------------------------------ helpers
+
+    def uri(self, gid: Optional[int] = None) -> str:
+        url = f"https://docs.google.com/spreadsheets/d/{self.spreadsheet_id}/edit"
+        return f"{url}?gid={gid}#gid={gid}" if gid is not None else url
+
+    def count(self, name: str) -> int:
+        return sum(1 for call_name, _ in self.calls if call_name == name)
+
+    def sheet(self, title: Optional[str] = None) -> _Sheet:
+        if title is None:
+            return self.sheets[0]
+        for sheet in self.sheets:
+            if sheet.title == title:
+                return sheet
+        raise Exception(f"Unable to parse range: {title}")
+
+    def grid(self, title: Optional[str] = None) -> List[List[Any]]:
+        """Current sheet contents as a trimmed 2D list"""
+        sheet = self.sheet(title)
+        return self._read(sheet, 0, 0, sheet.row_count - 1, sheet.column_count - 1, 'FORMULA')
+
+    def _resolve(self, range_name: str, clip: bool = True) -> Tuple[_Sheet, int, int, int, int]:
+        if '!' in range_name:
+            title, a1 = range_name.rsplit('!', 1)
+            title = title.strip("'").replace("''", "'")
+        elif re.match(r'^[A-Za-z]{0,3}\d*(:[A-Za-z]{0,3}\d*)?$', range_name):
+            title, a1 = None, range_name
+        else:
+            title, a1 = range_name.strip("'").replace("''", "'"), ""
+        sheet = self.sheet(title)
+        if not a1:
+            return sheet, 0, 0, sheet.row_count - 1, sheet.column_count - 1
+
+        parts = a1.split(':')
+
+        def parse(part):
+            match = re.match(r'^([A-Za-z]*)(\d*)$', part)
+            letters, digits = match.group(1), match.group(2)
+            col = _col_to_index(letters) if letters else None
+            row = int(digits) - 1 if digits else None
+            return row, col
+
+        start_row, start_col = parse(parts[0])
+        end_row, end_col = parse(parts[1]) if len(parts) > 1 else (start_row, start_col)
+        start_row = 0 if start_row is None else start_row
+        start_col = 0 if start_col is None else start_col
+        end_row = sheet.row_count - 1 if end_row is None else end_row
+        end_col = sheet.column_count - 1 if end_col is None else end_col
+        if clip:
+            end_row = min(end_row, sheet.row_count - 1)
+            end_col = min(end_col, sheet.column_count - 1)
+        return sheet, start_row, start_col, end_row, end_col
+
+    def _a1(self, sheet: _Sheet, r1: int, c1: int, r2: int, c2: int) -> str:
+        return f"'{sheet.title}'!{_index_to_col(c1)}{r1 + 1}:{_index_to_col(c2)}{r2 + 1}"
+
+    def _render(self, sheet: _Sheet, r: int, c: int, render: str):
+        value = sheet.cells.get((r, c), "")
+        if (sheet.title, r, c) in self.formatted and (
+            render == 'FORMATTED_VALUE' or (render != 'FORMULA' and isinstance(value, str) and value.startswith('='))
+        ):
+            # Display text, or the computed value of a formula cell (UNFORMATTED_VALUE)
+            return self.formatted[(sheet.title, r, c)]
+        if render == 'FORMATTED_VALUE' and not isinstance(value, str):
+            if isinstance(value, bool):
+                return "TRUE" if value else "FALSE"
+            return str(value)
+        return value
+
+    def _read(self, sheet: _Sheet, r1: int, c1: int, r2: int, c2: int, render: str) -> List[List[Any]]:
+        # Only visit populated cells so huge, mostly empty grids stay cheap
+        populated: Dict[int, List[int]] = {}
+        for r, c in sheet.cells:
+            if r1 <= r <= r2 and c1 <= c <= c2:
+                populated.setdefault(r, []).append(c)
+        last = max(populated, default=r1 - 1)
+        rows = []
+        for r in range(r1, last + 1):
+            width = max(populated.get(r, []), default=c1 - 1) - c1 + 1
+            row = [self._render(sheet, r, c1 + c, render) for c in range(width)]
+            while row and row[-1] == "":
+                row.pop()
+            rows.append(row)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def _value_range(self, range: str, valueRenderOption: str = 'FORMATTED_VALUE',
+                     majorDimension: str = 'ROWS', **_) -> dict:
+        sheet, r1, c1, r2, c2 = self._resolve(range)
+        result = {'range': self._a1(sheet, r1, c1, r2, c2), 'majorDimension': majorDimension}
+        if r1 <= r2 and c1 <= c2:
+            values = self._read(sheet, r1, c1, r2, c2, valueRenderOption)
+            if values and majorDimension == 'COLUMNS':
+                values = [list(column) for column in zip_longest(*values, fillvalue="")]
+                for column in values:
+                    while column and column[-1] == "":
+                        column.pop()
+                while values and not values[-1]:
+                    values.pop()
+            if values:
+                result['values'] = values
+                self.cells_transferred += sum(len(line) for line in values)
+        return result
+
+    def _write(self, range_name: str, values: List[List[Any]]) -> dict:
+        sheet, r1, c1, _, _ = self._resolve(range_name, clip=False)
+        height = len(values)
+        width = max((len(row) for row in values), default=0)
+        if r1 + height > sheet.row_count or c1 + width > sheet.column_count:
+            raise Exception(
+                f"Range ({sheet.title}!{_index_to_col(c1)}{r1 + 1}) exceeds grid limits. "
+                f"Max rows: {sheet.row_count}, max columns: {sheet.column_count}"
+            )
+        for r, row in enumerate(values):
+            for c, value in enumerate(row):
+                if value in ("", None):
+                    sheet.cells.pop((r1 + r, c1 + c), None)
+                else:
+                    sheet.cells[(r1 + r, c1 + c)] = value
+        return {
+            'spreadsheetId': self.spreadsheet_id,
+            'updatedRange': self._a1(sheet, r1, c1, r1 + max(height, 1) - 1, c1 + max(width, 1) - 1),
+            'updatedRows': height,
+            'updatedColumns': width,
+            'updatedCells': sum(len(row) for row in values)
+        }
+
+    # ---------------------------------------------------------------- endpoints
+
+    def spreadsheets(self):
+        return _Spreadsheets(self)
+
+    def drive(self):
+        """Drive v3 stand-in sharing this spreadsheet's file version."""
+        return _Drive(self)
+
+
+class _Drive:
+    def __init__(self, service: FakeSheetsService):
+        self._service = service
+
+    def files(self):
+        return self
+
+    def get(self, **kwargs):
+        return _Request(self._service, "files.get", kwargs, self._get)
+
+    def _get(self, fileId: str, fields: str = '', **kwargs):
+        return {'version': str(self._service.version), 'modifiedTime': f"2025-01-01T00:00:{self._service.version:02d}.000Z"}
+
+
+class _Spreadsheets:
+    def __init__(self, service: FakeSheetsService):
+        self._service = service
+
+    def values(self):
+        return _Values(self._service)
+
+    def get(self, **kwargs):
+        return _Request(self._service, "spreadsheets.get", kwargs, self._get)
+
+    def batchUpdate(self, **kwargs):
+        return _Request(self._service, "spreadsheets.batchUpdate", kwargs, self._batch_update)
+
+    def create(self, **kwargs):
+        return _Request(self._service, "spreadsheets.create", kwargs, lambda **kw: {
+            'spreadsheetId': self._service.spreadsheet_id,
+            'spreadsheetUrl': self._service.uri(),
+            'sheets': [{'properties': s.properties()} for s in self._service.sheets]
+        })
+
+    def _get(self, spreadsheetId: str, fields: Optional[str] = None, includeGridData: bool = False,
+             ranges: Optional[List[str]] = None, **_):
+        service = self._service
+        result = {
+            'spreadsheetId': spreadsheetId,
+            'properties': {'title': service.title},
+            'sheets': [{'properties': s.properties()} for s in service.sheets]
+        }
+        if includeGridData and ranges:
+            for range_name in ranges:
+                sheet, r1, c1, r2, c2 = service._resolve(range_name)
+                row_data = []
+                for r in range(r1, r2 + 1):
+                    cells = []
+                    for c in range(c1, c2 + 1):
+                        if (r, c) not in sheet.cells:
+                            cells.append({})
+                            continue
+                        raw = sheet.cells[(r, c)]
+                        entered = service._render(sheet, r, c, 'FORMULA')
+                        if isinstance(entered, str) and entered.startswith('='):
+                            user_entered = {'formulaValue': entered}
+                        elif isinstance(raw, bool):
+                            user_entered = {'boolValue': raw}
+                        elif isinstance(raw, (int, float)):
+                            user_entered = {'numberValue': raw}
+                        else:
+                            user_entered = {'stringValue': raw}
+                        cells.append({
+                            'userEnteredValue': user_entered,
+                            'formattedValue': service._render(sheet, r, c, 'FORMATTED_VALUE')
+                        })
+                    while cells and cells[-1] == {}:
+                        cells.pop()
+                    row_data.append({'values': cells} if cells else {})
+                while row_data and row_data[-1] == {}:
+                    row_data.pop()
+                for entry in result['sheets']:
+                    if entry['properties']['sheetId'] == sheet.sheet_id:
+                        entry.setdefault('data', []).append({
+                            'startRow': r1, 'startColumn': c1, 'rowData': row_data
+                        })
+        return result
+
+    def _batch_update(self, spreadsheetId: str, body: dict, **_):
+        service = self._service
+        replies = []
+        for request in body.get('requests', []):
+            if 'addSheet' in request:
+                props = request['addSheet'].get('properties', {})
+                grid = props.get('gridProperties', {})
+                sheet = _Sheet(
+                    max(s.sheet_id for s in service.sheets) + 100, props['title'], [],
+                    grid.get('rowCount', 1000), grid.get('columnCount', 26)
+                )
+                service.sheets.append(sheet)
+                replies.append({'addSheet': {'properties': sheet.properties()}})
+            elif 'updateSheetProperties' in request:
+                props = request['updateSheetProperties']['properties']
+                sheet = next(s for s in service.sheets if s.sheet_id == props['sheetId'])
+                grid = props.get('gridProperties', {})
+                sheet.row_count = grid.get('rowCount', sheet.row_count)
+                sheet.column_count = grid.get('columnCount', sheet.column_count)
+                replies.append({})
+            elif 'appendDimension' in request:
+                spec = request['appendDimension']
+                sheet = next(s for s in service.sheets if s.sheet_id == spec['sheetId'])
+                if spec['dimension'] == 'ROWS':
+                    sheet.row_count += spec['length']
+                else:
+                    sheet.column_count += spec['length']
+                replies.append({})
+            elif 'updateCells' in request:
+                spec = request['updateCells']
+                start = spec.get('start', {})
+                sheet = next(s for s in service.sheets if s.sheet_id == start.get('sheetId', 0))
+                r0, c0 = start.get('rowIndex', 0), start.get('columnIndex', 0)
+                rows = spec.get('rows', [])
+                if r0 + len(rows) > sheet.row_count:
+                    raise Exception("Range exceeds grid limits")
+                for r, row in enumerate(rows):
+                    for c, cell in enumerate(row.get('values', [])):
+                        if c0 + c >= sheet.column_count:
+                            raise Exception("Range exceeds grid limits")
+                        value = cell.get('userEnteredValue')
+                        if not value:
+                            sheet.cells.pop((r0 + r, c0 + c), None)
+                        else:
+                            sheet.cells[(r0 + r, c0 + c)] = next(iter(value.values()))
+                replies.append({})
+            elif 'appendCells' in request:
+                spec = request['appendCells']
+                sheet = next(s for s in service.sheets if s.sheet_id == spec['sheetId'])
+                r0 = max((r for r, _ in sheet.cells), default=-1) + 1
+                rows = spec.get('rows', [])
+                sheet.row_count = max(sheet.row_count, r0 + len(rows))
+                for r, row in enumerate(rows):
+                    for c, cell in enumerate(row.get('values', [])):
+                        if c >= sheet.column_count:
+                            raise Exception("Range exceeds grid limits")
+                        value = cell.get('userEnteredValue')
+                        if value:
+                            sheet.cells[(r0 + r, c)] = next(iter(value.values()))
+                replies.append({})
+            elif 'updateDimensionProperties' in request:
+                spec = request['updateDimensionProperties']
+                span = spec['range']
+                for index in range(span['startIndex'], span['endIndex']):
+                    service.pixel_sizes[(span['sheetId'], span['dimension'], index)] = spec['properties']['pixelSize']
+                replies.append({})
+            else:
+                replies.append({})
+        return {'spreadsheetId': spreadsheetId, 'replies': replies}
+
+
+class _Values:
+    def __init__(self, service: FakeSheetsService):
+        self._service = service
+
+    def get(self, **kwargs):
+        return _Request(self._service, "values.get", kwargs, self._get)
+
+    def batchGet(self, **kwargs):
+        return _Request(self._service, "values.batchGet", kwargs, self._batch_get)
+
+    def update(self, **kwargs):
+        return _Request(self._service, "values.update", kwargs, self._update)
+
+    def batchUpdate(self, **kwargs):
+        return _Request(self._service, "values.batchUpdate", kwargs, self._batch_update)
+
+    def append(self, **kwargs):
+        return _Request(self._service, "values.append", kwargs, self._append)
+
+    def _get(self, spreadsheetId: str, range: str, valueRenderOption: str = 'FORMATTED_VALUE', **kwargs):
+        return self._service._value_range(range, valueRenderOption)
+
+    def _batch_get(self, spreadsheetId: str, ranges: List[str], valueRenderOption: str = 'FORMATTED_VALUE', **kwargs):
+        return {
+            'spreadsheetId': spreadsheetId,
+            'valueRanges': [self._service._value_range(r, valueRenderOption, **kwargs) for r in ranges]
+        }
+
+    def _update(self, spreadsheetId: str, range: str, body: dict, valueInputOption: str = 'RAW', **kwargs):
+        return self._service._write(range, body.get('values', []))
+
+    def _batch_update(self, spreadsheetId: str, body: dict, **kwargs):
+        responses = [self._service._write(d['range'], d.get('values', [])) for d in body.get('data', [])]
+        return {
+            'spreadsheetId': spreadsheetId,
+            'totalUpdatedCells': sum(r['updatedCells'] for r in responses),
+            'responses': responses
+        }
+
+    def _append(self, spreadsheetId: str, range: str, body: dict, valueInputOption: str = 'RAW',
+                insertDataOption: str = 'OVERWRITE', includeValuesInResponse: bool = False, **kwargs):
+        service = self._service
+        sheet, r1, c1, r2, c2 = service._resolve(range, clip=False)
+        values = body.get('values', [])
+        if (r1, c1) == (r2, c2):
+            c2 = max(c1, sheet.column_count - 1)  # A single cell also searches the columns to its right
+        # Table detection like the API: the first block of consecutive non-empty rows at or
+        # below the range start. Values go right after it (into blank rows or over anything
+        # below a gap), starting at the table's first column; without a table, at the range start.
+        data_columns = {}
+        for (r, c), value in sheet.cells.items():
+            if r >= r1 and c1 <= c <= c2 and value not in ("", None):
+                data_columns.setdefault(r, set()).add(c)
+        table_range = None
+        if data_columns:
+            first_row = last_row = min(data_columns)
+            while last_row + 1 in data_columns:
+                last_row += 1
+            columns = set().union(*(cols for r, cols in data_columns.items() if first_row <= r <= last_row))
+            start_row, start_col = last_row + 1, min(columns)
+            table_range = service._a1(sheet, first_row, start_col, last_row, max(columns))
+        else:
+            start_row, start_col = r1, c1
+        if insertDataOption == 'INSERT_ROWS':
+            # Whole rows are inserted at start_row, pushing everything below down
+            sheet.cells = {
+                (r + len(values) if r >= start_row else r, c): value for (r, c), value in sheet.cells.items()
+            }
+            sheet.row_count += len(values)
+        if start_row + len(values) > sheet.row_count:
+            sheet.row_count = start_row + len(values)
+        width = max((len(row) for row in values), default=0)
+        if start_col + width > sheet.column_count:
+            sheet.column_count = start_col + width
+        updates = service._write(service._a1(sheet, start_row, start_col, start_row, start_col), values)
+        if includeValuesInResponse:
+            updates['updatedData'] = {'range': updates['updatedRange'], 'values': values}
+        result = {'spreadsheetId': spreadsheetId, 'updates': updates}
+        if table_range:
+            result['tableRange'] = table_range
+        return result
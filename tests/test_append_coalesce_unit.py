@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for coalescing concurrent append_rows calls (no server required)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache, get_append_coalesce_stats
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService, _Values
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_service(**kwargs):
+    return FakeSheetsService({
+        "Sheet1": [["name", "age"], ["Alice", "30"]],
+        "Other": [["name", "age"]]
+    }, **kwargs)
+
+
+class TestAppendCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_share_one_write(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+        before = get_append_coalesce_stats()
+
+        responses = await asyncio.gather(*[
+            table.append_rows(service, service.uri(), [[f"user{i}", str(i)]] * (i + 1), coalesce=True)
+            for i in range(3)
+        ])
+
+        assert service.count("values.append") == 1
+        assert [r.range for r in responses] == ["A3:B3", "A4:B5", "A6:B8"]
+        assert [r.updated_cells for r in responses] == [2, 4, 6]
+        assert service.grid()[2:] == [["user0", "0"], ["user1", "1"], ["user1", "1"]] + [["user2", "2"]] * 3
+        stats = get_append_coalesce_stats()
+        assert stats["total_appends"] - before["total_appends"] == 3
+        assert stats["total_batches"] - before["total_batches"] == 1
+        assert stats["open_batches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_range_uses_its_own_width(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+
+        narrow, wide = await asyncio.gather(
+            table.append_rows(service, service.uri(), [["x"]], coalesce=True),
+            table.append_rows(service, service.uri(), [["y", "1", "extra"]], coalesce=True),
+        )
+
+        assert (narrow.range, wide.range) == ("A3:A3", "A4:C4")
+
+    @pytest.mark.asyncio
+    async def test_worksheets_and_default_calls_are_not_merged(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+
+        await asyncio.gather(
+            table.append_rows(service, service.uri(gid=0), [["a", "1"]], coalesce=True),
+            table.append_rows(service, service.uri(gid=100), [["b", "2"]], coalesce=True),
+            table.append_rows(service, service.uri(gid=0), [["c", "3"]]),
+        )
+
+        assert service.count("values.append") == 3
+        assert service.grid("Other")[1:] == [["b", "2"]]
+
+    @pytest.mark.asyncio
+    async def test_later_batch_waits_for_the_earlier_one(self, monkeypatch):
+        service = make_service()
+        table = GoogleSheetDataTable()
+        active, peak = [0], [0]
+        append = _Values._append
+
+        def slow_append(self, **kwargs):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            time.sleep(0.3)
+            try:
+                return append(self, **kwargs)
+            finally:
+                active[0] -= 1
+        monkeypatch.setattr(_Values, "_append", slow_append)
+
+        first = asyncio.ensure_future(table.append_rows(service, service.uri(), [["first", "1"]], coalesce=True))
+        # Opens a new batch while the first write is still in flight
+        await asyncio.sleep(0.1)
+        second = asyncio.ensure_future(table.append_rows(service, service.uri(), [["second", "2"]], coalesce=True))
+        responses = await asyncio.gather(first, second)
+
+        assert service.count("values.append") == 2
+        assert peak[0] == 1
+        assert [r.range for r in responses] == ["A3:B3", "A4:B4"]
+        assert service.grid()[2:] == [["first", "1"], ["second", "2"]]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self, monkeypatch):
+        service = make_service()
+        table = GoogleSheetDataTable()
+
+        def fail(self, **kwargs):
+            raise Exception("quota exceeded")
+        monkeypatch.setattr(_Values, "_append", fail)
+
+        results = await asyncio.gather(*[
+            table.append_rows(service, service.uri(), [["x", "1"]], coalesce=True) for _ in range(2)
+        ], return_exceptions=True)
+
+        assert service.count("values.append") == 1
+        assert all(isinstance(r, Exception) and "quota exceeded" in str(r) for r in results)
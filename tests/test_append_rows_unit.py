@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for append_rows built on values.append (no server required)
+"""
+
+import asyncio
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_service(**kwargs):
+    return FakeSheetsService({"Sheet1": [["name", "age"], ["Alice", "30"], ["Bob", "25"]]}, **kwargs)
+
+
+class TestAppendRows:
+
+    @pytest.mark.asyncio
+    async def test_single_write_anchored_below_the_data(self):
+        service = make_service()
+
+        await GoogleSheetDataTable().append_rows(service, service.uri(), [["Carol", "41"]])
+
+        # Small probe windows instead of a whole-sheet read, then one write
+        assert [name for name, _ in service.calls] == [
+            "spreadsheets.get", "values.batchGet", "values.batchGet", "values.append"
+        ]
+        _, kwargs = service.calls[-1]
+        assert kwargs["range"] == "'Sheet1'!A4"
+        assert kwargs["insertDataOption"] == "OVERWRITE"
+        assert kwargs["valueInputOption"] == "USER_ENTERED"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("insert_data_option", ["OVERWRITE", "INSERT_ROWS"])
+    async def test_rows_go_below_data_after_a_blank_row(self, insert_data_option):
+        service = FakeSheetsService({"Sheet1": [["name", "age"], ["Alice", "30"], [], ["Bob", "25"]]})
+
+        response = await GoogleSheetDataTable().append_rows(
+            service, service.uri(), [["Carol", "41"]], insert_data_option=insert_data_option
+        )
+
+        # A whole-sheet values.append would stop at the blank row and overwrite Bob
+        assert response.range == "A5:B5"
+        assert service.grid() == [["name", "age"], ["Alice", "30"], [], ["Bob", "25"], ["Carol", "41"]]
+
+    @pytest.mark.asyncio
+    async def test_rows_start_at_column_a_when_the_table_does_not(self):
+        service = FakeSheetsService({"Sheet1": [["", "name", "age"], ["", "Alice", "30"]]})
+
+        response = await GoogleSheetDataTable().append_rows(service, service.uri(), [["x", "Carol", "41"]])
+
+        assert response.range == "A3:C3"
+        assert service.grid()[2] == ["x", "Carol", "41"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_do_not_overwrite_each_other(self):
+        service = make_service(latency=0.01)
+        table = GoogleSheetDataTable()
+
+        await asyncio.gather(
+            table.append_rows(service, service.uri(), [["Carol", "41"]]),
+            table.append_rows(service, service.uri(), [["Dan", "19"]]),
+        )
+
+        assert sorted(service.grid()[3:]) == [["Carol", "41"], ["Dan", "19"]]
+
+    @pytest.mark.asyncio
+    async def test_reports_range_from_api_response(self):
+        service = make_service()
+
+        response = await GoogleSheetDataTable().append_rows(
+            service, service.uri(), [{"name": "Carol", "age": 41}, {"name": "Dan", "age": 19}]
+        )
+
+        assert response.success
+        assert response.range == "A4:B5"
+        assert response.updated_cells == 4
+        assert response.shape == "(2,2)"
+        assert service.grid()[3:] == [["Carol", 41], ["Dan", 19]]
+
+    @pytest.mark.asyncio
+    async def test_full_grid_grows_rows_without_explicit_resize(self):
+        service = make_service(row_count=3, column_count=2)
+
+        response = await GoogleSheetDataTable().append_rows(service, service.uri(), [["Carol", "41"]])
+
+        assert response.range == "A4:B4"
+        assert service.count("spreadsheets.batchUpdate") == 0
+        assert service.sheet().row_count == 4
+
+    @pytest.mark.asyncio
+    async def test_wider_data_resizes_columns_first(self):
+        service = make_service(row_count=10, column_count=2)
+
+        response = await GoogleSheetDataTable().append_rows(service, service.uri(), [["Carol", "41", "extra"]])
+
+        assert service.count("spreadsheets.batchUpdate") == 1
+        assert service.sheet().column_count == 13
+        assert response.range == "A4:C4"
+        assert "auto-resized" in response.message
+
+    @pytest.mark.asyncio
+    async def test_insert_rows_mode(self):
+        service = make_service(row_count=10)
+
+        response = await GoogleSheetDataTable().append_rows(
+            service, service.uri(), [["Carol", "41"]], insert_data_option="INSERT_ROWS"
+        )
+
+        assert response.range == "A4:B4"
+        assert service.calls[-1][1]["insertDataOption"] == "INSERT_ROWS"
+        assert service.sheet().row_count == 11
+
+    @pytest.mark.asyncio
+    async def test_invalid_insert_option(self):
+        service = make_service()
+
+        with pytest.raises(Exception, match="Failed to append rows"):
+            await GoogleSheetDataTable().append_rows(
+                service, service.uri(), [["x"]], insert_data_option="APPEND_SOMEWHERE"
+            )
+        assert service.calls == []
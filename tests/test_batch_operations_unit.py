@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for GoogleSheetDataTable.batch() - several writes in one batchUpdate (no server required)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache, encode_cell_data, get_sheet_by_title
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_service(**kwargs):
+    return FakeSheetsService({
+        "Report": [["name", "score"], ["Alice", 91]],
+        "Log": [["date", "event"], ["2024-01-01", "created"]]
+    }, **kwargs)
+
+
+def batch_requests(service):
+    return [
+        request
+        for name, kwargs in service.calls if name == "spreadsheets.batchUpdate"
+        for request in kwargs["body"]["requests"]
+    ]
+
+
+class TestEncodeCellData:
+
+    def test_values_keep_their_type(self):
+        assert encode_cell_data(3) == {"userEnteredValue": {"numberValue": 3}}
+        assert encode_cell_data(False) == {"userEnteredValue": {"boolValue": False}}
+        assert encode_cell_data("=SUM(A:A)") == {"userEnteredValue": {"formulaValue": "=SUM(A:A)"}}
+        assert encode_cell_data("42") == {"userEnteredValue": {"stringValue": "42"}}
+        assert encode_cell_data(None) == {} == encode_cell_data("")
+
+
+class TestBatch:
+
+    @pytest.mark.asyncio
+    async def test_operations_share_one_batch_update(self):
+        service = make_service()
+
+        response = await GoogleSheetDataTable().batch(service, service.uri(), [
+            {"op": "update_range", "range_address": "C1", "data": [{"rank": 1}, {"rank": 2}]},
+            {"op": "append_rows", "worksheet": "Log", "data": [["2024-01-31", "updated"]]},
+            {"op": "insert_image", "cell_address": "e2", "image_url": "https://example.com/chart.png",
+             "width_pixels": 200, "height_pixels": 100},
+            {"op": "resize_dimension", "dimension": "COLUMNS", "start_index": 0, "end_index": 2, "pixel_size": 150},
+        ])
+
+        assert [name for name, _ in service.calls] == ["spreadsheets.get", "spreadsheets.batchUpdate"]
+        assert [next(iter(request)) for request in batch_requests(service)] == [
+            "updateCells", "appendCells", "updateCells",
+            "updateDimensionProperties", "updateDimensionProperties", "updateDimensionProperties"
+        ]
+        assert [(r.index, r.op, r.worksheet, r.range, r.updated_cells) for r in response.results] == [
+            (0, "update_range", "Report", "C1:C3", 3),
+            (1, "append_rows", "Log", None, 2),
+            (2, "insert_image", "Report", "E2", 1),
+            (3, "resize_dimension", "Report", None, 0),
+        ]
+        assert service.grid("Report") == [
+            ["name", "score", "rank"],
+            ["Alice", 91, 1, "", '=IMAGE("https://example.com/chart.png", 4, 100, 200)'],
+            ["", "", 2]
+        ]
+        assert service.grid("Log")[-1] == ["2024-01-31", "updated"]
+        assert service.pixel_sizes[(0, "ROWS", 1)] == 100
+        assert service.pixel_sizes[(0, "COLUMNS", 1)] == 150
+
+    @pytest.mark.asyncio
+    async def test_grid_grows_inside_the_same_request(self):
+        service = make_service(row_count=3, column_count=2)
+
+        await GoogleSheetDataTable().batch(service, service.uri(), [
+            {"op": "update_range", "range_address": "B3", "data": [["x", "y"], ["z", "w"]]},
+            {"op": "resize_sheet", "worksheet": "Log", "row_count": 50},
+        ])
+
+        requests = batch_requests(service)
+        assert requests[0] == {"appendDimension": {"sheetId": 0, "dimension": "ROWS", "length": 1}}
+        assert requests[1] == {"appendDimension": {"sheetId": 0, "dimension": "COLUMNS", "length": 1}}
+        assert requests[-1]["updateSheetProperties"]["fields"] == "gridProperties.rowCount"
+        assert (service.sheet("Report").row_count, service.sheet("Report").column_count) == (4, 3)
+        assert service.sheet("Log").row_count == 50
+        assert service.grid("Report")[2:] == [["", "x", "y"], ["", "z", "w"]]
+
+    @pytest.mark.asyncio
+    async def test_append_past_the_grid_then_read(self):
+        service = make_service(row_count=3, column_count=2)
+        service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri(), range_address="A:B")
+
+        await table.batch(service, service.uri(), [
+            {"op": "append_rows", "data": [["Bob", 80], ["Carol", 75], ["Dan", 60]]},
+        ])
+        response = await table.load_data_table(service, service.uri(), range_address="A:B")
+
+        properties = await get_sheet_by_title(service, service.spreadsheet_id, "Report")
+        assert properties["gridProperties"]["rowCount"] == service.sheet("Report").row_count == 5
+        assert [row["name"] for row in response.data] == ["Alice", "Bob", "Carol", "Dan"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_operation_writes_nothing(self):
+        service = make_service()
+
+        with pytest.raises(Exception, match=r"Failed to apply batch operations.*Operation 1 \(insert_image\): missing image_url"):
+            await GoogleSheetDataTable().batch(service, service.uri(), [
+                {"op": "update_range", "data": [["a"]]},
+                {"op": "insert_image", "cell_address": "A1"},
+            ])
+
+        assert service.count("spreadsheets.batchUpdate") == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operation, error", [
+        ({"op": "delete_everything"}, "unknown op 'delete_everything'"),
+        ({"op": "append_rows", "worksheet": "Missing", "data": [["a"]]}, "worksheet 'Missing' not found"),
+        ({"op": "update_range", "range_address": "not a cell", "data": [["a"]]}, "invalid cell address"),
+        ({"op": "resize_sheet"}, "needs row_count and/or column_count"),
+    ])
+    async def test_validation_errors(self, operation, error):
+        service = make_service()
+
+        with pytest.raises(Exception, match=error):
+            await GoogleSheetDataTable().batch(service, service.uri(), [operation])
+
+        assert service.count("spreadsheets.batchUpdate") == 0
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for probe-based data boundary detection (no server required)
+
+get_last_row / get_last_column / get_used_range locate the data edge with a few
+batched windows instead of downloading the whole grid.
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    build_sheet_profile,
+    clear_metadata_cache,
+    get_last_column_with_data,
+    get_last_row_with_data,
+    get_used_range_info,
+    probe_data_bounds,
+    used_range_from_bounds,
+)
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_sheet(rows: int, width: int = 3, row_count: int = 100_000, **kwargs):
+    values = [[f"r{r}c{c}" for c in range(width)] for r in range(rows)]
+    return FakeSheetsService({"Data": values}, row_count=row_count, column_count=10, **kwargs)
+
+
+def grid_of(service):
+    return service.sheet().properties()["gridProperties"]
+
+
+class TestProbeDataBounds:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rows", [1, 15, 16, 17, 1000, 54_321, 100_000])
+    async def test_exact_on_contiguous_data(self, rows):
+        service = make_sheet(rows)
+
+        bounds = await probe_data_bounds(service, service.spreadsheet_id, "Data", grid_of(service))
+
+        assert bounds == (rows, 3)
+
+    @pytest.mark.asyncio
+    async def test_few_round_trips_and_small_payload(self):
+        service = make_sheet(54_321)
+
+        await probe_data_bounds(service, service.spreadsheet_id, "Data", grid_of(service))
+
+        assert service.count("values.get") == 0
+        assert service.count("values.batchGet") <= 6
+        # A full read would transfer 54321 * 3 cells
+        assert service.cells_transferred < 2_000
+
+    @pytest.mark.asyncio
+    async def test_gaps_and_whitespace(self):
+        service = make_sheet(5_000)
+        sheet = service.sheet()
+        # Whitespace-only cells do not count as data
+        for r in range(5_000, 5_050):
+            sheet.cells[(r, 0)] = "   "
+        # Isolated cells far below and to the right of the block do
+        sheet.cells[(77_776, 1)] = "straggler"
+        sheet.cells[(12, 8)] = "wide"
+
+        bounds = await probe_data_bounds(service, service.spreadsheet_id, "Data", grid_of(service))
+
+        assert bounds == (77_777, 9)
+
+    @pytest.mark.asyncio
+    async def test_empty_sheet(self):
+        service = FakeSheetsService({"Data": []}, row_count=50_000)
+
+        assert await probe_data_bounds(service, service.spreadsheet_id, "Data", grid_of(service)) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_grid_from_metadata_cache(self):
+        service = make_sheet(300)
+
+        assert await probe_data_bounds(service, service.spreadsheet_id, "Data") == (300, 3)
+        assert service.count("spreadsheets.get") == 1
+
+
+class TestBoundaryHelpers:
+
+    @pytest.mark.asyncio
+    async def test_last_row_of_single_column(self):
+        service = make_sheet(2_000)
+        service.sheet().cells[(9_999, 2)] = "only in C"
+
+        grid = grid_of(service)
+        assert await get_last_row_with_data(service, service.spreadsheet_id, "Data", "A", grid) == 2_000
+        assert await get_last_row_with_data(service, service.spreadsheet_id, "Data", "C", grid) == 10_000
+        assert await get_last_row_with_data(service, service.spreadsheet_id, "Data", None, grid) == 10_000
+
+    @pytest.mark.asyncio
+    async def test_used_range_and_last_column(self):
+        service = make_sheet(40_000, width=4)
+
+        grid = grid_of(service)
+        used = await get_used_range_info(service, service.spreadsheet_id, "Data", grid)
+        last_col = await get_last_column_with_data(service, service.spreadsheet_id, "Data", grid)
+
+        assert used == ("A1:D40000", 40_000, 4, "A1", "D40000")
+        assert last_col == ("D", 3)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("values", [[], [[], ["", "", "x"], ["", "y"]]])
+    async def test_profile_bounds_report_the_same_used_range(self, values):
+        service = FakeSheetsService({"Data": values})
+
+        profile = build_sheet_profile(values)
+        used = await get_used_range_info(service, service.spreadsheet_id, "Data", grid_of(service))
+
+        assert used_range_from_bounds(profile["last_row"], profile["last_column"]) == used
+
+    @pytest.mark.asyncio
+    async def test_empty_sheet_results(self):
+        service = FakeSheetsService({"Data": []})
+
+        grid = grid_of(service)
+        assert await get_used_range_info(service, service.spreadsheet_id, "Data", grid) == ("A1:A1", 0, 0, "A1", "A1")
+        assert await get_last_column_with_data(service, service.spreadsheet_id, "Data", grid) == ("A", 0)
+        assert await get_last_row_with_data(service, service.spreadsheet_id, "Data", None, grid) == 0
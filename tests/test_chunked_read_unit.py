@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for chunked, concurrent whole-sheet reads in load_data_table (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    READ_CHUNK_BYTES,
+    clear_metadata_cache,
+    iter_sheet_value_chunks,
+    needs_chunked_read,
+    plan_row_chunks,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_rows(count: int, width: int = 4):
+    rows = [[f"col{c}" for c in range(width)]]
+    rows += [[f"r{r}c{c}" for c in range(width)] for r in range(1, count)]
+    return rows
+
+
+class TestPlanRowChunks:
+
+    def test_windows_cover_rows_in_order(self):
+        windows = plan_row_chunks(1, 10, 4, byte_budget=4 * 4 * 32)
+
+        assert windows == [(1, 4), (5, 8), (9, 10)]
+
+    def test_small_grids_are_read_at_once(self):
+        assert not needs_chunked_read({"rowCount": 1000, "columnCount": 26})
+        assert needs_chunked_read({"rowCount": 100_000, "columnCount": 26})
+        assert not needs_chunked_read(None)
+
+
+class TestIterSheetValueChunks:
+
+    @pytest.mark.asyncio
+    async def test_stitches_gaps_across_chunk_boundaries(self):
+        rows = [["a"], ["b"]] + [[] for _ in range(7)] + [["c"], [], ["d"]]
+        service = FakeSheetsService({"S": rows}, row_count=20, column_count=1)
+        grid = {"rowCount": 20, "columnCount": 1}
+
+        chunks = [
+            chunk async for chunk in iter_sheet_value_chunks(
+                service, service.spreadsheet_id, "S", grid, byte_budget=3 * 32, max_concurrency=2
+            )
+        ]
+
+        assert [row for chunk in chunks for row in chunk] == rows
+        assert service.count("values.batchGet") == 6  # 2 bound probes, 4 windows up to row 12
+
+    @pytest.mark.asyncio
+    async def test_sparse_grid_reads_only_the_data_rows(self):
+        service = FakeSheetsService({"S": [["a", "b"], ["1", "2"]]}, row_count=500_000, column_count=26)
+        grid = {"rowCount": 500_000, "columnCount": 26}
+
+        chunks = [
+            chunk async for chunk in iter_sheet_value_chunks(service, service.spreadsheet_id, "S", grid)
+        ]
+
+        assert chunks == [[["a", "b"], ["1", "2"]]]
+        assert service.count("values.batchGet") == 3  # 2 bound probes, 1 window
+
+    @pytest.mark.asyncio
+    async def test_rows_beyond_a_stale_grid_are_read(self):
+        rows = make_rows(12, width=1)
+        service = FakeSheetsService({"S": rows}, row_count=20, column_count=1)
+        stale_grid = {"rowCount": 8, "columnCount": 1}
+
+        chunks = [
+            chunk async for chunk in iter_sheet_value_chunks(
+                service, service.spreadsheet_id, "S", stale_grid, byte_budget=3 * 32, max_concurrency=2
+            )
+        ]
+
+        assert [row for chunk in chunks for row in chunk] == rows
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        service = FakeSheetsService({"S": make_rows(50, width=1)}, row_count=64, column_count=1, latency=0.02)
+        grid = {"rowCount": 64, "columnCount": 1}
+
+        chunks = [
+            chunk async for chunk in iter_sheet_value_chunks(
+                service, service.spreadsheet_id, "S", grid, byte_budget=4 * 32, max_concurrency=3
+            )
+        ]
+
+        assert sum(len(chunk) for chunk in chunks) == 50
+        assert service.max_in_flight == 3
+
+
+class TestChunkedLoadDataTable:
+
+    @pytest.mark.asyncio
+    async def test_matches_single_read(self):
+        values = make_rows(30_000)
+        values[12_345] = []  # Empty row in the middle of a chunk
+        values[10_082] = ["", "", "x"]  # Short row near a chunk boundary
+        chunked = FakeSheetsService({"Big": values}, row_count=40_000, column_count=26)
+        single = FakeSheetsService({"Big": values}, row_count=40_000, column_count=26)
+
+        table = GoogleSheetDataTable()
+        response = await table.load_data_table(chunked, chunked.uri())
+        expected = await table.load_data_table(single, single.uri(), range_address="A:Z", auto_detect_header_row=True)
+
+        assert chunked.count("values.get") == 0
+        assert chunked.count("values.batchGet") > 1
+        assert response.data == expected.data
+        assert response.shape == "(29999,4)"
+        assert response.source_info["used_range"] == "A1:D30000"
+        assert response.data[10_081] == {"col0": "", "col1": "", "col2": "x", "col3": ""}
+
+    @pytest.mark.asyncio
+    async def test_small_sheet_keeps_single_request(self):
+        service = FakeSheetsService({"S": make_rows(10)})
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert len(response.data) == 9
+        assert service.count("values.get") == 1
+        assert service.count("values.batchGet") == 0
+
+    @pytest.mark.asyncio
+    async def test_header_detection_matches_single_read(self):
+        values = [["", "", "Merged Title", "", ""], ["Name", "Age", "City", "Status", "Score"]]
+        values += [["n", str(i), "c", "s", "1"] for i in range(3)]
+        grid_rows = READ_CHUNK_BYTES // (26 * 32) * 3
+        chunked = FakeSheetsService({"S": values}, row_count=grid_rows, column_count=26)
+        single = FakeSheetsService({"S": values}, row_count=grid_rows, column_count=26)
+
+        table = GoogleSheetDataTable()
+        response = await table.load_data_table(chunked, chunked.uri())
+        expected = await table.load_data_table(single, single.uri(), range_address="A:Z")
+
+        assert chunked.count("values.batchGet") == 3
+        assert response.data == expected.data
+        assert response.data[0] == {"Name": "n", "Age": "0", "City": "c", "Status": "s", "Score": "1"}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for byte-budgeted, concurrent multi-range writes in update_range (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    WRITE_CONCURRENCY,
+    clear_metadata_cache,
+    estimate_row_bytes,
+    plan_write_requests,
+    write_value_ranges,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_rows(count: int, width: int = 10):
+    return [[f"row{r:05d}-col{c}" for c in range(width)] for r in range(count)]
+
+
+class TestPlanWriteRequests:
+
+    def test_slices_cover_block_in_order(self):
+        rows = make_rows(100, width=3)
+        row_bytes = estimate_row_bytes(rows[0])
+
+        requests = plan_write_requests("S", [(5, 2, rows)], request_bytes=row_bytes * 30, range_bytes=row_bytes * 10)
+
+        assert [len(data) for data in requests] == [3, 3, 3, 1]
+        value_ranges = [value_range for data in requests for value_range in data]
+        assert value_ranges[0]["range"] == "'S'!C5:E14"
+        assert value_ranges[-1]["range"] == "'S'!C95:E104"
+        assert [row for value_range in value_ranges for row in value_range["values"]] == rows
+
+    def test_oversized_row_is_kept_whole(self):
+        rows = [["x" * 100], ["y"]]
+
+        requests = plan_write_requests("S", [(1, 0, rows)], request_bytes=50, range_bytes=50)
+
+        assert [[value_range["range"] for value_range in data] for data in requests] == [["'S'!A1:A1"], ["'S'!A2:A2"]]
+
+    def test_blocks_keep_their_own_origin(self):
+        requests = plan_write_requests("Bob's", [(1, 0, [["a"]]), (7, 3, [["b", "c"]]), (9, 0, [])])
+
+        assert requests == [[
+            {"range": "'Bob''s'!A1:A1", "values": [["a"]]},
+            {"range": "'Bob''s'!D7:E7", "values": [["b", "c"]]}
+        ]]
+
+
+class TestWriteValueRanges:
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently_with_a_limit(self):
+        service = FakeSheetsService({"S": [["old"]]}, latency=0.02)
+        rows = make_rows(40, width=2)
+        requests = plan_write_requests("S", [(1, 0, rows)], request_bytes=1, range_bytes=1)
+
+        updated = await write_value_ranges(service, service.spreadsheet_id, requests, max_concurrency=3)
+
+        assert updated == 80
+        assert service.count("values.batchUpdate") == 40
+        assert service.max_in_flight == 3
+        assert service.grid("S") == rows
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised(self):
+        service = FakeSheetsService({"S": []}, row_count=10, column_count=2)
+        requests = plan_write_requests("S", [(1, 0, make_rows(20, width=2))], request_bytes=1, range_bytes=1)
+
+        with pytest.raises(Exception, match="exceeds grid limits"):
+            await write_value_ranges(service, service.spreadsheet_id, requests)
+
+
+class TestUpdateRangeLargeWrites:
+
+    @pytest.mark.asyncio
+    async def test_large_write_uses_concurrent_batch_updates(self):
+        rows = make_rows(30_000)
+        service = FakeSheetsService({"S": [["h"]]}, row_count=30_000, column_count=10, latency=0.01)
+
+        response = await GoogleSheetDataTable().update_range(service, service.uri(), rows, range_address="A1")
+
+        assert service.count("values.update") == 0
+        calls = [kwargs for name, kwargs in service.calls if name == "values.batchUpdate"]
+        assert len(calls) > 1
+        assert all(len(kwargs["body"]["data"]) > 1 for kwargs in calls[:-1])
+        payload_sizes = [
+            sum(estimate_row_bytes(row) for value_range in kwargs["body"]["data"] for row in value_range["values"])
+            for kwargs in calls
+        ]
+        assert max(payload_sizes) <= 2 * 1024 * 1024
+        assert 1 < service.max_in_flight <= WRITE_CONCURRENCY
+        assert response.updated_cells == 300_000
+        assert response.range == "A1:J30000"
+        assert service.grid("S") == rows
+
+    @pytest.mark.asyncio
+    async def test_small_write_is_one_update(self):
+        rows = make_rows(3000, width=2)
+        service = FakeSheetsService({"S": []}, row_count=3000, column_count=2)
+
+        await GoogleSheetDataTable().update_range(service, service.uri(), rows, range_address="A1")
+
+        assert service.count("values.update") == 1
+        assert service.count("values.batchUpdate") == 0
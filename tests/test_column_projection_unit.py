@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for column projection in load_data_table / read_sheet (no server required)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_header_cache,
+    clear_metadata_cache,
+    group_column_runs,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+WIDTH = 80
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    clear_header_cache()
+    yield
+    clear_metadata_cache()
+    clear_header_cache()
+
+
+def make_service(values=None):
+    if values is None:
+        values = [[f"h{c}" for c in range(WIDTH)]]
+        values += [[f"r{r}c{c}" for c in range(WIDTH)] for r in range(1, 201)]
+    service = FakeSheetsService({"Wide": values})
+    service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+    return service
+
+
+def batch_ranges(service):
+    return [kwargs["ranges"] for name, kwargs in service.calls if name == "values.batchGet"]
+
+
+class TestGroupColumnRuns:
+
+    def test_runs(self):
+        assert group_column_runs([4, 0, 1, 2, 7, 2]) == [(0, 2), (4, 4), (7, 7)]
+        assert group_column_runs([]) == []
+
+
+class TestColumnProjection:
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_requested_columns(self):
+        service = make_service()
+
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), columns=["h40", "h5", "h6"]
+        )
+
+        assert response.shape == "(200,3)"
+        assert response.data[0] == {"h40": "r1c40", "h5": "r1c5", "h6": "r1c6"}
+        assert list(response.data[0]) == ["h40", "h5", "h6"]
+        assert batch_ranges(service) == [["'Wide'!F2:G1000", "'Wide'!AO2:AO1000"]]
+        # Header sample (5 rows x 80) plus 200 rows x 3 - not 201 x 80
+        assert service.cells_transferred == 5 * WIDTH + 200 * 3
+
+    @pytest.mark.asyncio
+    async def test_header_row_is_cached(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+
+        await table.load_data_table(service, service.uri(), columns=["h1"])
+        await table.load_data_table(service, service.uri(), columns=["h2"])
+
+        assert service.count("values.get") == 1
+        assert service.count("values.batchGet") == 2
+
+    @pytest.mark.asyncio
+    async def test_full_read_warms_header_cache(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+
+        await table.load_data_table(service, service.uri())
+        await table.load_data_table(service, service.uri(), columns=["h1"])
+
+        assert service.count("values.get") == 1
+
+    @pytest.mark.asyncio
+    async def test_write_drops_cached_header(self):
+        service = make_service([["a", "b"], ["1", "2"]])
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri(), columns=["a"])
+
+        await table.update_range(service, service.uri(), [["x", "y"]], "A1")
+        response = await table.load_data_table(service, service.uri(), columns=["y"])
+
+        assert response.data == [{"y": "2"}]
+
+    @pytest.mark.asyncio
+    async def test_detected_header_below_title_row(self):
+        service = make_service([
+            ["", "", "Merged Title", "", ""],
+            ["Name", "Age", "City", "Status", "Score"],
+            ["Alice", "30", "NYC", "Active", "95"],
+            ["Bob", "", "", "", "80"],
+        ])
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), columns=["Score", "Age"])
+
+        assert response.data == [{"Score": "95", "Age": "30"}, {"Score": "80", "Age": ""}]
+        assert batch_ranges(service) == [["'Wide'!B3:B1000", "'Wide'!E3:E1000"]]
+
+    @pytest.mark.asyncio
+    async def test_unknown_column(self):
+        service = make_service([["a", "b"], ["1", "2"]])
+
+        with pytest.raises(ValueError, match="Columns not found in header row: \\['zzz'\\]"):
+            await GoogleSheetDataTable().load_data_table(service, service.uri(), columns=["zzz"])
+
+    @pytest.mark.asyncio
+    async def test_not_combined_with_range_address(self):
+        service = make_service([["a"]])
+
+        with pytest.raises(ValueError, match="range_address"):
+            await GoogleSheetDataTable().load_data_table(service, service.uri(), "A1:B2", columns=["a"])
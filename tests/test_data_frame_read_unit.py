@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Polars / Arrow result path used by direct_call (no server required)
+"""
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from datatable_tools.tool_registry import get_tool_method
+from tests.fake_sheets import FakeSheetsService
+
+
+VALUES = [["sku", "qty", "price"], ["a-1", 3, 1.5], ["b-2", 12, ""], ["c-3", "", 4]]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({"Stock": VALUES})
+
+
+class TestLoadDataFrame:
+
+    @pytest.mark.asyncio
+    async def test_polars_keeps_types_with_unformatted_values(self, service):
+        df = await GoogleSheetDataTable().load_data_frame(
+            service, service.uri(), value_render_option="UNFORMATTED_VALUE"
+        )
+
+        assert isinstance(df, pl.DataFrame)
+        assert df.columns == ["sku", "qty", "price"]
+        assert df["qty"].to_list() == [3, 12, None]
+        assert df["qty"].dtype == pl.Int64
+        assert df["price"].to_list() == [1.5, None, 4.0]
+        assert df["sku"].to_list() == ["a-1", "b-2", "c-3"]
+
+    @pytest.mark.asyncio
+    async def test_formatted_values_stay_text(self, service):
+        df = await GoogleSheetDataTable().load_data_frame(service, service.uri())
+
+        assert df["qty"].to_list() == ["3", "12", ""]
+
+    @pytest.mark.asyncio
+    async def test_arrow_and_ipc(self, service):
+        table = GoogleSheetDataTable()
+
+        arrow = await table.load_data_frame(service, service.uri(), output="arrow")
+        ipc = await table.load_data_frame(service, service.uri(), output="arrow_ipc")
+
+        assert isinstance(arrow, pa.Table)
+        assert arrow.num_rows == 3
+        assert pl.read_ipc_stream(ipc).equals(pl.from_arrow(arrow))
+
+    @pytest.mark.asyncio
+    async def test_read_options_apply(self, service):
+        df = await GoogleSheetDataTable().load_data_frame(
+            service, service.uri(), columns=["sku"],
+            filters=[{"column": "qty", "op": "range", "min": 10}]
+        )
+
+        assert df.to_dicts() == [{"sku": "b-2"}]
+
+    @pytest.mark.asyncio
+    async def test_registered_for_direct_call(self, service):
+        method = get_tool_method("google_sheets__load_data_frame")
+
+        df = await method(service=service, uri=service.uri())
+
+        assert df.shape == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_unknown_output(self, service):
+        with pytest.raises(ValueError, match="Unknown output"):
+            await GoogleSheetDataTable().load_data_frame(service, service.uri(), output="pandas")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for diff-based update_range writes (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache, plan_changed_blocks
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def written_ranges(service):
+    return [
+        value_range["range"]
+        for name, kwargs in service.calls if name == "values.batchUpdate"
+        for value_range in kwargs["body"]["data"]
+    ]
+
+
+class TestPlanChangedBlocks:
+
+    def test_rows_with_same_column_run_merge(self):
+        values = [["a", "1", "2"], ["b", "3", "4"], ["c", "5", "x"]]
+        current = [["a", "0", "0"], ["b", "0", "0"], ["c", "5", "0"]]
+
+        blocks, skipped = plan_changed_blocks(values, current)
+
+        assert blocks == [(0, 1, [["1", "2"], ["3", "4"]]), (2, 2, [["x"]])]
+        assert skipped == 4
+
+    def test_entered_and_display_values_count_as_unchanged(self):
+        values = [["30", "=A1*2", "50%", "TRUE", ""]]
+        current = [[30, "=A1*2", 0.5, True]]
+        formatted = [["30", "60", "50%", "TRUE"]]
+
+        assert plan_changed_blocks(values, current, formatted) == ([], 5)
+        # Without display values (RAW writes) only the entered value counts
+        assert plan_changed_blocks(values, current) == ([(0, 2, [["50%", "TRUE"]])], 3)
+
+    def test_display_text_does_not_match_a_formula(self):
+        blocks, _ = plan_changed_blocks([["=1+1"]], [[2]], [["=1+1"]])
+
+        assert blocks == [(0, 0, [["=1+1"]])]
+
+    def test_display_text_of_a_formula_is_not_its_value(self):
+        blocks, skipped = plan_changed_blocks([["10"]], [["=SUM(C:C)"]], [["10"]])
+
+        assert (blocks, skipped) == ([(0, 0, [["10"]])], 0)
+
+    def test_rounded_display_text_is_not_the_value(self):
+        values = [["0.12", "1,000", "$3.50", "7%"]]
+        current = [[0.123456, 1000, 3.5, 0.07]]
+        formatted = [["0.12", "1,000", "$3.50", "7%"]]
+
+        assert plan_changed_blocks(values, current, formatted) == ([(0, 0, [["0.12"]])], 3)
+
+    def test_rows_past_current_contents(self):
+        blocks, skipped = plan_changed_blocks([["a"], ["", "b"]], [["a"]])
+
+        assert blocks == [(1, 1, [["b"]])]
+        assert skipped == 2
+
+
+class TestDiffUpdateRange:
+
+    @pytest.mark.asyncio
+    async def test_only_changed_cells_are_written(self):
+        grid = [["name", "age", "city"], ["Alice", "30", "Paris"], ["Bob", "25", "Rome"], ["Carol", "41", "Oslo"]]
+        service = FakeSheetsService({"Sheet1": grid})
+        new = [["name", "age", "city"], ["Alice", "31", "Paris"], ["Bob", "26", "Rome"], ["Carol", "41", "Bergen"]]
+
+        response = await GoogleSheetDataTable().update_range(
+            service, service.uri(), new, range_address="A1", include_header=True, diff=True
+        )
+
+        assert service.count("values.update") == 0
+        assert service.count("values.batchUpdate") == 1
+        assert written_ranges(service) == ["'Sheet1'!B2:B3", "'Sheet1'!C4:C4"]
+        assert response.updated_cells == 3
+        assert response.skipped_cells == 9
+        assert "3 cells written, 9 unchanged cells skipped" in response.message
+        assert service.grid() == new
+
+    @pytest.mark.asyncio
+    async def test_formulas_and_rounded_numbers_are_overwritten(self):
+        service = FakeSheetsService(
+            {"Sheet1": [["=SUM(C:C)", 0.123456]]}, formatted={("Sheet1", 0, 0): "10", ("Sheet1", 0, 1): "0.12"}
+        )
+
+        response = await GoogleSheetDataTable().update_range(
+            service, service.uri(), [["10", "0.12"]], range_address="A1", diff=True
+        )
+
+        assert (response.updated_cells, response.skipped_cells) == (2, 0)
+        assert service.grid() == [["10", "0.12"]]
+
+    @pytest.mark.asyncio
+    async def test_window_is_offset_by_range_address(self):
+        service = FakeSheetsService({"Sheet1": [[], [], ["", "", "x", "y"], ["", "", "z", "w"]]})
+
+        response = await GoogleSheetDataTable().update_range(
+            service, service.uri(), [["x", "y"], ["z", "changed"]], range_address="C3", diff=True
+        )
+
+        reads = [kwargs["ranges"] for name, kwargs in service.calls if name == "spreadsheets.get" and "ranges" in kwargs]
+        assert reads == [["'Sheet1'!C3:D4"]]
+        assert written_ranges(service) == ["'Sheet1'!D4:D4"]
+        assert (response.updated_cells, response.skipped_cells) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_data_writes_nothing(self):
+        grid = [["name", "age"], ["Alice", "30"]]
+        service = FakeSheetsService({"Sheet1": grid})
+        version = service.version
+
+        response = await GoogleSheetDataTable().update_range(
+            service, service.uri(), grid, range_address="A1", include_header=True, diff=True
+        )
+
+        assert service.count("values.batchUpdate") == 0
+        assert service.version == version
+        assert (response.updated_cells, response.skipped_cells) == (0, 4)
+
+    @pytest.mark.asyncio
+    async def test_default_mode_reports_no_skipped_cells(self):
+        service = FakeSheetsService({"Sheet1": [["a"]]})
+
+        response = await GoogleSheetDataTable().update_range(service, service.uri(), [["a"]], range_address="A1")
+
+        assert service.count("values.update") == 1
+        assert response.skipped_cells is None
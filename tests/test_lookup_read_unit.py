@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-pass FORMULA + FORMATTED_VALUE read behind update_by_lookup (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    DUAL_RENDER_FIELDS,
+    clear_metadata_cache,
+    get_formula_and_formatted_values,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+VALUES = [
+    ["username", "score", "double"],
+    ["@alice", 10, "=B2*2"],
+    ["@bob", 5, "=B3*2"],
+]
+FORMATTED = {("Users", 1, 2): "20", ("Users", 2, 2): "10"}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({"Users": VALUES}, formatted=FORMATTED)
+
+
+class TestFormulaAndFormattedValues:
+
+    @pytest.mark.asyncio
+    async def test_one_masked_grid_read(self, service):
+        formulas, formatted = await get_formula_and_formatted_values(
+            service, service.spreadsheet_id, "'Users'!A1:Z1000"
+        )
+
+        assert formulas == [["username", "score", "double"], ["@alice", 10, "=B2*2"], ["@bob", 5, "=B3*2"]]
+        assert formatted == [["username", "score", "double"], ["@alice", "10", "20"], ["@bob", "5", "10"]]
+        (name, kwargs), = service.calls
+        assert name == "spreadsheets.get"
+        assert kwargs["includeGridData"] is True
+        assert kwargs["fields"] == DUAL_RENDER_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_grids_stay_aligned_when_one_rendering_is_empty(self):
+        service = FakeSheetsService({"S": [["a", '=""'], [], ["b"]]}, formatted={("S", 0, 1): ""})
+
+        formulas, formatted = await get_formula_and_formatted_values(service, service.spreadsheet_id, "'S'!A1:B5")
+
+        assert formulas == [["a", '=""'], [], ["b"]]
+        assert formatted == [["a", ""], [], ["b"]]
+
+
+class TestUpdateByLookupRead:
+
+    @pytest.mark.asyncio
+    async def test_update_reads_once_and_keeps_formulas(self, service):
+        response = await GoogleSheetDataTable().update_by_lookup(
+            service, service.uri(), [{"username": "@bob", "score": 7, "double": "x"}], on="username"
+        )
+
+        assert response.success
+        # Only update_range's own header check reads plain values
+        assert not any(kwargs["valueRenderOption"] == "FORMULA" for name, kwargs in service.calls if name == "values.get")
+        grid_reads = [kwargs for name, kwargs in service.calls if name == "spreadsheets.get" and kwargs.get("includeGridData")]
+        assert len(grid_reads) == 1
+        assert service.grid("Users")[2] == ["@bob", 7, "=B3*2"]
+        assert service.grid("Users")[1] == ["@alice", "10", "=B2*2"]
+
+    @pytest.mark.asyncio
+    async def test_large_grids_fall_back_to_concurrent_value_reads(self):
+        service = FakeSheetsService({"Users": VALUES}, formatted=FORMATTED, row_count=200000, column_count=26)
+
+        response = await GoogleSheetDataTable().update_by_lookup(
+            service, service.uri(), [{"username": "@alice", "score": 1}], on="username"
+        )
+
+        assert response.success
+        assert not any(kwargs.get("includeGridData") for name, kwargs in service.calls if name == "spreadsheets.get")
+        assert service.grid("Users")[1] == ["@alice", 1, "=B2*2"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("row_count", [1000, 200000])
+    async def test_lookup_tables_are_plain_lists(self, row_count):
+        service = FakeSheetsService({"Users": VALUES}, formatted=FORMATTED, row_count=row_count, column_count=26)
+        table = GoogleSheetDataTable()
+        context = await table._resolve_sheet_context(service, service.uri(), None)
+
+        formula_data, formatted_data, _ = await table._load_lookup_tables(service, service.uri(), context)
+
+        # update_by_lookup indexes rows per formula cell; a records view would rebuild each dict
+        assert type(formula_data) is list and type(formatted_data) is list
+        assert formula_data[1] == {"username": "@bob", "score": 5, "double": "=B3*2"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("row_count", [1000, 200000])
+    async def test_empty_worksheet_gets_headers_and_rows(self, row_count):
+        service = FakeSheetsService({"Users": []}, row_count=row_count, column_count=26)
+
+        response = await GoogleSheetDataTable().update_by_lookup(
+            service, service.uri(), [{"username": "@carol", "score": 3}], on="username"
+        )
+
+        assert response.success
+        assert "completely empty" in response.message
+        assert service.grid("Users") == [["username", "score"], ["@carol", 3]]
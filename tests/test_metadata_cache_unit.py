@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the spreadsheet metadata cache (no server required)
+
+Verifies that get_sheet_by_gid / parse_range_address share one cached
+spreadsheets().get() per credential + spreadsheet, and that our own
+structural writes keep the cache consistent.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from datatable_tools import google_sheets_helpers
+from datatable_tools.google_sheets_helpers import (
+    get_sheet_by_gid,
+    parse_range_address,
+    get_spreadsheet_metadata,
+    invalidate_spreadsheet_metadata,
+    update_cached_sheet_properties,
+    clear_metadata_cache,
+    get_metadata_cache_stats,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+METADATA = {
+    'properties': {'title': 'Test Spreadsheet'},
+    'sheets': [
+        {'properties': {'sheetId': 0, 'title': 'Sheet1', 'gridProperties': {'rowCount': 1000, 'columnCount': 26}}},
+        {'properties': {'sheetId': 456, 'title': 'Data', 'gridProperties': {'rowCount': 10, 'columnCount': 5}}},
+    ]
+}
+
+
+def make_service(refresh_token="refresh-token-a", metadata=None):
+    """Create a mock Sheets service with identifiable credentials"""
+    service = MagicMock()
+    service._http.credentials.refresh_token = refresh_token
+    service.spreadsheets.return_value.get.return_value.execute.return_value = metadata or METADATA
+    return service
+
+
+def metadata_fetches(service) -> int:
+    return service.spreadsheets.return_value.get.call_count
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+class TestMetadataCache:
+    """Unit tests for metadata caching"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_fetch_once(self):
+        service = make_service()
+
+        props = await get_sheet_by_gid(service, "ss1", "456")
+        assert props['title'] == 'Data'
+        props = await get_sheet_by_gid(service, "ss1", None)
+        assert props['title'] == 'Sheet1'
+        range_name, title, sheet_id = await parse_range_address(service, "ss1", "Data!A1:B2", "Sheet1", 0)
+
+        assert (range_name, title, sheet_id) == ("'Data'!A1:B2", "Data", 456)
+        assert metadata_fetches(service) == 1
+        assert get_metadata_cache_stats()['valid_entries'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_credentials(self):
+        service_a = make_service("token-a")
+        service_b = make_service("token-b")
+
+        await get_sheet_by_gid(service_a, "ss1", None)
+        await get_sheet_by_gid(service_b, "ss1", None)
+
+        assert metadata_fetches(service_a) == 1
+        assert metadata_fetches(service_b) == 1
+        # Raw tokens never appear in cache keys
+        assert not any("token-a" in key for key in google_sheets_helpers._metadata_cache)
+
+    @pytest.mark.asyncio
+    async def test_service_without_credentials_is_not_cached(self):
+        service = MagicMock()
+        service.spreadsheets.return_value.get.return_value.execute.return_value = METADATA
+
+        await get_sheet_by_gid(service, "ss1", None)
+        await get_sheet_by_gid(service, "ss1", None)
+
+        assert metadata_fetches(service) == 2
+        assert get_metadata_cache_stats()['total_entries'] == 0
+
+    def test_client_id_is_not_a_user_identity(self):
+        shared_app = SimpleNamespace(refresh_token=None, client_id="app-client-id")
+        service = SimpleNamespace(_http=SimpleNamespace(credentials=shared_app))
+
+        assert google_sheets_helpers._get_credential_key(service) is None
+
+    def test_service_accounts_are_keyed_by_account_and_subject(self):
+        def key(**credentials):
+            service = SimpleNamespace(_http=SimpleNamespace(credentials=SimpleNamespace(**credentials)))
+            return google_sheets_helpers._get_credential_key(service)
+
+        robot = key(service_account_email="robot@p.iam.gserviceaccount.com", _subject=None)
+        assert robot is not None
+        assert robot == key(service_account_email="robot@p.iam.gserviceaccount.com", _subject=None)
+        assert robot != key(service_account_email="other@p.iam.gserviceaccount.com", _subject=None)
+        assert robot != key(service_account_email="robot@p.iam.gserviceaccount.com", _subject="alice@example.com")
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, monkeypatch):
+        from datetime import timedelta
+        service = make_service()
+        monkeypatch.setattr(google_sheets_helpers, "_metadata_cache_ttl", timedelta(seconds=-1))
+
+        await get_sheet_by_gid(service, "ss1", None)
+        await get_sheet_by_gid(service, "ss1", None)
+
+        assert metadata_fetches(service) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_gid_refreshes_stale_cache_once(self):
+        service = make_service()
+        await get_sheet_by_gid(service, "ss1", None)
+
+        props = await get_sheet_by_gid(service, "ss1", "999")
+
+        assert props['title'] == 'Sheet1'  # Fallback to first sheet
+        assert metadata_fetches(service) == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_and_invalidate(self):
+        service = make_service(metadata={
+            'sheets': [{'properties': {'sheetId': 7, 'title': 'S', 'gridProperties': {'rowCount': 5, 'columnCount': 2}}}]
+        })
+        await get_spreadsheet_metadata(service, "ss1")
+
+        assert update_cached_sheet_properties(service, "ss1", 7, row_count=500, column_count=12)
+        props = await get_sheet_by_gid(service, "ss1", "7")
+        assert props['gridProperties'] == {'rowCount': 500, 'columnCount': 12}
+        assert metadata_fetches(service) == 1
+
+        assert invalidate_spreadsheet_metadata(service, "ss1")
+        await get_sheet_by_gid(service, "ss1", "7")
+        assert metadata_fetches(service) == 2
+
+
+class TestWriteAwareInvalidation:
+    """Structural writes made through GoogleSheetDataTable keep the cache consistent"""
+
+    @pytest.mark.asyncio
+    async def test_append_rows_uses_cached_grid_and_patches_resize(self):
+        service = FakeSheetsService({"Sheet1": [["a", "b"], ["1", "2"], ["3", "4"]]}, row_count=3, column_count=2)
+        service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="refresh-token-a"))
+
+        await GoogleSheetDataTable().append_rows(service, service.uri(), [["5", "6", "7"]])
+
+        assert service.count("spreadsheets.get") == 1
+        props = await get_sheet_by_gid(service, service.spreadsheet_id, None)
+        # Column resize issued up front, row growth reported by values.append
+        assert props['gridProperties'] == {'rowCount': 4, 'columnCount': 13}
+        assert service.count("spreadsheets.get") == 1
+
+    @pytest.mark.asyncio
+    async def test_write_new_worksheet_invalidates_after_add_sheet(self):
+        service = make_service()
+        service.spreadsheets.return_value.batchUpdate.return_value.execute.return_value = {
+            'replies': [{'addSheet': {'properties': {'sheetId': 789, 'title': 'New'}}}]
+        }
+
+        await GoogleSheetDataTable().write_new_worksheet(
+            service, "https://docs.google.com/spreadsheets/d/ss1/edit", [['h'], ['v']], "New"
+        )
+
+        assert get_metadata_cache_stats()['total_entries'] == 0
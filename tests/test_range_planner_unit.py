@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for grid-aware read ranges (no server required)
+
+Full-width reads use the bare sheet name or row-only notation (always the current grid,
+however wide), column windows are bounded by the worksheet's gridProperties instead of a
+fixed A:ZZ.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_metadata_cache,
+    column_index_to_letter,
+    get_last_column_with_data,
+    get_used_range_info,
+    plan_sheet_range,
+    quote_sheet_title,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def value_get_ranges(service):
+    return [kwargs["range"] for name, kwargs in service.calls if name == "values.get"]
+
+
+class TestPlanSheetRange:
+
+    def test_whole_sheet_is_never_bounded_by_cached_grid(self):
+        assert plan_sheet_range("Sheet1", {"rowCount": 1000, "columnCount": 26}) == "'Sheet1'"
+
+    def test_row_windows_are_full_width(self):
+        grid = {"rowCount": 4, "columnCount": 3}
+        assert plan_sheet_range("S", grid, end_row=6) == "'S'!1:6"
+        assert plan_sheet_range("S", grid, start_row=2) == "'S'!2:10000000"
+
+    def test_wider_than_zz(self):
+        assert plan_sheet_range("Wide", {"rowCount": 50, "columnCount": 1000}, start_col=1, end_col=999) == "'Wide'!B1:ALL50"
+
+    def test_column_window_is_clipped_to_grid(self):
+        grid = {"rowCount": 4, "columnCount": 3}
+        assert plan_sheet_range("S", grid, start_row=2, end_row=3, start_col=1, end_col=9) == "'S'!B2:C3"
+
+    def test_unknown_grid_falls_back_to_api_bounds(self):
+        assert plan_sheet_range("Sheet1") == "'Sheet1'"
+        assert plan_sheet_range("Sheet1", end_row=6) == "'Sheet1'!1:6"
+        assert plan_sheet_range("Sheet1", start_col=2, end_col=3, end_row=9) == "'Sheet1'!C1:D9"
+
+    def test_titles_are_quoted_and_escaped(self):
+        assert quote_sheet_title("Bob's Sheet") == "'Bob''s Sheet'"
+        assert plan_sheet_range("Bob's Sheet") == "'Bob''s Sheet'"
+
+
+class TestGridAwareReads:
+
+    @pytest.mark.asyncio
+    async def test_load_data_table_reads_whole_sheet_by_name(self):
+        service = FakeSheetsService({"Sheet1": [["a", "b"], ["1", "2"]]}, row_count=20, column_count=5)
+
+        await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert value_get_ranges(service) == ["'Sheet1'"]
+
+    @pytest.mark.asyncio
+    async def test_rows_added_outside_the_server_are_read(self):
+        service = FakeSheetsService({"Sheet1": [["n"]] + [[str(i)] for i in range(998)]}, row_count=999, column_count=26)
+        # Credentials make the grid size cacheable
+        service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri())
+
+        # Another client grows the sheet while the grid size is still cached
+        sheet = service.sheet()
+        sheet.row_count = 1049
+        for r in range(999, 1049):
+            sheet.cells[(r, 0)] = str(r - 1)
+        response = await table.load_data_table(service, service.uri())
+
+        assert len(response.data) == 1048
+        assert response.data[-1] == {"n": "1047"}
+
+    @pytest.mark.asyncio
+    async def test_load_data_table_does_not_truncate_wide_sheets(self):
+        width = 800
+        service = FakeSheetsService(
+            {"Wide": [[f"col{i}" for i in range(width)], [str(i) for i in range(width)]]},
+            row_count=10, column_count=width
+        )
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert len(response.data[0]) == width
+        assert response.data[0]["col799"] == "799"
+        assert response.source_info["used_range"] == f"A1:{column_index_to_letter(width - 1)}2"
+
+    @pytest.mark.asyncio
+    async def test_preview_reads_only_requested_rows(self):
+        service = FakeSheetsService({"Sheet1": [["h"], ["=1+1"]]}, row_count=500, column_count=30)
+
+        await GoogleSheetDataTable().preview_worksheet_with_formulas(service, service.uri(), limit=3)
+
+        assert value_get_ranges(service) == ["'Sheet1'!1:4"]
+
+    @pytest.mark.asyncio
+    async def test_boundary_helpers_use_grid(self):
+        service = FakeSheetsService({"Sheet1": [["a", "", "c"], ["", "x"]]}, row_count=10, column_count=3)
+        grid = {"rowCount": 10, "columnCount": 3}
+
+        used = await get_used_range_info(service, service.spreadsheet_id, "Sheet1", grid_properties=grid)
+        last_col = await get_last_column_with_data(service, service.spreadsheet_id, "Sheet1", grid_properties=grid)
+
+        assert used == ("A1:C2", 2, 3, "A1", "C2")
+        assert last_col == ("C", 2)
+        # Probe windows are planned inside the grid, never past it
+        probed = [r for name, kwargs in service.calls if name == "values.batchGet" for r in kwargs["ranges"]]
+        assert probed and all(r.startswith("'Sheet1'!") for r in probed)
+        assert value_get_ranges(service) == []
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Drive-version-validated read cache (no server required)
+"""
+
+import threading
+from types import SimpleNamespace
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from datatable_tools import google_sheets_helpers
+from datatable_tools.google_sheets_helpers import (
+    DRIVE_SERVICE_MAX_ENTRIES,
+    _get_drive_service,
+    clear_metadata_cache,
+    clear_value_cache,
+    get_value_cache_stats,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+ROWS = [["name", "score"], ["alice", "1"], ["bob", "2"]]
+
+
+def failing_drive(service, monkeypatch, status, failures=1):
+    """Drive stand-in whose first `failures` version lookups raise HttpError(status)."""
+    drive = service.drive()
+    get = drive._get
+    remaining = [failures]
+
+    def flaky_get(**kwargs):
+        if remaining[0]:
+            remaining[0] -= 1
+            raise HttpError(httplib2.Response({"status": status}), b"{}")
+        return get(**kwargs)
+    drive._get = flaky_get
+
+    async def get_drive(service, key):
+        return drive
+    monkeypatch.setattr(google_sheets_helpers, "_get_drive_service", get_drive)
+
+
+async def fake_drive(service, key):
+    return service.drive()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(google_sheets_helpers, "_get_drive_service", fake_drive)
+    clear_metadata_cache()
+    clear_value_cache()
+    yield
+    clear_metadata_cache()
+    clear_value_cache()
+
+
+@pytest.fixture
+def service():
+    service = FakeSheetsService({"Sheet1": ROWS})
+    service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+    return service
+
+
+class TestReadCache:
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sheet_is_served_from_memory(self, service):
+        table = GoogleSheetDataTable()
+        before = get_value_cache_stats()
+
+        first = await table.load_data_table(service, service.uri())
+        second = await table.load_data_table(service, service.uri())
+        third = await table.load_data_table(service, service.uri())
+
+        assert service.count("values.get") == 2
+        assert service.count("files.get") == 2
+        assert first.data == second.data == third.data == [
+            {"name": "alice", "score": "1"}, {"name": "bob", "score": "2"}
+        ]
+        stats = get_value_cache_stats()
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_first_read_does_not_ask_drive(self, service):
+        await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert service.count("files.get") == 0
+        assert service.count("values.get") == 1
+
+    @pytest.mark.asyncio
+    async def test_external_edit_changes_version(self, service):
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri())
+        await table.load_data_table(service, service.uri())
+
+        service.sheet().cells[(1, 1)] = "99"
+        service.version += 1
+        response = await table.load_data_table(service, service.uri())
+
+        assert service.count("values.get") == 3
+        assert response.data[0]["score"] == "99"
+
+    @pytest.mark.asyncio
+    async def test_own_writes_invalidate(self, service):
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri())
+
+        await table.append_rows(service, service.uri(), [["carol", "3"]])
+        assert get_value_cache_stats()["entries"] == 0
+        response = await table.load_data_table(service, service.uri())
+
+        assert response.data[-1] == {"name": "carol", "score": "3"}
+
+    @pytest.mark.asyncio
+    async def test_render_options_are_cached_separately(self, service):
+        table = GoogleSheetDataTable()
+
+        await table.load_data_table(service, service.uri())
+        await table.read_worksheet_with_formulas(service, service.uri())
+
+        assert service.count("values.get") == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_rows_are_not_shared(self, service):
+        table = GoogleSheetDataTable()
+
+        before = get_value_cache_stats()
+        await table.load_data_table(service, service.uri(), response_format="rows")
+        second = await table.load_data_table(service, service.uri(), response_format="rows")
+        second.data[0][0] = "mutated"
+        third = await table.load_data_table(service, service.uri(), response_format="rows")
+
+        assert get_value_cache_stats()["hits"] - before["hits"] == 1
+        assert third.data[0][0] == "alice"
+
+    @pytest.mark.asyncio
+    async def test_without_credentials_nothing_is_cached(self):
+        service = FakeSheetsService({"Sheet1": ROWS})
+        table = GoogleSheetDataTable()
+
+        await table.load_data_table(service, service.uri())
+        await table.load_data_table(service, service.uri())
+
+        assert service.count("values.get") == 2
+        assert service.count("files.get") == 0
+
+    @pytest.mark.asyncio
+    async def test_drive_errors_fall_back_to_plain_reads(self, service, monkeypatch):
+        async def no_drive(service, key):
+            raise PermissionError("insufficient scopes")
+        monkeypatch.setattr(google_sheets_helpers, "_get_drive_service", no_drive)
+        table = GoogleSheetDataTable()
+
+        for _ in range(2):
+            await table.load_data_table(service, service.uri())
+        response = await table.load_data_table(service, service.uri())
+
+        assert service.count("values.get") == 3
+        assert len(response.data) == 2
+
+    @pytest.mark.asyncio
+    async def test_drive_access_denied_disables_the_cache(self, service, monkeypatch):
+        failing_drive(service, monkeypatch, 403)
+        table = GoogleSheetDataTable()
+
+        for _ in range(4):
+            await table.load_data_table(service, service.uri())
+
+        # The first read asks nobody, the second is denied, the rest skip Drive
+        assert service.count("files.get") == 1
+        assert service.count("values.get") == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [404, 429, 503])
+    async def test_transient_drive_errors_bypass_one_read(self, service, monkeypatch, status):
+        failing_drive(service, monkeypatch, status)
+        table = GoogleSheetDataTable()
+
+        for _ in range(4):
+            await table.load_data_table(service, service.uri())
+
+        # The first read only marks the range and the failed lookup skips the cache once;
+        # the next read fills it and the last one hits it
+        assert service.count("files.get") == 3
+        assert service.count("values.get") == 3
+
+
+class TestDriveServices:
+
+    @pytest.mark.asyncio
+    async def test_clients_are_built_off_the_loop_and_bounded(self, service, monkeypatch):
+        built = []
+
+        def fake_build(*args, **kwargs):
+            built.append(threading.current_thread())
+            return object()
+        monkeypatch.setattr("googleapiclient.discovery.build", fake_build)
+        monkeypatch.setattr(google_sheets_helpers, "_drive_services", {})
+
+        first = await _get_drive_service(service, "key-0")
+        for i in range(1, DRIVE_SERVICE_MAX_ENTRIES + 1):
+            assert await _get_drive_service(service, "key-0") is first
+            await _get_drive_service(service, f"key-{i}")
+
+        assert len(google_sheets_helpers._drive_services) == DRIVE_SERVICE_MAX_ENTRIES
+        assert "key-0" in google_sheets_helpers._drive_services  # Recently used, kept
+        assert "key-1" not in google_sheets_helpers._drive_services
+        assert threading.main_thread() not in built
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit tests for records / rows / columns response formats (no server required)
+"""
+
+import gc
+import json
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache
+from datatable_tools.models import ResponseFormat
+from datatable_tools.third_party.google_sheets.datatable import GC_PAUSE_MIN_ROWS, GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+VALUES = [["name", "total"], ["alice", "=1+1"], ["bob"]]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({"S": VALUES}, formatted={("S", 1, 1): "2"})
+
+
+class TestResponseFormat:
+
+    @pytest.mark.asyncio
+    async def test_records_is_default(self, service):
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert response.format == "records"
+        assert response.headers is None
+        assert response.data == [{"name": "alice", "total": "2"}, {"name": "bob", "total": ""}]
+
+    @pytest.mark.asyncio
+    async def test_rows(self, service):
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), response_format="rows")
+
+        assert response.headers == ["name", "total"]
+        assert response.data == [["alice", "2"], ["bob", ""]]
+        assert response.shape == "(2,2)"
+
+    @pytest.mark.asyncio
+    async def test_columns(self, service):
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), response_format="columns")
+
+        assert response.data == {"name": ["alice", "bob"], "total": ["2", ""]}
+        assert response.shape == "(2,2)"
+        assert response.message == "Loaded table from Google Sheets with 2 rows and 2 columns"
+
+    @pytest.mark.asyncio
+    async def test_columns_across_chunks_with_query(self):
+        values = [["id", "v"]] + [[str(i), str(i % 3)] for i in range(30_000)]
+        service = FakeSheetsService({"Big": values}, row_count=30_001, column_count=26)
+
+        table = GoogleSheetDataTable()
+        full = await table.load_data_table(service, service.uri(), response_format="columns")
+        filtered = await table.load_data_table(
+            service, service.uri(), response_format="columns",
+            filters=[{"column": "v", "op": "equals", "value": "0"}], limit=2
+        )
+
+        assert service.count("values.batchGet") > 2
+        assert len(full.data["id"]) == 30_000
+        assert full.data["id"][-1] == "29999"
+        assert filtered.data == {"id": ["0", "3"], "v": ["0", "0"]}
+
+    @pytest.mark.asyncio
+    async def test_projection(self, service):
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), columns=["total"], response_format="rows"
+        )
+
+        assert response.headers == ["total"]
+        assert response.data == [["2"]]
+
+    @pytest.mark.asyncio
+    async def test_formula_reads(self, service):
+        table = GoogleSheetDataTable()
+
+        formulas = await table.read_worksheet_with_formulas(service, service.uri(), response_format="columns")
+        preview = await table.preview_worksheet_with_formulas(service, service.uri(), limit=1, response_format="rows")
+
+        assert formulas.data == {"name": ["alice", "bob"], "total": ["=1+1", ""]}
+        assert preview.headers == ["name", "total"]
+        assert preview.data == [["alice", "=1+1"]]
+
+    @pytest.mark.asyncio
+    async def test_rows_is_smaller_on_the_wire(self):
+        values = [[f"a_rather_long_column_name_{c}" for c in range(20)]]
+        values += [[str(r * c) for c in range(20)] for r in range(50)]
+        service = FakeSheetsService({"S": values})
+        table = GoogleSheetDataTable()
+
+        records = await table.load_data_table(service, service.uri())
+        rows = await table.load_data_table(service, service.uri(), response_format="rows")
+
+        assert len(rows.model_dump_json()) * 3 < len(records.model_dump_json())
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("response_format", list(ResponseFormat))
+    async def test_json_round_trip(self, service, response_format):
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), response_format=response_format.value
+        )
+
+        payload = json.loads(response.model_dump_json())
+
+        assert payload["format"] == response_format.value
+        assert payload["data"] == {
+            ResponseFormat.RECORDS: [{"name": "alice", "total": "2"}, {"name": "bob", "total": ""}],
+            ResponseFormat.ROWS: [["alice", "2"], ["bob", ""]],
+            ResponseFormat.COLUMNS: {"name": ["alice", "bob"], "total": ["2", ""]},
+        }[response_format]
+
+    @pytest.mark.asyncio
+    async def test_unknown_format(self, service):
+        with pytest.raises(ValueError, match="is not a valid ResponseFormat"):
+            await GoogleSheetDataTable().load_data_table(service, service.uri(), response_format="csv")
+
+
+class TestRowNormalization:
+
+    def test_ragged_rows_in_every_format(self):
+        table = GoogleSheetDataTable()
+        headers = ["a", "b", "c"]
+        rows = [["1"], ["1", "2", "3", "extra"], [], ["1", "2", "3"]]
+
+        records = table._rows_to_table(headers, rows, ResponseFormat.RECORDS)
+        grid = table._rows_to_table(headers, rows, ResponseFormat.ROWS)
+        columns = table._rows_to_table(headers, rows, ResponseFormat.COLUMNS)
+
+        assert grid == [["1", "", ""], ["1", "2", "3"], ["", "", ""], ["1", "2", "3"]]
+        assert records == [dict(zip(headers, row)) for row in grid]
+        assert columns == {"a": ["1", "1", "", "1"], "b": ["", "2", "", "2"], "c": ["", "3", "", "3"]}
+        # Source rows are left untouched
+        assert rows[0] == ["1"] and len(rows[1]) == 4
+
+    def test_no_rows(self):
+        table = GoogleSheetDataTable()
+
+        assert table._rows_to_table(["a"], [], ResponseFormat.COLUMNS) == {"a": []}
+        assert table._rows_to_table([], [["x"]], ResponseFormat.RECORDS) == []
+
+    def test_gc_is_restored_after_large_tables(self):
+        rows = [["x"]] * (GC_PAUSE_MIN_ROWS + 1)
+
+        GoogleSheetDataTable()._rows_to_table(["a"], rows)
+
+        assert gc.isenabled()
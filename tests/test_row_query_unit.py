@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for server-side row filtering, ordering and paging (no server required)
+"""
+
+import re
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import RowQuery, clear_metadata_cache
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+HEADERS = ["name", "status", "total", "country"]
+ROWS = [
+    ["alice", "open", "1,200", "US"],
+    ["bob", "closed", "80", "CA"],
+    ["carol", "open", "", "DE"],
+    ["dan", "open", "15.5", "US"],
+    ["erin", "Open", "300", "CA"],
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def run(rows=ROWS, **kwargs):
+    query = RowQuery(**kwargs)
+    query.bind(HEADERS)
+    query.feed(rows)
+    selected, has_more = query.result()
+    return [row[0] for row in selected], has_more
+
+
+class TestRowQuery:
+
+    def test_equals_and_in(self):
+        assert run(filters=[{"column": "status", "op": "equals", "value": "open"}])[0] == ["alice", "carol", "dan"]
+        assert run(filters=[{"column": "country", "op": "in", "value": ["CA", "DE"]}])[0] == ["bob", "carol", "erin"]
+
+    def test_contains_is_case_insensitive(self):
+        assert run(filters=[{"column": "status", "op": "contains", "value": "OPE"}])[0] == ["alice", "carol", "dan", "erin"]
+
+    def test_numeric_range(self):
+        names, _ = run(filters=[{"column": "total", "op": "range", "min": 50, "max": 1200}])
+        assert names == ["alice", "bob", "erin"]
+
+    def test_filters_combine(self):
+        names, _ = run(filters=[
+            {"column": "status", "op": "equals", "value": "open"},
+            {"column": "country", "op": "equals", "value": "US"},
+        ])
+        assert names == ["alice", "dan"]
+
+    def test_order_by_keeps_blanks_last(self):
+        assert run(order_by="total")[0] == ["dan", "bob", "erin", "alice", "carol"]
+        assert run(order_by="-total")[0] == ["alice", "erin", "bob", "dan", "carol"]
+
+    def test_limit_offset_has_more(self):
+        assert run(limit=2) == (["alice", "bob"], True)
+        assert run(limit=2, offset=4) == (["erin"], False)
+        assert run(order_by="name", limit=5) == (["alice", "bob", "carol", "dan", "erin"], False)
+
+    def test_stops_collecting_without_order_by(self):
+        query = RowQuery(limit=1)
+        query.bind(HEADERS)
+        query.feed(ROWS)
+
+        assert query.done
+        assert len(query._rows) == 2
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="Unknown filter op"):
+            run(filters=[{"column": "name", "op": "regex", "value": "x"}])
+        with pytest.raises(ValueError, match="Columns not found"):
+            run(filters=[{"column": "nope", "value": "x"}])
+        with pytest.raises(ValueError, match="'in' needs a list"):
+            run(filters=[{"column": "name", "op": "in", "value": "x"}])
+        with pytest.raises(ValueError, match="limit"):
+            RowQuery(limit=-1)
+
+
+class TestLoadDataTableQuery:
+
+    @pytest.mark.asyncio
+    async def test_filters_before_materializing(self):
+        service = FakeSheetsService({"S": [HEADERS] + ROWS})
+
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(),
+            filters=[{"column": "status", "op": "equals", "value": "open"}],
+            order_by="-total", limit=2
+        )
+
+        assert [row["name"] for row in response.data] == ["alice", "dan"]
+        assert response.source_info["has_more"] is True
+        assert response.shape == "(2,4)"
+
+    @pytest.mark.asyncio
+    async def test_with_projection_fetches_filter_columns(self):
+        service = FakeSheetsService({"S": [HEADERS] + ROWS})
+
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), columns=["name"],
+            filters=[{"column": "country", "op": "equals", "value": "CA"}]
+        )
+
+        assert response.data == [{"name": "bob"}, {"name": "erin"}]
+        assert "has_more" not in response.source_info
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_chunked_read_early(self):
+        values = [["id"] + [f"c{i}" for i in range(25)]] + [[str(i)] + ["x"] * 25 for i in range(40_000)]
+        service = FakeSheetsService({"Big": values}, row_count=100_000, column_count=26)
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), limit=10, offset=5)
+
+        assert [row["id"] for row in response.data] == [str(i) for i in range(5, 15)]
+        assert response.source_info["has_more"] is True
+        # 40k rows are ~8 chunks; only the first window(s) had to be read
+        windows = [
+            kwargs for call, kwargs in service.calls
+            if call == "values.batchGet" and re.search(r"!\d+:\d+$", kwargs["ranges"][0])
+        ]
+        assert len(windows) <= 4
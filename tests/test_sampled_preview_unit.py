@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sampled previews across large sheets (no server required)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_metadata_cache,
+    clear_sheet_profile_cache,
+    plan_sample_windows,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+ROWS = 20000
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    clear_sheet_profile_cache()
+    yield
+    clear_metadata_cache()
+    clear_sheet_profile_cache()
+
+
+@pytest.fixture
+def service():
+    values = [["id", "double"]] + [[str(r), f"=A{r}*2"] for r in range(2, ROWS + 2)]
+    return FakeSheetsService({"Big": values}, row_count=ROWS + 1000, column_count=2)
+
+
+class TestPlanSampleWindows:
+
+    @pytest.mark.parametrize("mode", ["stratified", "random"])
+    def test_windows_are_sorted_disjoint_and_in_range(self, mode):
+        windows = plan_sample_windows(2, 200001, 23, mode=mode, seed=7)
+
+        assert sum(last - first + 1 for first, last in windows) == 23
+        assert all(2 <= first <= last <= 200001 for first, last in windows)
+        assert all(a[1] < b[0] for a, b in zip(windows, windows[1:]))
+
+    def test_stratified_covers_every_stratum(self):
+        windows = plan_sample_windows(1, 1000, 20, mode="stratified", window_rows=5, seed=0)
+
+        assert [first // 250 for first, _ in windows] == [0, 1, 2, 3]
+
+    def test_small_ranges_are_read_whole(self):
+        assert plan_sample_windows(2, 9, 20) == [(2, 9)]
+        assert plan_sample_windows(2, 1, 20) == []
+
+    def test_seed_makes_samples_reproducible(self):
+        assert plan_sample_windows(2, 50000, 10, seed=3) == plan_sample_windows(2, 50000, 10, seed=3)
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown sample mode"):
+            plan_sample_windows(2, 100, 5, mode="systematic")
+
+
+class TestSampledPreview:
+
+    @pytest.mark.asyncio
+    async def test_sample_spans_the_sheet_in_one_value_request(self, service):
+        response = await GoogleSheetDataTable().preview_worksheet_with_formulas(
+            service, service.uri(), limit=20, sample="stratified", seed=1
+        )
+
+        numbers = response.source_info["sample_row_numbers"]
+        assert len(response.data) == len(numbers) == 20
+        assert max(numbers) > ROWS * 3 // 4
+        # Every row is reported with its real sheet row number
+        assert all(row == {"id": str(n), "double": f"=A{n}*2"} for row, n in zip(response.data, numbers))
+        sample_reads = [kwargs for name, kwargs in service.calls if name == "values.batchGet" and kwargs.get("valueRenderOption") == "FORMULA"]
+        assert len(sample_reads) == 1
+        assert service.count("values.get") == 0
+
+    @pytest.mark.asyncio
+    async def test_transfer_stays_small(self, service):
+        await GoogleSheetDataTable().preview_worksheet_with_formulas(service, service.uri(), limit=20, sample="random")
+
+        assert service.cells_transferred < 1000
+
+    @pytest.mark.asyncio
+    async def test_uses_cached_profile_for_the_used_range(self, service):
+        service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+        table = GoogleSheetDataTable()
+        await table.sheet_profile(service, service.uri())
+        service.calls.clear()
+
+        response = await table.preview_worksheet_with_formulas(service, service.uri(), limit=5, sample="stratified")
+
+        assert [name for name, _ in service.calls] == ["values.batchGet"]
+        assert response.source_info["sample"] == "stratified"
+
+    @pytest.mark.asyncio
+    async def test_small_sheet_returns_all_rows(self):
+        service = FakeSheetsService({"S": [["a"], ["1"], ["2"]]})
+
+        response = await GoogleSheetDataTable().preview_worksheet_with_formulas(service, service.uri(), sample="random")
+
+        assert response.data == [{"a": "1"}, {"a": "2"}]
+        assert response.source_info["sample_row_numbers"] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode(self, service):
+        with pytest.raises(ValueError, match="Unknown sample mode"):
+            await GoogleSheetDataTable().preview_worksheet_with_formulas(service, service.uri(), sample="every_other")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-call SheetContext resolution (no server required)
+
+Uses the recording FakeSheetsService to verify that a tool call - including
+nested operations such as update_by_lookup -> grid read ->
+update_range -> append_rows - fetches spreadsheet metadata at most once.
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    METADATA_FIELDS,
+    SheetContext,
+    clear_metadata_cache,
+    parse_range_address,
+    resolve_sheet_context,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def metadata_gets(service):
+    return sum(1 for name, kwargs in service.calls if name == "spreadsheets.get" and kwargs.get("fields") == METADATA_FIELDS)
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({
+        "Users": [
+            ["username", "status", "score"],
+            ["@alice", "active", "10"],
+            ["@bob", "inactive", "5"],
+        ],
+        "Other": [["x"], ["1"]],
+    })
+
+
+class TestResolveSheetContext:
+
+    @pytest.mark.asyncio
+    async def test_resolves_with_field_mask(self, service):
+        ctx = await resolve_sheet_context(service, service.uri(gid=100))
+
+        assert isinstance(ctx, SheetContext)
+        assert ctx.title == "Other"
+        assert ctx.sheet_id == 100
+        assert ctx.spreadsheet_title == "Fake Spreadsheet"
+        assert ctx.grid_row_count == 1000
+        assert ctx.worksheet_url.endswith("#gid=100")
+        name, kwargs = service.calls[0]
+        assert name == "spreadsheets.get"
+        assert kwargs["fields"] == METADATA_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_matches_same_worksheet_only(self, service):
+        ctx = await resolve_sheet_context(service, service.uri())
+
+        assert ctx.matches(service.uri())
+        assert not ctx.matches(service.uri(gid=100))
+        assert not ctx.matches("https://docs.google.com/spreadsheets/d/another/edit")
+
+    @pytest.mark.asyncio
+    async def test_parse_range_address_uses_context(self, service):
+        ctx = await resolve_sheet_context(service, service.uri())
+
+        range_name, title, sheet_id = await parse_range_address(
+            service, service.spreadsheet_id, "Other!A1:B2", ctx.title, ctx.sheet_id,
+            sheet_context=ctx
+        )
+
+        assert (range_name, title, sheet_id) == ("'Other'!A1:B2", "Other", 100)
+        assert service.count("spreadsheets.get") == 1
+
+
+class TestOneMetadataFetchPerToolCall:
+
+    @pytest.mark.asyncio
+    async def test_load_data_table_with_sheet_range(self, service):
+        await GoogleSheetDataTable().load_data_table(service, service.uri(), range_address="Other!A:A")
+
+        assert service.count("spreadsheets.get") == 1
+
+    @pytest.mark.asyncio
+    async def test_update_range_with_sheet_range(self, service):
+        await GoogleSheetDataTable().update_range(service, service.uri(), [["y"], ["2"]], "Other!A1")
+
+        assert service.count("spreadsheets.get") == 1
+        assert service.grid("Other") == [["y"], ["2"]]
+
+    @pytest.mark.asyncio
+    async def test_update_by_lookup_with_unmatched_rows(self, service):
+        data = [
+            {"username": "@bob", "status": "active"},
+            {"username": "@carol", "status": "new", "score": "1"},
+        ]
+
+        response = await GoogleSheetDataTable().update_by_lookup(service, service.uri(), data, on="username")
+
+        assert response.success
+        # update_by_lookup -> FORMULA + FORMATTED_VALUE grid read -> update_range -> append_rows
+        assert metadata_gets(service) == 1
+        assert service.grid("Users")[2] == ["@bob", "active", "5"]
+
+    @pytest.mark.asyncio
+    async def test_update_by_lookup_on_header_only_sheet(self):
+        service = FakeSheetsService({"Users": [["username", "status"]]})
+
+        response = await GoogleSheetDataTable().update_by_lookup(
+            service, service.uri(), [{"username": "@new", "status": "x"}], on="username"
+        )
+
+        assert response.success
+        assert metadata_gets(service) == 1
+        assert service.grid("Users") == [["username", "status"], ["@new", "x"]]
+
+    @pytest.mark.asyncio
+    async def test_context_for_other_worksheet_is_not_reused(self, service):
+        ctx = await resolve_sheet_context(service, service.uri(gid=100))
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), sheet_context=ctx)
+
+        assert response.source_info["worksheet"] == "Users"
+        assert service.count("spreadsheets.get") == 2
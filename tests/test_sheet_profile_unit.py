@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sheet_profile (no server required)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    build_sheet_profile,
+    clear_metadata_cache,
+    clear_sheet_profile_cache,
+    get_cached_sheet_profile,
+    get_last_row_with_data,
+    profile_last_row,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+ROWS = [
+    ["Quarterly report"],
+    ["name", "qty", "price", "total"],
+    ["apple", "3", "1.5", "=B3*C3"],
+    ["pear", "  ", "2", "=B4*C4"],
+    ["", "", "", ""],
+    ["kiwi", "1", "", "=B6*C6"],
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    clear_sheet_profile_cache()
+    yield
+    clear_metadata_cache()
+    clear_sheet_profile_cache()
+
+
+@pytest.fixture
+def service():
+    service = FakeSheetsService({"Sales": ROWS})
+    service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+    return service
+
+
+class TestBuildSheetProfile:
+
+    def test_counts_and_boundaries(self):
+        profile = build_sheet_profile(ROWS)
+
+        assert profile["last_row"] == 6
+        assert profile["last_column"] == 4
+        assert profile["header_row"] == 2
+        assert profile["headers"] == ["name", "qty", "price", "total"]
+        qty = profile["columns"][1]
+        assert (qty["column"], qty["header"], qty["non_empty_count"], qty["last_row"]) == ("B", "qty", 3, 6)
+        assert profile["columns"][3]["formula_count"] == 3
+        assert profile["columns"][2]["last_row"] == 4
+
+    def test_empty_sheet(self):
+        assert build_sheet_profile([]) == {
+            "last_row": 0, "last_column": 0, "header_row": 0, "headers": [], "columns": []
+        }
+
+    def test_last_row_by_column(self):
+        profile = build_sheet_profile(ROWS)
+
+        assert profile_last_row(profile) == 6
+        assert profile_last_row(profile, "C") == 4
+        assert profile_last_row(profile, "Z") == 0
+
+
+class TestSheetProfile:
+
+    @pytest.mark.asyncio
+    async def test_single_read(self, service):
+        response = await GoogleSheetDataTable().sheet_profile(service, service.uri())
+
+        assert response.success and not response.cached
+        assert response.used_range == "A1:D6"
+        assert (response.last_column, response.last_column_index) == ("D", 3)
+        assert response.columns[3].formula_count == 3
+        # Display values and formulas from one grid read
+        assert service.count("values.get") == 0
+        assert service.calls[-1][0] == "spreadsheets.get" and service.calls[-1][1]["includeGridData"]
+
+    @pytest.mark.asyncio
+    async def test_cached_until_write(self, service):
+        table = GoogleSheetDataTable()
+        await table.sheet_profile(service, service.uri())
+
+        reads = len(service.calls)
+        again = await table.sheet_profile(service, service.uri())
+        assert again.cached
+        assert len(service.calls) == reads
+        assert get_cached_sheet_profile(service, service.spreadsheet_id, 0)["last_row"] == 6
+
+        await table.update_range(service, service.uri(), [["melon", "9"]], "A7")
+
+        assert get_cached_sheet_profile(service, service.spreadsheet_id, 0) is None
+        fresh = await table.sheet_profile(service, service.uri())
+        assert not fresh.cached
+        assert fresh.last_row == 7
+
+    @pytest.mark.asyncio
+    async def test_force_refresh(self, service):
+        table = GoogleSheetDataTable()
+        await table.sheet_profile(service, service.uri())
+
+        response = await table.sheet_profile(service, service.uri(), force_refresh=True)
+
+        assert not response.cached
+        assert len([kwargs for name, kwargs in service.calls if kwargs.get("includeGridData")]) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("row_count", [1000, 200000])
+    async def test_blank_formulas_match_the_boundary_probe(self, row_count):
+        rows = [["name", "qty"], ["a", "1"], ["b", "2"]] + [["", '=IF(A{0}="","",1)'.format(r)] for r in range(4, 11)]
+        formatted = {("Sales", r, 1): "" for r in range(3, 10)}
+        service = FakeSheetsService({"Sales": rows}, formatted=formatted, row_count=row_count, column_count=26)
+        service._http = SimpleNamespace(credentials=SimpleNamespace(refresh_token="token-a"))
+        table = GoogleSheetDataTable()
+
+        probed = await get_last_row_with_data(service, service.spreadsheet_id, "Sales")
+        response = await table.sheet_profile(service, service.uri())
+
+        assert probed == response.last_row == 3
+        assert response.used_range == "A1:B3"
+        assert response.columns[1].formula_count == 7
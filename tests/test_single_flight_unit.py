@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-flight coalescing of values().get reads (no server required)
+"""
+
+import asyncio
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_metadata_cache,
+    get_inflight_read_stats,
+    get_sheet_values,
+    mark_spreadsheet_modified,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+ROWS = [["name", "score"], ["alice", "1"], ["bob", "2"]]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({"Sheet1": ROWS}, latency=0.05)
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_reads_share_one_request(self, service):
+        before = get_inflight_read_stats()["coalesced_requests"]
+
+        results = await asyncio.gather(*[
+            get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B", "FORMATTED_VALUE")
+            for _ in range(5)
+        ])
+
+        assert service.count("values.get") == 1
+        assert all(r["values"] == ROWS for r in results)
+        # Every caller gets its own rows
+        results[0]["values"][0].append("mutated")
+        assert results[1]["values"][0] == ["name", "score"]
+        assert get_inflight_read_stats()["coalesced_requests"] - before == 4
+        assert get_inflight_read_stats()["inflight_reads"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_render_options_are_not_coalesced(self, service):
+        await asyncio.gather(
+            get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B", "FORMATTED_VALUE"),
+            get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B", "FORMULA"),
+            get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:A", "FORMULA"),
+        )
+
+        assert service.count("values.get") == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_reads_are_not_cached(self, service):
+        await get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B")
+        await get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B")
+
+        assert service.count("values.get") == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_after_a_write_do_not_join_earlier_reads(self, service):
+        first = asyncio.ensure_future(get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B"))
+        await asyncio.sleep(0.01)
+
+        mark_spreadsheet_modified(service, service.spreadsheet_id)
+        second = asyncio.ensure_future(get_sheet_values(service, service.spreadsheet_id, "'Sheet1'!A:B"))
+        await asyncio.gather(first, second)
+
+        assert service.count("values.get") == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self, service):
+        results = await asyncio.gather(
+            get_sheet_values(service, service.spreadsheet_id, "'Missing'!A:B"),
+            get_sheet_values(service, service.spreadsheet_id, "'Missing'!A:B"),
+            return_exceptions=True
+        )
+
+        assert service.count("values.get") == 1
+        assert all(isinstance(r, Exception) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_load_data_table_calls(self, service):
+        table = GoogleSheetDataTable()
+
+        responses = await asyncio.gather(*[
+            table.load_data_table(service, service.uri()) for _ in range(3)
+        ])
+
+        assert service.count("values.get") == 1
+        assert all(r.data == [{"name": "alice", "score": "1"}, {"name": "bob", "score": "2"}] for r in responses)
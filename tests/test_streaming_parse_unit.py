@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Unit tests for incremental parsing of raw values response bodies (no server required)
+"""
+
+import json
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_metadata_cache,
+    iter_json_value_rows,
+    iter_sheet_value_chunks,
+    iter_streamed_rows,
+)
+from datatable_tools.third_party.google_sheets import datatable
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_values(count: int, width: int = 3):
+    rows = [[f"col{c}" for c in range(width)]]
+    rows += [[f"r{r}c{c}" for c in range(width)] for r in range(1, count)]
+    return rows
+
+
+class TestIterJsonValueRows:
+
+    def test_value_range_body(self):
+        body = json.dumps({"range": "'S'!A1:B3", "majorDimension": "ROWS", "values": [["a", "b"], [], [1, True]]})
+
+        assert list(iter_json_value_rows(body.encode())) == [["a", "b"], [], [1, True]]
+
+    def test_batch_get_body_is_pretty_printed(self):
+        body = json.dumps({
+            "spreadsheetId": "x",
+            "valueRanges": [{"range": "'S'!A1:B2", "values": [["a"], ["b", "c"]]}]
+        }, indent=2)
+
+        assert list(iter_json_value_rows(body)) == [["a"], ["b", "c"]]
+
+    def test_missing_values_yields_nothing(self):
+        assert list(iter_json_value_rows(b'{"range": "\'S\'!A1:B2", "majorDimension": "ROWS"}')) == []
+        assert list(iter_json_value_rows(b'{"values": []}')) == []
+
+    def test_cell_text_that_looks_like_the_key(self):
+        rows = [['"values": [', "x"], ["ünïcode ✓", "line\nbreak"]]
+        body = json.dumps({"range": '"values": [[', "values": rows})
+
+        assert list(iter_json_value_rows(body.encode())) == rows
+
+    def test_rows_are_decoded_lazily(self):
+        rows = iter_json_value_rows(b'{"values": [["a"], ["b"], not json]}')
+
+        assert next(rows) == ["a"]
+        assert next(rows) == ["b"]
+        with pytest.raises(json.JSONDecodeError):
+            next(rows)
+
+    @pytest.mark.parametrize("piece_bytes", [1, 7, 64])
+    def test_rows_split_across_decoded_pieces(self, piece_bytes):
+        rows = [["ünïcode ✓", "x" * 40], [], [1.5, None, True], ["]", ",", "\\"]]
+        body = json.dumps({"range": "'S'!A1:C4", "values": rows}).encode()
+
+        assert list(iter_json_value_rows(body, piece_bytes=piece_bytes)) == rows
+
+    @pytest.mark.asyncio
+    async def test_streamed_batches(self):
+        body = json.dumps({"values": [[str(i)] for i in range(5)]}).encode()
+
+        batches = [batch async for batch in iter_streamed_rows(body, batch_rows=2)]
+
+        assert batches == [[["0"], ["1"]], [["2"], ["3"]], [["4"]]]
+
+
+class TestStreamedReads:
+
+    @pytest.mark.asyncio
+    async def test_single_read_matches_parsed_read(self):
+        values = make_values(6) + [[], ["", "late"]]
+        service = FakeSheetsService({"S": values})
+        table = GoogleSheetDataTable()
+
+        expected = await table.load_data_table(service, service.uri(), limit=100)
+        clear_metadata_cache()
+        streamed = await table.load_data_table(service, service.uri(), limit=100, stream=True)
+
+        assert streamed.data == expected.data
+        assert streamed.source_info["used_range"] == expected.source_info["used_range"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_read_skips_value_cache(self):
+        service = FakeSheetsService({"S": make_values(4)})
+        table = GoogleSheetDataTable()
+
+        await table.load_data_table(service, service.uri(), offset=1, stream=True)
+        await table.load_data_table(service, service.uri(), offset=1, stream=True)
+
+        assert service.count("values.get") == 2
+        assert service.count("files.get") == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_that_keep_every_row_are_not_streamed(self, monkeypatch):
+        streamed = []
+        raw_request = datatable.raw_request
+        monkeypatch.setattr(datatable, "raw_request", lambda request: streamed.append(request) or raw_request(request))
+        service = FakeSheetsService({"S": make_values(4)})
+        table = GoogleSheetDataTable()
+
+        response = await table.load_data_table(service, service.uri(), stream=True)
+        assert len(response.data) == 3
+        assert streamed == []
+
+        response = await table.load_data_table(service, service.uri(), limit=2, stream=True)
+        assert len(response.data) == 2
+        assert len(streamed) == 1
+
+    @pytest.mark.asyncio
+    async def test_chunked_windows_keep_blank_rows(self):
+        values = make_values(5) + [[]] * 7 + [["x", "y"]] + [[]] * 9 + [["z"]]
+        grid = {"rowCount": 60, "columnCount": 3}
+        service = FakeSheetsService({"S": values}, row_count=60, column_count=3)
+        budget = 4 * 3 * 32  # 4-row windows
+
+        async def read(stream):
+            chunks = iter_sheet_value_chunks(
+                service, service.spreadsheet_id, "S", grid, byte_budget=budget, stream=stream
+            )
+            return [rows async for rows in chunks]
+
+        parsed = await read(False)
+        streamed = await read(True)
+
+        assert [row for rows in streamed for row in rows] == [row for rows in parsed for row in rows]
+        assert [row for rows in streamed for row in rows] == values
+
+    @pytest.mark.asyncio
+    async def test_filters_and_limit_apply_to_streamed_rows(self):
+        values = make_values(3000)
+        service = FakeSheetsService({"S": values})
+
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), stream=True,
+            filters=[{"column": "col1", "op": "contains", "value": "r2999"}]
+        )
+
+        assert response.data == [{"col0": "r2999c0", "col1": "r2999c1", "col2": "r2999c2"}]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the lazy TableRecords container used for records responses (no server required)
+"""
+
+import json
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import clear_metadata_cache, process_data_input
+from datatable_tools.models import TableRecords, TableResponse
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+@pytest.fixture
+def records():
+    return TableRecords(["name", "age"], [["Alice", "30"], ["Bob"], ["Carol", "41", "extra"]])
+
+
+class TestTableRecords:
+
+    def test_behaves_like_a_list_of_dicts(self, records):
+        expected = [
+            {"name": "Alice", "age": "30"},
+            {"name": "Bob", "age": ""},
+            {"name": "Carol", "age": "41"},
+        ]
+
+        assert len(records) == 3
+        assert records[1] == expected[1]
+        assert records[-1] == expected[-1]
+        assert records[:2] == expected[:2]
+        assert list(records) == expected
+        assert records == expected
+        assert records != expected[:2]
+        # Accessing a record does not touch the stored rows
+        records[1]["age"] = "99"
+        assert records.rows[1] == ["Bob"]
+
+    def test_response_keeps_the_container_and_serializes_records(self, records):
+        response = TableResponse(success=True, data=records, message="ok")
+
+        assert response.data is records
+        assert json.loads(response.model_dump_json())["data"] == records.to_list()
+        assert response.model_dump()["data"] == records.to_list()
+
+    def test_process_data_input_accepts_records(self, records):
+        headers, rows = process_data_input(records)
+
+        assert headers == ["name", "age"]
+        assert rows == [["Alice", "30"], ["Bob", ""], ["Carol", "41"]]
+
+    @pytest.mark.asyncio
+    async def test_load_data_table_returns_records_view(self):
+        service = FakeSheetsService({"S": [["name", "age"], ["Alice", "30"], ["Bob"]]})
+
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri())
+
+        assert isinstance(response.data, TableRecords)
+        assert response.data == [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": ""}]
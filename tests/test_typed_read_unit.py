@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for typed reads: UNFORMATTED_VALUE cells with per-column dtype inference (no server required)
+"""
+
+import json
+from datetime import date, datetime, time
+
+import polars as pl
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    apply_column_types,
+    clear_header_cache,
+    clear_metadata_cache,
+    infer_column_dtype,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+VALUES = [
+    ["sku", "qty", "price", "active", "shipped", "at", "note"],
+    ["a-1", 3, 1.5, True, 45322, 45322.5, ""],
+    ["b-2", 12, "", False, 45323, 45323.25, ""],
+    ["c-3", "", 4, True, "", "", ""],
+]
+FORMATTED = {
+    ("Stock", 1, 4): "1/31/2024", ("Stock", 2, 4): "2/1/2024",
+    ("Stock", 1, 5): "2024-01-31 12:00:00", ("Stock", 2, 5): "2024-02-01 06:00:00",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    clear_header_cache()
+    yield
+    clear_metadata_cache()
+    clear_header_cache()
+
+
+@pytest.fixture
+def service():
+    return FakeSheetsService({"Stock": VALUES}, formatted=FORMATTED)
+
+
+class TestInferColumnDtype:
+
+    @pytest.mark.parametrize("values, sample, dtype", [
+        ([1, 2, ""], [], "integer"),
+        ([1, 2.5], [], "number"),
+        ([True, "", False], [], "boolean"),
+        ([1, "x"], [], "string"),
+        (["", ""], [], "null"),
+        ([45322, 45323], ["1/31/2024"], "date"),
+        ([45322.5], ["Jan 31, 2024 12:00"], "datetime"),
+        ([0.4375], ["10:30"], "time"),
+        ([1200, 15], ["$1,200.00"], "integer"),
+    ])
+    def test_dtypes(self, values, sample, dtype):
+        assert infer_column_dtype(values, sample) == dtype
+
+    def test_apply_column_types_pads_and_converts(self):
+        rows, schema = apply_column_types(["n", "d"], [[1], [2.0, 45322]], [["1", "1/31/2024"]])
+
+        assert schema == {"n": "integer", "d": "date"}
+        assert rows == [[1, None], [2, date(2024, 1, 31)]]
+
+
+class TestTypedRead:
+
+    @pytest.mark.asyncio
+    async def test_typed_records_and_schema(self, service):
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), typed=True)
+
+        assert response.source_info["schema"] == {
+            "sku": "string", "qty": "integer", "price": "number", "active": "boolean",
+            "shipped": "date", "at": "datetime", "note": "null",
+        }
+        assert response.data[0] == {
+            "sku": "a-1", "qty": 3, "price": 1.5, "active": True,
+            "shipped": date(2024, 1, 31), "at": datetime(2024, 1, 31, 12, 0), "note": None,
+        }
+        assert response.data[2]["qty"] is None
+        reads = [kwargs["valueRenderOption"] for name, kwargs in service.calls if name == "values.get"]
+        assert reads[0] == "UNFORMATTED_VALUE"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("range_address, sample_range", [
+        ("A1:G4", "'Stock'!A1:G4"),
+        ("A:G", "'Stock'!A1:G5"),
+        ("Stock!A1:G", "'Stock'!A1:G5"),
+    ])
+    async def test_explicit_range_has_the_same_schema(self, service, range_address, sample_range):
+        table = GoogleSheetDataTable()
+        whole = await table.load_data_table(service, service.uri(), typed=True)
+
+        ranged = await table.load_data_table(service, service.uri(), range_address=range_address, typed=True)
+
+        assert ranged.source_info["schema"] == whole.source_info["schema"]
+        assert ranged.data[0]["shipped"] == date(2024, 1, 31)
+        sample_reads = [kwargs["range"] for name, kwargs in service.calls
+                        if name == "values.get" and kwargs["valueRenderOption"] == "FORMATTED_VALUE"]
+        assert sample_reads[-1] == sample_range
+
+    @pytest.mark.asyncio
+    async def test_serializes_to_json_types(self, service):
+        response = await GoogleSheetDataTable().load_data_table(service, service.uri(), typed=True)
+
+        first = json.loads(response.model_dump_json())["data"][0]
+
+        assert first["qty"] == 3 and first["active"] is True
+        assert first["shipped"] == "2024-01-31"
+        assert first["at"] == "2024-01-31T12:00:00"
+
+    @pytest.mark.asyncio
+    async def test_typed_projection_with_query(self, service):
+        response = await GoogleSheetDataTable().load_data_table(
+            service, service.uri(), columns=["sku", "shipped"], order_by="-qty", typed=True,
+            response_format="rows"
+        )
+
+        assert response.data == [["b-2", date(2024, 2, 1)], ["a-1", date(2024, 1, 31)], ["c-3", None]]
+        assert response.source_info["schema"] == {"sku": "string", "shipped": "date"}
+
+    @pytest.mark.asyncio
+    async def test_unformatted_rows_do_not_replace_cached_header_rows(self, service):
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri(), typed=True)
+
+        response = await table.load_data_table(service, service.uri(), columns=["shipped"])
+
+        assert response.data[0] == {"shipped": "1/31/2024"}
+
+    @pytest.mark.asyncio
+    async def test_data_frame_follows_schema(self, service):
+        df = await GoogleSheetDataTable().load_data_frame(service, service.uri(), typed=True)
+
+        assert df.schema["qty"] == pl.Int64
+        assert df.schema["shipped"] == pl.Date
+        assert df.schema["at"] == pl.Datetime
+        assert df.schema["active"] == pl.Boolean
+        assert df["price"].to_list() == [1.5, None, 4.0]
+
+    def test_time_values(self):
+        rows, schema = apply_column_types(["t"], [[0.4375]], [["10:30"]])
+
+        assert rows == [[time(10, 30)]] and schema == {"t": "time"}
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for typed cell values in write payloads (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import (
+    clear_metadata_cache,
+    encode_cell_data,
+    encode_write_value,
+    plan_changed_blocks,
+)
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def sent_values(service, name):
+    return [kwargs["body"]["values"] for call, kwargs in service.calls if call == name]
+
+
+class TestEncodeWriteValue:
+
+    def test_numbers_and_booleans_stay_typed(self):
+        assert [encode_write_value(v) for v in (0, 1234567890123, 0.1, -2.5e-7, True, False)] == \
+            [0, 1234567890123, 0.1, -2.5e-7, True, False]
+
+    def test_other_values_are_text(self):
+        assert [encode_write_value(v) for v in (None, "", "30", "=A1*2", float("inf"))] == \
+            ["", "", "30", "=A1*2", "inf"]
+
+    def test_non_finite_numbers_are_not_number_values(self):
+        assert encode_cell_data(float("nan")) == {"userEnteredValue": {"stringValue": "nan"}}
+
+
+class TestTypedWrites:
+
+    @pytest.mark.asyncio
+    async def test_update_range_sends_native_types(self):
+        service = FakeSheetsService({"Sheet1": [["name", "score", "active"]]})
+
+        await GoogleSheetDataTable().update_range(
+            service, service.uri(), [["Alice", 91.25, True], ["=A2", None, "12"]], range_address="A2"
+        )
+
+        assert sent_values(service, "values.update") == [[["Alice", 91.25, True], ["=A2", "", "12"]]]
+        assert service.grid()[1:] == [["Alice", 91.25, True], ["=A2", "", "12"]]
+
+    @pytest.mark.asyncio
+    async def test_append_rows_sends_native_types(self):
+        service = FakeSheetsService({"Sheet1": [["name", "age"]]})
+
+        await GoogleSheetDataTable().append_rows(service, service.uri(), [{"name": "Bob", "age": 41}])
+
+        assert sent_values(service, "values.append") == [[["Bob", 41]]]
+
+    def test_diff_compares_typed_values_by_kind(self):
+        blocks, skipped = plan_changed_blocks([[30, True, 1, 2.5]], [[30, True, True, "2.5"]])
+
+        assert blocks == [(0, 2, [[1, 2.5]])]
+        assert skipped == 2
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the header-detection pre-read in update_range (no server required)
+"""
+
+import pytest
+
+from datatable_tools.google_sheets_helpers import HEADER_SAMPLE_ROWS, clear_metadata_cache
+from datatable_tools.third_party.google_sheets.datatable import GoogleSheetDataTable
+from tests.fake_sheets import FakeSheetsService
+
+
+LONG = "a long description that is well over fifty characters in total"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
+def make_service():
+    grid = [["name", "note"]] + [[f"user{i} {LONG}", LONG] for i in range(2000)]
+    service = FakeSheetsService({"Sheet1": grid}, row_count=5000, column_count=12)
+    # Cached per credential, like a real authorized service
+    service._http = type("Http", (), {"credentials": type("Creds", (), {"refresh_token": "token-a"})()})()
+    return service
+
+
+def value_reads(service):
+    return [kwargs["range"] for name, kwargs in service.calls if name == "values.get"]
+
+
+class TestHeaderProbe:
+
+    @pytest.mark.asyncio
+    async def test_reads_only_the_first_rows(self):
+        service = make_service()
+
+        response = await GoogleSheetDataTable().update_range(
+            service, service.uri(), [{"name": "x", "note": LONG}], range_address="A2", include_header=False
+        )
+
+        assert value_reads(service) == [f"'Sheet1'!1:{HEADER_SAMPLE_ROWS}"]
+        assert service.cells_transferred <= HEADER_SAMPLE_ROWS * 2
+        # Header detected in the sheet and in the data, so only the data row is written
+        assert response.shape == "(1,2)"
+
+    @pytest.mark.asyncio
+    async def test_skipped_when_headers_are_always_written(self):
+        service = make_service()
+
+        await GoogleSheetDataTable().update_range(
+            service, service.uri(), [["name", "note"], ["x", "y"]], range_address="A1", include_header=True
+        )
+
+        assert value_reads(service) == []
+        assert service.count("values.batchGet") == 0
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_header_rows(self):
+        service = make_service()
+        table = GoogleSheetDataTable()
+        await table.load_data_table(service, service.uri(), limit=1)
+        reads = len(value_reads(service))
+
+        await table.update_range(service, service.uri(), [["x", "y"]], range_address="A3", include_header=False)
+
+        assert len(value_reads(service)) == reads
+
+    @pytest.mark.asyncio
+    async def test_detection_uses_the_target_columns(self):
+        service = FakeSheetsService({"Sheet1": [
+            ["name", "note", "id", "title"],
+            [LONG, LONG, "1", "x"],
+        ]})
+        table = GoogleSheetDataTable()
+        data = [{"id": "2", "title": LONG}]
+
+        in_span = await table.update_range(service, service.uri(), data, range_address="A5:B5", include_header=False)
+        clear_metadata_cache()
+        outside_span = await table.update_range(service, service.uri(), data, range_address="C5:D5", include_header=False)
+
+        # Columns A:B look like header + long data; C:D and the whole width do not
+        assert in_span.shape == "(1,2)"
+        assert outside_span.shape == "(2,2)"